@@ -1,3 +1,6 @@
+from .client import FakeServerClient
+from .clock import ManualClock, AcceleratedClock
+from .faults import ConnectionReset, TruncatedBody, MalformedHeaders, SlowHeaders, StalledBody
 from .server import FakeServer, expect_that
 
 __version__ = "0.2.1"
@@ -0,0 +1,140 @@
+import json as json_lib
+import threading
+import time
+from typing import Iterator, Any
+
+import falcon
+
+from py_fake_server.config import ADMIN_PREFIX, register_stubs
+
+STREAM_WINDOW = 1.0
+
+
+def dumps(value: Any) -> str:
+    return json_lib.dumps(value, separators=(",", ":"))
+
+
+def load_json(request: falcon.Request) -> Any:
+    try:
+        return json_lib.loads(request.bounded_stream.read().decode("utf-8"))
+    except (UnicodeDecodeError, ValueError) as error:
+        raise falcon.HTTPBadRequest("Invalid JSON", str(error))
+
+
+class AdminResource:
+    def __init__(self, server):
+        self._server = server
+
+
+class Stubs(AdminResource):
+    def on_post(self, request: falcon.Request, response: falcon.Response):
+        stubs = load_json(request)
+        if not isinstance(stubs, list):
+            raise falcon.HTTPBadRequest("Invalid stubs", "Expected a list of stubs")
+
+        try:
+            self._server.add_endpoints(lambda staging: register_stubs(staging, stubs))
+        except (AttributeError, KeyError, TypeError, ValueError) as error:
+            raise falcon.HTTPBadRequest("Invalid stub", str(error))
+
+        response.status = falcon.HTTP_201
+        response.body = dumps({"registered": len(stubs)})
+
+    def on_delete(self, request: falcon.Request, response: falcon.Response):
+        self._server.clear()
+        response.status = falcon.HTTP_204
+
+
+class Requests(AdminResource):
+    def on_get(self, request: falcon.Request, response: falcon.Response):
+        since = request.get_param_as_int("since", min=0) or 0
+        limit = request.get_param_as_int("limit", min=1)
+        rows = self._server.requests_since(since, limit)
+        response.body = dumps({"requests": rows, "last": rows[-1][0] if rows else since})
+
+
+class RequestsStream(AdminResource):
+    def __init__(self, server, max_streams: int):
+        super().__init__(server)
+        self._slots = threading.BoundedSemaphore(max_streams)
+
+    def on_get(self, request: falcon.Request, response: falcon.Response):
+        since = request.get_param_as_int("since", min=0) or 0
+        timeout = min(float(request.get_param("timeout") or STREAM_WINDOW), STREAM_WINDOW)
+        if not self._slots.acquire(blocking=False):
+            raise falcon.HTTPServiceUnavailable("Too many request streams", "Retry later", retry_after=1)
+        response.content_type = "application/x-ndjson"
+        response.stream = StreamSlot(self._stream(since, time.monotonic() + timeout), self._slots)
+
+    def _stream(self, since: int, deadline: float) -> Iterator[bytes]:
+        while True:
+            rows = self._server.requests_since(since)
+            if rows:
+                since = rows[-1][0]
+                yield "".join(dumps(row) + "\n" for row in rows).encode("utf-8")
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not rows and not self._server.request_log.wait_for(since + 1, remaining):
+                return
+
+
+class StreamSlot:
+    def __init__(self, stream: Iterator[bytes], slots: threading.BoundedSemaphore):
+        self._stream = stream
+        self._slots = slots
+        self._lock = threading.Lock()
+        self._released = False
+
+    def __iter__(self) -> Iterator[bytes]:
+        return self._stream
+
+    def close(self):
+        self._stream.close()
+        with self._lock:
+            released, self._released = self._released, True
+        if not released:
+            self._slots.release()
+
+
+class Statistics(AdminResource):
+    def on_get(self, request: falcon.Request, response: falcon.Response):
+        statistic = self._server.was_requested(request.get_param("method", required=True),
+                                               request.get_param("url", required=True))
+        response.body = dumps({
+            "requested_times": statistic.requested_times,
+            "rejected_times": statistic.rejected_times,
+        })
+
+
+class Report(AdminResource):
+    def on_get(self, request: falcon.Request, response: falcon.Response):
+        response.body = dumps(self._server.report())
+
+
+class Profiler(AdminResource):
+    def on_post(self, request: falcon.Request, response: falcon.Response):
+        sample_every = request.get_param_as_int("sample_every", min=1) or 1
+        self._server.start_profiling(sample_every)
+        response.status = falcon.HTTP_201
+        response.body = dumps({"sample_every": sample_every})
+
+    def on_get(self, request: falcon.Request, response: falcon.Response):
+        self._collapsed(self._server.profiler, response)
+
+    def on_delete(self, request: falcon.Request, response: falcon.Response):
+        self._collapsed(self._server.stop_profiling(), response)
+
+    @staticmethod
+    def _collapsed(profiler, response: falcon.Response):
+        if profiler is None:
+            raise falcon.HTTPNotFound(description="Profiler was not started")
+        response.content_type = "text/plain"
+        response.body = profiler.collapsed()
+
+
+def add_admin_routes(server, app: falcon.API, max_streams: int):
+    app.add_route(ADMIN_PREFIX + "/stubs", Stubs(server))
+    app.add_route(ADMIN_PREFIX + "/requests", Requests(server))
+    app.add_route(ADMIN_PREFIX + "/requests/stream", RequestsStream(server, max_streams))
+    app.add_route(ADMIN_PREFIX + "/statistics", Statistics(server))
+    app.add_route(ADMIN_PREFIX + "/report", Report(server))
+    app.add_route(ADMIN_PREFIX + "/profiler", Profiler(server))
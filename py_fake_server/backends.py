@@ -0,0 +1,37 @@
+from abc import ABCMeta, abstractmethod
+from typing import Optional
+
+from py_fake_server.bodies import BodyStore
+from py_fake_server.history import BaseRequestHistory, RequestHistory
+
+
+class StatisticsBackend(metaclass=ABCMeta):
+    supports_snapshots: bool = False
+
+    @abstractmethod
+    def history(self, method: str, url: str) -> BaseRequestHistory:
+        pass
+
+    @abstractmethod
+    def clear(self):
+        pass
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class MemoryBackend(StatisticsBackend):
+    supports_snapshots = True
+
+    def __init__(self, body_store: Optional[BodyStore] = None):
+        self.body_store = body_store
+
+    def history(self, method: str, url: str) -> RequestHistory:
+        return RequestHistory(self.body_store)
+
+    def clear(self):
+        if self.body_store is not None:
+            self.body_store = self.body_store.empty()
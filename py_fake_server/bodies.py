@@ -0,0 +1,112 @@
+import threading
+import zlib
+from array import array
+from collections import OrderedDict
+from typing import Callable, Optional, Dict, List, Tuple
+
+COMPRESSIONS = ("zlib", "lzma")
+
+
+def body_digest(body: bytes) -> bytes:
+    from hashlib import blake2b
+
+    return blake2b(body, digest_size=16).digest()
+
+
+def compressor(compression: str) -> Tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]:
+    if compression == "lzma":
+        import lzma
+
+        return lzma.compress, lzma.decompress
+    return zlib.compress, zlib.decompress
+
+
+class BodyStore:
+    def __init__(self):
+        self._ends = array("Q")
+        self._arena = bytearray()
+        self._lock = threading.Lock()
+
+    def put(self, body: bytes) -> int:
+        with self._lock:
+            self._arena += body
+            self._ends.append(len(self._arena))
+            return len(self._ends) - 1
+
+    def get(self, key: int) -> bytes:
+        start = self._ends[key - 1] if key else 0
+        return bytes(self._arena[start:self._ends[key]])
+
+    def digest(self, key: int) -> Optional[bytes]:
+        return None
+
+    def clear(self):
+        self.__init__()
+
+    def empty(self) -> "BodyStore":
+        return BodyStore()
+
+
+class DeduplicatedBodyStore(BodyStore):
+    def __init__(self, compression: Optional[str] = None, hot_bodies: int = 1024):
+        if compression is not None and compression not in COMPRESSIONS:
+            raise AttributeError(f"Unknown compression '{compression}'")
+
+        super().__init__()
+        self.compression = compression
+        self._compress, self._decompress = compressor(compression) if compression is not None else (None, None)
+        self.hot_bodies = hot_bodies
+        self._keys: Dict[bytes, int] = {}
+        self._digests: List[bytes] = []
+        self._contents: List[bytes] = []
+        self._compressed = bytearray()
+        self._hot: "OrderedDict[int, None]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._contents)
+
+    def put(self, body: bytes) -> int:
+        digest = body_digest(body)
+        with self._lock:
+            key = self._keys.get(digest)
+            if key is None:
+                key = len(self._contents)
+                self._keys[digest] = key
+                self._digests.append(digest)
+                self._contents.append(body)
+                self._compressed.append(False)
+            elif self._compressed[key]:
+                self._contents[key] = body
+                self._compressed[key] = False
+            self._touch(key)
+        return key
+
+    def get(self, key: int) -> bytes:
+        with self._lock:
+            content = self._contents[key]
+            if self._compressed[key]:
+                content = self._decompress(content)
+                self._contents[key] = content
+                self._compressed[key] = False
+            self._touch(key)
+        return content
+
+    def digest(self, key: int) -> bytes:
+        return self._digests[key]
+
+    def clear(self):
+        self.__init__(self.compression, self.hot_bodies)
+
+    def empty(self) -> "DeduplicatedBodyStore":
+        return DeduplicatedBodyStore(self.compression, self.hot_bodies)
+
+    def _touch(self, key: int):
+        if self.compression is None:
+            return
+
+        self._hot[key] = None
+        self._hot.move_to_end(key)
+        while len(self._hot) > self.hot_bodies:
+            cold_key, _ = self._hot.popitem(last=False)
+            self._contents[cold_key] = self._compress(self._contents[cold_key])
+            self._compressed[cold_key] = True
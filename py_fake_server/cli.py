@@ -0,0 +1,92 @@
+import argparse
+import signal
+import sys
+import threading
+from typing import Optional, List, Dict, Any
+
+from py_fake_server.config import ConfigWatcher, load_config, register_stubs
+from py_fake_server.server import FakeServer
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="py-fake-server", description="Make fake servers with pleasure!")
+    commands = parser.add_subparsers(dest="command")
+    commands.required = True
+
+    serve = commands.add_parser("serve", help="run a fake server until it is interrupted")
+    serve.add_argument("--host", default="0.0.0.0")
+    serve.add_argument("--port", type=int, default=8081)
+    serve.add_argument("--config", help="JSON or YAML file with stubs, reloaded on change")
+    serve.add_argument("--workers", type=int, default=4, help="number of worker threads (default: 4)")
+    serve.add_argument("--reload-interval", type=float, default=1.0,
+                       help="seconds between config checks, 0 disables reloading (default: 1)")
+    serve.add_argument("--tls", action="store_true", help="serve HTTPS with a generated certificate")
+    serve.add_argument("--certfile")
+    serve.add_argument("--keyfile")
+    serve.add_argument("--http2", action="store_true", help="serve HTTP/2 (requires h2)")
+    return parser
+
+
+def apply_config(server: FakeServer, path: str, applied_unmatched: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    config = load_config(path)
+    unmatched = config.get("unmatched") or {}
+
+    def define(staging: FakeServer):
+        staging.unmatched(**unmatched)
+        register_stubs(staging, config.get("stubs", []))
+
+    server.replace_endpoints(define)
+    if unmatched != applied_unmatched:
+        server.unmatched(**unmatched)
+    return unmatched
+
+
+def reload_config(server: FakeServer, path: str,
+                  applied_unmatched: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+    try:
+        applied_unmatched = apply_config(server, path, applied_unmatched)
+    except Exception as error:
+        print(f"Config {path} was not reloaded: {error}", file=sys.stderr, flush=True)
+    else:
+        print(f"Config {path} reloaded", file=sys.stderr, flush=True)
+    return applied_unmatched
+
+
+def serve(arguments: argparse.Namespace) -> int:
+    server = FakeServer(host=arguments.host, port=arguments.port, tls=arguments.tls, certfile=arguments.certfile,
+                        keyfile=arguments.keyfile, http2=arguments.http2, admin=True, threads=arguments.workers)
+    stopped = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stopped.set())
+    server.start()
+    applied_unmatched = apply_config(server, arguments.config) if arguments.config else None
+
+    def reload():
+        nonlocal applied_unmatched
+        applied_unmatched = reload_config(server, arguments.config, applied_unmatched)
+
+    watcher = None
+    if arguments.config and arguments.reload_interval > 0:
+        watcher = ConfigWatcher(arguments.config, reload, arguments.reload_interval).start()
+
+    print(f"Serving on {server.base_uri}", file=sys.stderr, flush=True)
+    try:
+        while not stopped.wait(1):
+            pass
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if watcher is not None:
+            watcher.stop()
+        server.stop()
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    arguments = build_parser().parse_args(argv)
+    if arguments.command == "serve":
+        return serve(arguments)
+    return 2  # pragma: no cover
+
+
+if __name__ == "__main__":
+    sys.exit(main())
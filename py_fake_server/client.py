@@ -0,0 +1,73 @@
+import json as json_lib
+import time
+from typing import Optional, List, Dict, Any, Iterator, Tuple
+from urllib.parse import urlencode
+
+from py_fake_server.config import ADMIN_PREFIX
+
+
+class FakeServerClient:
+    def __init__(self, base_uri: str, timeout: float = 10.0):
+        self.base_uri = base_uri.rstrip("/")
+        self._timeout = timeout
+
+    def register_stubs(self, stubs: List[Dict[str, Any]]) -> int:
+        return self._call("POST", "/stubs", body=stubs)["registered"]
+
+    def clear(self):
+        self._call("DELETE", "/stubs")
+
+    def requests_since(self, sequence: int = 0, limit: Optional[int] = None) -> Tuple[List[list], int]:
+        params = {"since": sequence}
+        if limit is not None:
+            params["limit"] = limit
+        result = self._call("GET", "/requests", params)
+        return result["requests"], result["last"]
+
+    def stream_requests(self, since: int = 0, timeout: float = 30.0) -> Iterator[list]:
+        from urllib.request import Request, urlopen
+
+        idle_since = time.monotonic()
+        while True:
+            remaining = timeout - (time.monotonic() - idle_since)
+            if remaining <= 0:
+                return
+            request = Request(self._url("/requests/stream", {"since": since, "timeout": remaining}))
+            with urlopen(request, timeout=remaining + self._timeout) as response:
+                for line in response:
+                    row = json_lib.loads(line)
+                    since = row[0]
+                    idle_since = time.monotonic()
+                    yield row
+
+    def statistic(self, method: str, url: str) -> Dict[str, int]:
+        return self._call("GET", "/statistics", {"method": method, "url": url})
+
+    def report(self) -> Dict[str, Any]:
+        return self._call("GET", "/report")
+
+    def start_profiling(self, sample_every: int = 1):
+        self._call("POST", "/profiler", {"sample_every": sample_every})
+
+    def profile(self) -> str:
+        return self._send("GET", "/profiler").decode("utf-8")
+
+    def stop_profiling(self) -> str:
+        return self._send("DELETE", "/profiler").decode("utf-8")
+
+    def _url(self, path: str, params: Optional[Dict[str, Any]] = None) -> str:
+        url = self.base_uri + ADMIN_PREFIX + path
+        return f"{url}?{urlencode(params)}" if params else url
+
+    def _call(self, method: str, path: str, params: Optional[Dict[str, Any]] = None, body: Any = None) -> Any:
+        content = self._send(method, path, params, body)
+        return json_lib.loads(content) if content else None
+
+    def _send(self, method: str, path: str, params: Optional[Dict[str, Any]] = None, body: Any = None) -> bytes:
+        from urllib.request import Request, urlopen
+
+        data = json_lib.dumps(body, separators=(",", ":")).encode("utf-8") if body is not None else None
+        request = Request(self._url(path, params), data=data, method=method,
+                          headers={"Content-Type": "application/json"})
+        with urlopen(request, timeout=self._timeout) as response:
+            return response.read()
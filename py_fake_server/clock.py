@@ -0,0 +1,75 @@
+import threading
+import time
+from abc import ABCMeta, abstractmethod
+
+
+class Clock(metaclass=ABCMeta):
+    @abstractmethod
+    def now(self) -> float:
+        pass
+
+    @abstractmethod
+    def sleep(self, seconds: float):
+        pass
+
+
+class SystemClock(Clock):
+    def now(self) -> float:
+        return time.perf_counter()
+
+    def sleep(self, seconds: float):
+        time.sleep(seconds)
+
+
+class ManualClock(Clock):
+    def __init__(self, start: float = 0.0):
+        self._now = start
+        self._sleepers = 0
+        self._condition = threading.Condition()
+
+    @property
+    def sleepers(self) -> int:
+        return self._sleepers
+
+    def now(self) -> float:
+        return self._now
+
+    def advance(self, seconds: float) -> "ManualClock":
+        if seconds < 0:
+            raise AttributeError("Clock can't go backwards")
+        with self._condition:
+            self._now += seconds
+            self._condition.notify_all()
+        return self
+
+    def sleep(self, seconds: float):
+        with self._condition:
+            target = self._now + seconds
+            self._sleepers += 1
+            self._condition.notify_all()
+            try:
+                self._condition.wait_for(lambda: self._now >= target)
+            finally:
+                self._sleepers -= 1
+
+    def wait_for_sleepers(self, number: int, timeout: float = 5.0) -> bool:
+        with self._condition:
+            return self._condition.wait_for(lambda: self._sleepers >= number, timeout)
+
+
+class AcceleratedClock(Clock):
+    def __init__(self, speed: float, start: float = 0.0):
+        if speed <= 0:
+            raise AttributeError("Clock speed should be greater than 0")
+        self.speed = speed
+        self._start = start
+        self._started_at = time.perf_counter()
+
+    def now(self) -> float:
+        return self._start + (time.perf_counter() - self._started_at) * self.speed
+
+    def sleep(self, seconds: float):
+        time.sleep(seconds / self.speed)
+
+
+SYSTEM_CLOCK = SystemClock()
@@ -0,0 +1,78 @@
+import json as json_lib
+import os
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+ADMIN_PREFIX = "/__admin"
+RESPONSE_FIELDS = ("status", "body", "content_type", "headers", "cookies", "json", "template", "delay", "compress",
+                   "weight")
+
+
+def load_config(path: str) -> Dict[str, Any]:
+    with open(path, encoding="utf-8") as config_file:
+        content = config_file.read()
+
+    if path.endswith((".yaml", ".yml")):
+        try:
+            import yaml
+        except ImportError as error:
+            raise ImportError("YAML configs require PyYAML, install py_fake_server[yaml]") from error
+        config = yaml.safe_load(content)
+    else:
+        config = json_lib.loads(content)
+
+    if isinstance(config, list):
+        config = {"stubs": config}
+    if not isinstance(config, dict):
+        raise AttributeError(f"Config '{path}' should be a list of stubs or a mapping")
+    return config
+
+
+def register_stubs(server, stubs: List[Dict[str, Any]]):
+    for stub in stubs:
+        endpoint = server.on_(stub["method"], stub["url"])
+        if stub.get("selection") == "weighted":
+            endpoint.weighted(stub.get("seed"))
+        elif stub.get("selection") == "round_robin":
+            endpoint.round_robin()
+        for index, response_spec in enumerate(stub["responses"]):
+            if index:
+                endpoint.then()
+            fields = {name: response_spec[name] for name in RESPONSE_FIELDS if name in response_spec}
+            if isinstance(fields.get("compress"), list):
+                fields["compress"] = tuple(fields["compress"])
+            endpoint.response(**fields)
+            if response_spec.get("times"):
+                getattr(endpoint, f"_{int(response_spec['times'])}_times")()
+
+
+class ConfigWatcher:
+    def __init__(self, path: str, on_change: Callable[[], None], interval: float = 1.0):
+        self._path = path
+        self._on_change = on_change
+        self._interval = interval
+        self._stopped = threading.Event()
+        self._version = self._read_version()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self) -> "ConfigWatcher":
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stopped.set()
+        self._thread.join()
+
+    def _read_version(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(self._path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _run(self):
+        while not self._stopped.wait(self._interval):
+            version = self._read_version()
+            if version is not None and version != self._version:
+                self._version = version
+                self._on_change()
@@ -0,0 +1,55 @@
+import zlib
+from functools import lru_cache
+from typing import Optional, Tuple, Dict, Iterable
+
+ENCODINGS = ("gzip", "deflate")
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "gzip":
+        compressor = zlib.compressobj(9, zlib.DEFLATED, 31)
+        return compressor.compress(body) + compressor.flush()
+    if encoding == "deflate":
+        return zlib.compress(body, 9)
+    raise AttributeError(f"Unknown encoding '{encoding}'")
+
+
+def decompress(body: bytes, encoding: Optional[str]) -> bytes:
+    if not body or not encoding:
+        return body
+    encoding = encoding.strip().lower()
+    try:
+        if encoding in ("gzip", "x-gzip"):
+            return zlib.decompress(body, 47)
+        if encoding == "deflate":
+            try:
+                return zlib.decompress(body)
+            except zlib.error:
+                return zlib.decompress(body, -15)
+    except zlib.error:
+        return body
+    return body
+
+
+def precompress(body: bytes, encodings: Iterable[str]) -> Dict[str, bytes]:
+    return {encoding: compress(body, encoding) for encoding in encodings}
+
+
+@lru_cache(maxsize=256)
+def negotiate(accept_encoding: str, available: Tuple[str, ...]) -> Optional[str]:
+    best_encoding, best_quality = None, 0.0
+    for item in accept_encoding.lower().split(","):
+        name, _, params = item.partition(";")
+        name = name.strip()
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        candidates = available if name == "*" else (name,) if name in available else ()
+        for candidate in candidates:
+            if quality > best_quality:
+                best_encoding, best_quality = candidate, quality
+    return best_encoding
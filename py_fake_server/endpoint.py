@@ -1,12 +1,27 @@
+import random
 import re
-from typing import Optional, List, Dict
+import threading
+from typing import Optional, List, Dict, Tuple, Iterable, Union
 
+from py_fake_server.clock import Clock, SYSTEM_CLOCK
+from py_fake_server.faults import Fault
+from py_fake_server.limits import BaseLimit, RateLimit, ConcurrencyLimit
+from py_fake_server.matching import Condition, StubIndex
+from py_fake_server.request import Request
 from py_fake_server.response import Response
 from py_fake_server.route import Route
+from py_fake_server.scenario import Scenario
+from py_fake_server.selection import Selection, RoundRobinSelection, WeightedSelection
+from py_fake_server.snapshot import Freezable, Generations, GenerationalValue
 
 
-class Endpoint:
-    def __init__(self, route: Route):
+class Endpoint(Freezable):
+    def __init__(self, route: Route, parent: Optional["Endpoint"] = None, generations: Optional[Generations] = None,
+                 clock: Clock = SYSTEM_CLOCK):
+        self.route = route
+        self._parent = parent
+        self._generations = generations or Generations()
+        self._clock = clock
         self.method = route.method
         self.url = route.url
         self._recorded_responses: List[Response] = []
@@ -16,26 +31,172 @@ class Endpoint:
             body=f"Server has not responses for [{self.method.upper()}] {self.url}",
         )
         self._last_recorded_response_is_infinite = True
+        self._position = GenerationalValue(self._generations, 0)
+        self._cursor_lock = threading.Lock()
+        self._scenario: Optional[Scenario] = None
+        self._pending_state: Optional[str] = None
+        self._current_state: Optional[str] = None
+        self._transitions: Dict[str, Tuple[Response, Optional[str]]] = {}
+        self._stubs = StubIndex()
+        self._selection: Optional[Selection] = None
+        self._faults: List[Tuple[Fault, float, Optional[int], frozenset]] = []
+        self._state_faults: Dict[str, List[Tuple[Fault, float, Optional[int], frozenset]]] = {}
+        self._served_times = GenerationalValue(self._generations, 0)
+        self.limits: List[BaseLimit] = []
 
-    def pop_response(self) -> Response:
-        if not self._recorded_responses:
-            return self._error_response
+    @property
+    def all_limits(self) -> List[BaseLimit]:
+        if self._parent is not None and self._parent.limits:
+            return self._parent.limits + self.limits
+        return self.limits
 
-        if len(self._recorded_responses) == 1 and self._last_recorded_response_is_infinite:
-            return self._recorded_responses[0]
+    def responder(self, request: Request) -> "Endpoint":
+        if self._stubs:
+            stub = self._stubs.match(request)
+            if stub is not None:
+                return stub
+        return self
+
+    def freeze(self):
+        super().freeze()
+        for stub in self._stubs.stubs():
+            stub.freeze()
+
+    def respond(self, request: Request) -> Tuple[Response, Optional[Fault]]:
+        state, response = self._pop_response(request)
+        return response, self._pop_fault(state)
+
+    def pop_response(self, request: Optional[Request] = None) -> Response:
+        if request is not None:
+            return self.responder(request)._pop_response(request)[1]
+        return self._pop_response(request)[1]
+
+    def _pop_response(self, request: Optional[Request]) -> Tuple[Optional[str], Response]:
+        if self._transitions and request is not None:
+            transition = self._scenario.take_transition(self._scenario.client_key(request), self._transitions)
+            if transition is not None:
+                return transition
 
-        return self._recorded_responses.pop(0)
+        if self._selection is not None and self._selection.responses:
+            return None, self._selection.choose()
+
+        with self._cursor_lock:
+            position = self._position.get()
+            remaining_responses = len(self._recorded_responses) - position
+            if not remaining_responses:
+                return None, self._error_response
+
+            if remaining_responses == 1 and self._last_recorded_response_is_infinite:
+                return None, self._recorded_responses[position]
+
+            self._position.set(position + 1)
+            return None, self._recorded_responses[position]
 
     def response(self, status: int, body: Optional[str] = None, content_type: Optional[str] = None,
                  headers: Optional[Dict[str, str]] = None, cookies: Optional[Dict[str, str]] = None,
-                 json: Optional[Dict] = None) -> "Endpoint":
+                 json: Optional[Dict] = None, template: Optional[str] = None, delay: float = 0.0,
+                 compress: Union[bool, Tuple[str, ...]] = False, weight: float = 1.0) -> "Endpoint":
+        self._check_not_frozen()
+        if weight != 1.0 and (self._pending_state is not None or not isinstance(self._selection, WeightedSelection)):
+            raise AttributeError("'weight' is only supported for responses after 'weighted()'")
+
+        response = Response(status, body, content_type, headers, cookies, json, template, delay, compress)
+        self._current_state, self._pending_state = self._pending_state, None
+        if self._current_state is not None:
+            self._transitions[self._current_state] = (response, None)
+            return self
+
+        if self._selection is not None:
+            self._selection.add(response, weight)
+            return self
 
-        response = Response(status, body, content_type, headers, cookies, json)
         self._recorded_responses.append(response)
         self._last_recorded_response_is_infinite = True
 
         return self
 
+    def weighted(self, seed: Optional[int] = None) -> "Endpoint":
+        return self._select(WeightedSelection(seed, self._generations), "weighted")
+
+    def round_robin(self) -> "Endpoint":
+        return self._select(RoundRobinSelection(self._generations), "round_robin")
+
+    def _select(self, selection: Selection, name: str) -> "Endpoint":
+        self._check_not_frozen()
+        if self._recorded_responses or self._selection is not None and self._selection.responses:
+            raise AttributeError(f"'{name}' should be called before responses of [{self.method.upper()}] {self.url}")
+
+        self._selection = selection
+        return self
+
+    def rate_limit(self, rate: float, burst: Optional[int] = None, status: int = 429,
+                   queue_timeout: float = 0.0) -> "Endpoint":
+        self._check_not_frozen()
+        self.limits.append(RateLimit(rate, burst, status, queue_timeout, self._clock, self._generations))
+        return self
+
+    def max_concurrency(self, limit: int, status: int = 503, queue_timeout: float = 0.0) -> "Endpoint":
+        self._check_not_frozen()
+        self.limits.append(ConcurrencyLimit(limit, status, queue_timeout))
+        return self
+
+    def with_fault(self, fault: Fault, probability: float = 0.0, every: Optional[int] = None,
+                   on_requests: Iterable[int] = ()) -> "Endpoint":
+        self._check_not_frozen()
+        if not probability and not every and not on_requests:
+            fault_probability = 1.0
+        else:
+            fault_probability = probability
+        state = self._pending_state if self._pending_state is not None else self._current_state
+        faults = self._faults if state is None else self._state_faults.setdefault(state, [])
+        faults.append((fault, fault_probability, every, frozenset(on_requests)))
+        return self
+
+    def _pop_fault(self, state: Optional[str]) -> Optional[Fault]:
+        faults = self._faults + self._state_faults[state] if state in self._state_faults else self._faults
+        if not faults:
+            return None
+
+        with self._cursor_lock:
+            served_times = self._served_times.get() + 1
+            self._served_times.set(served_times)
+        for fault, probability, every, on_requests in faults:
+            if served_times in on_requests or (every and served_times % every == 0):
+                return fault
+            if probability and random.random() < probability:
+                return fault
+        return None
+
+    def when(self, query: Optional[Dict[str, str]] = None, headers: Optional[Dict[str, str]] = None,
+             json: Optional[Dict] = None) -> "Endpoint":
+        if self._parent is not None:
+            return self._parent.when(query, headers, json)
+
+        self._check_not_frozen()
+
+        stub = Endpoint(self.route, parent=self, generations=self._generations, clock=self._clock)
+        self._stubs.add(Condition(query, headers, json), stub)
+        return stub
+
+    def in_state(self, scenario: Scenario, state: str) -> "Endpoint":
+        self._check_not_frozen()
+        if self._scenario is not None and self._scenario is not scenario:
+            raise AttributeError(f"Endpoint [{self.method.upper()}] {self.url} "
+                                 f"already belongs to scenario '{self._scenario.name}'")
+
+        self._scenario = scenario
+        self._pending_state = state
+        return self
+
+    def to_state(self, state: str) -> "Endpoint":
+        self._check_not_frozen()
+        if self._pending_state is not None or self._current_state is None:
+            raise AttributeError("'to_state' without response in state")
+
+        response, _ = self._transitions[self._current_state]
+        self._transitions[self._current_state] = (response, state)
+        return self
+
     def then(self) -> "Endpoint":
         return self
 
@@ -54,8 +215,16 @@ class Endpoint:
         raise AttributeError(f"'Endpoint' object has no attribute '{item}'")
 
     def _times(self, number: int) -> "Endpoint":
+        self._check_not_frozen()
+        if self._current_state is not None:
+            raise AttributeError(f"'times' for a response in state '{self._current_state}', "
+                                 f"a state response is served every time the state is entered")
+        if self._position.get() >= len(self._recorded_responses):
+            raise AttributeError("'times' without response")
+
+        first_response = self._recorded_responses[self._position.get()]
         for i in range(number - 1):
-            self._recorded_responses.append(self._recorded_responses[0])
+            self._recorded_responses.append(first_response)
 
         self._last_recorded_response_is_infinite = False
         return self
@@ -0,0 +1,54 @@
+from abc import ABCMeta, abstractmethod
+
+FAULT_ENVIRON_KEY = "py_fake_server.fault"
+
+
+class Fault(metaclass=ABCMeta):
+    @abstractmethod
+    def inject(self, channel, head: bytes, body: bytes) -> bool:
+        pass
+
+
+class ConnectionReset(Fault):
+    def inject(self, channel, head, body):
+        import socket
+        import struct
+
+        channel.socket.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack("ii", 1, 0))
+        return True
+
+
+class TruncatedBody(Fault):
+    def __init__(self, size: int = 0):
+        self.size = size
+
+    def inject(self, channel, head, body):
+        channel.write_soon(head + body[:self.size])
+        return True
+
+
+class MalformedHeaders(Fault):
+    def inject(self, channel, head, body):
+        status_line, _, headers = head.partition(b"\r\n")
+        channel.write_soon(status_line + b"\r\n" + headers.replace(b": ", b" ") + body)
+        return True
+
+
+class SlowHeaders(Fault):
+    def __init__(self, delay: float):
+        self.delay = delay
+
+    def inject(self, channel, head, body):
+        channel.write_later(self.delay, head + body)
+        return False
+
+
+class StalledBody(Fault):
+    def __init__(self, delay: float, size: int = 0):
+        self.delay = delay
+        self.size = size
+
+    def inject(self, channel, head, body):
+        channel.write_soon(head + body[:self.size])
+        channel.write_later(self.delay, body[self.size:])
+        return False
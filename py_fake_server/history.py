@@ -0,0 +1,150 @@
+import operator
+import sys
+import threading
+import time
+from abc import ABCMeta, abstractmethod
+from array import array
+from bisect import bisect_left
+from itertools import islice, repeat, count
+from typing import Optional, Dict, List, Tuple, Iterator, Union
+
+from py_fake_server.bodies import BodyStore
+from py_fake_server.request import Request
+
+Names = Tuple[str, ...]
+Values = Tuple[object, ...]
+
+
+class BaseRequestHistory(metaclass=ABCMeta):
+    timestamps: array
+
+    @abstractmethod
+    def __len__(self) -> int:
+        pass
+
+    @abstractmethod
+    def append(self, request: Request, status: int = 0, rejected: bool = False,
+               sequence: int = 0, timestamp: Optional[float] = None) -> int:
+        pass
+
+    @abstractmethod
+    def _get(self, index: int) -> Request:
+        pass
+
+    def fork(self, length: int) -> "BaseRequestHistory":
+        raise AttributeError(f"{self.__class__.__name__} can not be restored from a snapshot")
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Request, List[Request]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("request history index out of range")
+        return self._get(index)
+
+    def __iter__(self) -> Iterator[Request]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def sorted_timestamps(self) -> array:
+        timestamps = array("d", self.timestamps)
+        if any(map(operator.gt, timestamps, islice(timestamps, 1, None))):
+            timestamps = array("d", sorted(timestamps))
+        return timestamps
+
+    def max_requests_in_window(self, window: float) -> int:
+        timestamps = self.sorted_timestamps()
+        window_ends = map(bisect_left, repeat(timestamps), map(operator.add, timestamps, repeat(window)))
+        return max(map(operator.sub, window_ends, count()), default=0)
+
+    def min_interval(self) -> Optional[float]:
+        timestamps = self.sorted_timestamps()
+        return min(map(operator.sub, islice(timestamps, 1, None), timestamps), default=None)
+
+    def duration(self) -> float:
+        timestamps = self.sorted_timestamps()
+        return timestamps[-1] - timestamps[0] if timestamps else 0.0
+
+
+class RequestHistory(BaseRequestHistory):
+    def __init__(self, body_store: Optional[BodyStore] = None):
+        self.timestamps = array("d")
+        self.sequences = array("Q")
+        self.statuses = array("H")
+        self.rejected = bytearray()
+        self._body_keys = array("Q")
+        self._bodies = body_store if body_store is not None else BodyStore()
+        self._content_types: List[Optional[str]] = []
+        self._cookies: List[Tuple[Names, Values]] = []
+        self._headers: List[Tuple[Names, Values]] = []
+        self._query_params: List[Tuple[Names, Values]] = []
+        self._files: Dict[int, Dict[str, bytes]] = {}
+        self._names: Dict[Names, Names] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def _get(self, index: int) -> Request:
+        body_key = self._body_keys[index]
+        return Request.from_record(
+            number=index + 1,
+            sequence=self.sequences[index],
+            load_body=lambda: self._bodies.get(body_key),
+            body_digest=self._bodies.digest(body_key),
+            content_type=self._content_types[index],
+            cookies=self._as_dict(self._cookies[index]),
+            headers=self._as_dict(self._headers[index]),
+            query_params=self._as_dict(self._query_params[index]),
+            files=self._files.get(index),
+        )
+
+    def append(self, request: Request, status: int = 0, rejected: bool = False,
+               sequence: int = 0, timestamp: Optional[float] = None) -> int:
+        cookies = self._columns(request.cookies)
+        headers = self._columns(request.headers)
+        query_params = self._columns(request.query_params)
+        content_type = sys.intern(request.content_type) if request.content_type else None
+
+        with self._lock:
+            index = len(self)
+            self._body_keys.append(self._bodies.put(request.body))
+            self._content_types.append(content_type)
+            self._cookies.append(cookies)
+            self._headers.append(headers)
+            self._query_params.append(query_params)
+            if request.files:
+                self._files[index] = request.files
+            self.statuses.append(status)
+            self.rejected.append(rejected)
+            self.sequences.append(sequence)
+            self.timestamps.append(time.perf_counter() if timestamp is None else timestamp)
+        return index + 1
+
+    def fork(self, length: int) -> "RequestHistory":
+        history = RequestHistory(self._bodies)
+        with self._lock:
+            history.timestamps = self.timestamps[:length]
+            history.sequences = self.sequences[:length]
+            history.statuses = self.statuses[:length]
+            history.rejected = self.rejected[:length]
+            history._body_keys = self._body_keys[:length]
+            history._content_types = self._content_types[:length]
+            history._cookies = self._cookies[:length]
+            history._headers = self._headers[:length]
+            history._query_params = self._query_params[:length]
+            history._files = {index: files for index, files in self._files.items() if index < length}
+            history._names = self._names
+        return history
+
+    def _columns(self, values: Optional[Dict[str, object]]) -> Tuple[Names, Values]:
+        if not values:
+            return (), ()
+        names = tuple(values)
+        return self._names.setdefault(names, names), tuple(values.values())
+
+    @staticmethod
+    def _as_dict(columns: Tuple[Names, Values]) -> Dict[str, object]:
+        names, values = columns
+        return dict(zip(names, values))
@@ -0,0 +1,261 @@
+import socket
+import ssl
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import unquote
+
+import h2.config
+import h2.connection
+import h2.errors
+import h2.events
+import h2.exceptions
+import h2.settings
+
+CONNECTION_HEADERS = frozenset((b"connection", b"keep-alive", b"proxy-connection", b"transfer-encoding", b"upgrade"))
+
+
+class HTTP2Connection:
+    def __init__(self, server: "HTTP2Server", sock: socket.socket):
+        self._server = server
+        self._socket = sock
+        self._connection = h2.connection.H2Connection(h2.config.H2Configuration(client_side=False))
+        self._lock = threading.Condition()
+        self._streams: Dict[int, Tuple[List[Tuple[bytes, bytes]], bytearray]] = {}
+        self._reset_streams = set()
+        self.closed = False
+
+    def run(self):
+        try:
+            with self._lock:
+                self._connection.local_settings = h2.settings.Settings(client=False, initial_values={
+                    h2.settings.SettingCodes.MAX_CONCURRENT_STREAMS: self._server.max_concurrent_streams,
+                    h2.settings.SettingCodes.MAX_HEADER_LIST_SIZE: self._connection.DEFAULT_MAX_HEADER_LIST_SIZE,
+                })
+                self._connection.initiate_connection()
+                self._flush()
+            while not self.closed:
+                data = self._socket.recv(65535)
+                if not data:
+                    break
+                with self._lock:
+                    events = self._connection.receive_data(data)
+                    self._flush()
+                for event in events:
+                    self._handle_event(event)
+        except (OSError, h2.exceptions.ProtocolError):
+            pass
+        finally:
+            self.close()
+
+    def close(self):
+        with self._lock:
+            self.closed = True
+            self._lock.notify_all()
+        try:
+            self._socket.close()
+        except OSError:  # pragma: no cover
+            pass
+
+    def _handle_event(self, event: h2.events.Event):
+        if isinstance(event, h2.events.RequestReceived):
+            self._streams[event.stream_id] = (event.headers, bytearray())
+            if event.stream_ended is not None:
+                self._dispatch(event.stream_id)
+        elif isinstance(event, h2.events.DataReceived):
+            if event.stream_id in self._streams:
+                self._streams[event.stream_id][1].extend(event.data)
+            with self._lock:
+                self._connection.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+                self._flush()
+            if event.stream_ended is not None and event.stream_id in self._streams:
+                self._dispatch(event.stream_id)
+        elif isinstance(event, h2.events.StreamEnded):
+            if event.stream_id in self._streams:
+                self._dispatch(event.stream_id)
+        elif isinstance(event, h2.events.StreamReset):
+            self._streams.pop(event.stream_id, None)
+            with self._lock:
+                self._reset_streams.add(event.stream_id)
+                self._lock.notify_all()
+        elif isinstance(event, (h2.events.WindowUpdated, h2.events.RemoteSettingsChanged)):
+            with self._lock:
+                self._lock.notify_all()
+        elif isinstance(event, h2.events.ConnectionTerminated):
+            self.closed = True
+
+    def _dispatch(self, stream_id: int):
+        headers, body = self._streams.pop(stream_id)
+        self._server.executor.submit(self._respond, stream_id, headers, bytes(body))
+
+    def _respond(self, stream_id: int, headers: List[Tuple[bytes, bytes]], body: bytes):
+        try:
+            status, response_headers, response_body = self._server.call_application(headers, body)
+        except Exception:
+            with self._lock:
+                if not self.closed and stream_id not in self._reset_streams:
+                    self._connection.reset_stream(stream_id, h2.errors.ErrorCodes.INTERNAL_ERROR)
+                    self._flush()
+            raise
+        with self._lock:
+            if self.closed or stream_id in self._reset_streams:
+                return
+            self._connection.send_headers(stream_id, [(b":status", status)] + response_headers,
+                                          end_stream=not response_body)
+            self._flush()
+        if response_body:
+            self._send_body(stream_id, response_body)
+
+    def _send_body(self, stream_id: int, body: bytes):
+        offset = 0
+        with self._lock:
+            while not self.closed and stream_id not in self._reset_streams:
+                try:
+                    window = self._connection.local_flow_control_window(stream_id)
+                except h2.exceptions.StreamClosedError:
+                    return
+                size = min(window, self._connection.max_outbound_frame_size, len(body) - offset)
+                if size <= 0:
+                    self._lock.wait()
+                    continue
+                end_stream = offset + size == len(body)
+                self._connection.send_data(stream_id, body[offset:offset + size], end_stream=end_stream)
+                self._flush()
+                offset += size
+                if end_stream:
+                    return
+
+    def _flush(self):
+        data = self._connection.data_to_send()
+        if data:
+            self._socket.sendall(data)
+
+
+class HTTP2Server:
+    def __init__(self, application: Callable, host: str, port: int,
+                 ssl_context: Optional[ssl.SSLContext] = None, max_concurrent_streams: int = 100):
+        self.application = application
+        self.max_concurrent_streams = max_concurrent_streams
+        self._ssl_context = ssl_context
+        if ssl_context is not None:
+            ssl_context.set_alpn_protocols(["h2"])
+        self._url_scheme = "https" if ssl_context is not None else "http"
+        self._host = host
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._socket.bind((host, port))
+        self._socket.listen(128)
+        self.effective_port: int = self._socket.getsockname()[1]
+        self.executor = ThreadPoolExecutor(max_workers=max_concurrent_streams)
+        self._connections: List[HTTP2Connection] = []
+        self._connections_lock = threading.Lock()
+        self.was_shutdown = False
+
+    @classmethod
+    def create(cls, application: Callable, host: str, port: int, ssl_context: Optional[ssl.SSLContext] = None,
+               max_concurrent_streams: int = 100) -> "HTTP2Server":
+        server = cls(application, host, port, ssl_context, max_concurrent_streams)
+        server.runner = threading.Thread(target=server.run, daemon=True)
+        server.runner.start()
+        return server
+
+    def run(self):
+        while not self.was_shutdown:
+            try:
+                sock, _ = self._socket.accept()
+            except OSError:
+                return
+            threading.Thread(target=self._serve, args=(sock,), daemon=True).start()
+
+    def _serve(self, sock: socket.socket):
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        if self._ssl_context is not None:
+            try:
+                sock = self._ssl_context.wrap_socket(sock, server_side=True)
+            except OSError:
+                sock.close()
+                return
+        connection = HTTP2Connection(self, sock)
+        with self._connections_lock:
+            self._connections.append(connection)
+        try:
+            connection.run()
+        finally:
+            with self._connections_lock:
+                self._connections.remove(connection)
+
+    def shutdown(self):
+        self.was_shutdown = True
+        try:
+            self._socket.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self._socket.close()
+        with self._connections_lock:
+            connections = list(self._connections)
+        for connection in connections:
+            connection.close()
+        self.executor.shutdown(wait=True)
+        self.runner.join(5)
+
+    def call_application(self, headers: List[Tuple[bytes, bytes]],
+                         body: bytes) -> Tuple[bytes, List[Tuple[bytes, bytes]], bytes]:
+        environ = self._environ(headers, body)
+        response: Dict[str, object] = {}
+
+        def start_response(status: str, response_headers: List[Tuple[str, str]], exc_info=None):
+            response["status"] = status
+            response["headers"] = response_headers
+
+        result = self.application(environ, start_response)
+        try:
+            response_body = b"".join(result)
+        finally:
+            if hasattr(result, "close"):
+                result.close()
+
+        status = str(response["status"]).split(" ", 1)[0].encode("ascii")
+        response_headers = [
+            (name.lower().encode("latin-1"), value.encode("latin-1")) for name, value in response["headers"]
+        ]
+        response_headers = [(name, value) for name, value in response_headers if name not in CONNECTION_HEADERS]
+        return status, response_headers, response_body
+
+    def _environ(self, headers: List[Tuple[bytes, bytes]], body: bytes) -> Dict[str, object]:
+        environ: Dict[str, object] = {
+            "SCRIPT_NAME": "",
+            "SERVER_NAME": self._host,
+            "SERVER_PORT": str(self.effective_port),
+            "SERVER_PROTOCOL": "HTTP/2",
+            "CONTENT_LENGTH": str(len(body)),
+            "wsgi.version": (1, 0),
+            "wsgi.url_scheme": self._url_scheme,
+            "wsgi.input": BytesIO(body),
+            "wsgi.errors": sys.stderr,
+            "wsgi.multithread": True,
+            "wsgi.multiprocess": False,
+            "wsgi.run_once": False,
+        }
+        cookies = []
+        for name, value in headers:
+            name, value = name.decode("latin-1"), value.decode("latin-1")
+            if name == ":method":
+                environ["REQUEST_METHOD"] = value
+            elif name == ":path":
+                path, _, query = value.partition("?")
+                environ["PATH_INFO"] = unquote(path, encoding="latin-1")
+                environ["QUERY_STRING"] = query
+            elif name == ":authority":
+                environ["HTTP_HOST"] = value
+            elif name == "cookie":
+                cookies.append(value)
+            elif name == "content-type":
+                environ["CONTENT_TYPE"] = value
+            elif not name.startswith(":") and name != "content-length":
+                key = "HTTP_" + name.upper().replace("-", "_")
+                environ[key] = f"{environ[key]},{value}" if key in environ else value
+        if cookies:
+            environ["HTTP_COOKIE"] = "; ".join(cookies)
+        return environ
@@ -0,0 +1,82 @@
+import threading
+from abc import ABCMeta, abstractmethod
+from typing import Optional
+
+from py_fake_server.clock import Clock, SYSTEM_CLOCK
+from py_fake_server.response import Response
+from py_fake_server.snapshot import Generations, GenerationalValue
+
+
+class BaseLimit(metaclass=ABCMeta):
+    def __init__(self, status: int, queue_timeout: float):
+        self.queue_timeout = queue_timeout
+        self.rejection = Response(status=status, content_type="text/plain", body=self._rejection_body())
+
+    @abstractmethod
+    def acquire(self) -> bool:
+        pass
+
+    @abstractmethod
+    def release(self):
+        pass
+
+    @abstractmethod
+    def _rejection_body(self) -> str:
+        pass
+
+
+class RateLimit(BaseLimit):
+    def __init__(self, rate: float, burst: Optional[int] = None, status: int = 429, queue_timeout: float = 0.0,
+                 clock: Clock = SYSTEM_CLOCK, generations: Optional[Generations] = None):
+        if rate <= 0:
+            raise AttributeError("Rate limit should be greater than 0")
+
+        self.rate = rate
+        self.burst = burst or max(1, int(rate))
+        super().__init__(status, queue_timeout)
+        self._clock = clock
+        self._bucket = GenerationalValue(generations or Generations(), (float(self.burst), clock.now()))
+        self._lock = threading.Lock()
+
+    def acquire(self) -> bool:
+        with self._lock:
+            tokens, updated_at = self._bucket.get()
+            now = self._clock.now()
+            tokens = min(self.burst, tokens + (now - updated_at) * self.rate)
+
+            wait = (1 - tokens) / self.rate if tokens < 1 else 0.0
+            if wait > self.queue_timeout:
+                self._bucket.set((tokens, now))
+                return False
+            self._bucket.set((tokens - 1, now))
+
+        if wait:
+            self._clock.sleep(wait)
+        return True
+
+    def release(self):
+        pass
+
+    def _rejection_body(self) -> str:
+        return f"Rate limit of {self.rate} requests per second exceeded"
+
+
+class ConcurrencyLimit(BaseLimit):
+    def __init__(self, limit: int, status: int = 503, queue_timeout: float = 0.0):
+        if limit <= 0:
+            raise AttributeError("Concurrency limit should be greater than 0")
+
+        self.limit = limit
+        super().__init__(status, queue_timeout)
+        self._semaphore = threading.BoundedSemaphore(limit)
+
+    def acquire(self) -> bool:
+        if self.queue_timeout:
+            return self._semaphore.acquire(timeout=self.queue_timeout)
+        return self._semaphore.acquire(blocking=False)
+
+    def release(self):
+        self._semaphore.release()
+
+    def _rejection_body(self) -> str:
+        return f"Limit of {self.limit} concurrent requests exceeded"
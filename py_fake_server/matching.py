@@ -0,0 +1,108 @@
+import json as json_lib
+import threading
+from collections import Counter
+from typing import Optional, Dict, List, Tuple, Any
+
+from py_fake_server.request import Request
+
+Dimension = Tuple[str, str]
+Candidate = Tuple[int, "Condition", Any]
+
+
+def _canonical(value: Any) -> str:
+    return value if isinstance(value, str) else json_lib.dumps(value, sort_keys=True)
+
+
+def _canonical_json(value: Any) -> str:
+    return json_lib.dumps(value, sort_keys=True)
+
+
+class Condition:
+    def __init__(self, query: Optional[Dict[str, str]] = None, headers: Optional[Dict[str, str]] = None,
+                 json: Optional[Dict] = None):
+        constraints: Dict[Dimension, str] = {}
+        for name, value in (query or {}).items():
+            constraints[("query", name)] = str(value)
+        for name, value in (headers or {}).items():
+            constraints[("headers", name.upper())] = str(value)
+        for name, value in (json or {}).items():
+            constraints[("json", name)] = _canonical_json(value)
+        self.constraints = constraints
+
+    def matches(self, values: "RequestValues") -> bool:
+        return all(values.get(dimension) == value for dimension, value in self.constraints.items())
+
+
+class RequestValues:
+    def __init__(self, request: Request):
+        self._request = request
+
+    def get(self, dimension: Dimension) -> Optional[str]:
+        kind, name = dimension
+        if kind == "query":
+            value = self._request.query_params.get(name)
+        elif kind == "headers":
+            value = self._request.headers.get(name)
+        else:
+            json = self._request.json
+            if not isinstance(json, dict) or name not in json:
+                return None
+            return _canonical_json(json[name])
+        return None if value is None else _canonical(value)
+
+
+class StubIndex:
+    def __init__(self):
+        self._stubs: List[Tuple[Condition, Any]] = []
+        self._compiled: Optional[Tuple[Dict[Dimension, Dict[str, List[Candidate]]], List[Candidate]]] = None
+        self._lock = threading.Lock()
+
+    def __bool__(self):
+        return bool(self._stubs)
+
+    def stubs(self) -> List[Any]:
+        return [stub for _, stub in self._stubs]
+
+    def add(self, condition: Condition, stub: Any):
+        with self._lock:
+            self._stubs.append((condition, stub))
+            self._compiled = None
+
+    def match(self, request: Request) -> Optional[Any]:
+        compiled = self._compiled
+        if compiled is None:
+            compiled = self._compile()
+        index, unconditional = compiled
+
+        values = RequestValues(request)
+        best: Optional[Candidate] = unconditional[0] if unconditional else None
+        for dimension, buckets in index.items():
+            value = values.get(dimension)
+            if value is None:
+                continue
+            for candidate in buckets.get(value, ()):
+                if best is not None and candidate[0] > best[0]:
+                    break
+                if candidate[1].matches(values):
+                    best = candidate
+                    break
+
+        return best[2] if best else None
+
+    def _compile(self) -> Tuple[Dict[Dimension, Dict[str, List[Candidate]]], List[Candidate]]:
+        with self._lock:
+            if self._compiled is not None:
+                return self._compiled
+
+            frequencies = Counter(dimension for condition, _ in self._stubs for dimension in condition.constraints)
+            index: Dict[Dimension, Dict[str, List[Candidate]]] = {}
+            unconditional: List[Candidate] = []
+            for order, (condition, stub) in enumerate(self._stubs):
+                if not condition.constraints:
+                    unconditional.append((order, condition, stub))
+                    continue
+                dimension = max(condition.constraints, key=lambda d: frequencies[d])
+                buckets = index.setdefault(dimension, {})
+                buckets.setdefault(condition.constraints[dimension], []).append((order, condition, stub))
+            self._compiled = (index, unconditional)
+            return self._compiled
@@ -0,0 +1,23 @@
+from typing import Optional, TYPE_CHECKING
+
+from py_fake_server.profiler import PROFILE_ENVIRON_KEY, NULL_TRACE
+
+if TYPE_CHECKING:  # pragma: no cover
+    import falcon
+    from falcon_multipart.middleware import MultipartMiddleware
+
+
+class LazyMultipartMiddleware:
+    def __init__(self):
+        self._middleware: Optional["MultipartMiddleware"] = None
+
+    def process_request(self, request: "falcon.Request", response: "falcon.Response", **kwargs):
+        if "multipart/form-data" not in (request.content_type or ""):
+            return
+        if self._middleware is None:
+            from falcon_multipart.middleware import MultipartMiddleware
+            self._middleware = MultipartMiddleware()
+        trace = request.env.get(PROFILE_ENVIRON_KEY, NULL_TRACE)
+        trace.mark("dispatch")
+        self._middleware.process_request(request, response, **kwargs)
+        trace.mark("multipart")
@@ -0,0 +1,118 @@
+import itertools
+import threading
+import time
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+PROFILE_ENVIRON_KEY = "py_fake_server.profile"
+ROOT_FRAME = "fake_server"
+
+
+class NullTrace:
+    __slots__ = ()
+
+    def mark(self, stage: str):
+        pass
+
+    def name(self, method: str, path: str):
+        pass
+
+
+NULL_TRACE = NullTrace()
+
+
+class RequestTrace(NullTrace):
+    __slots__ = ("_profiler", "_last", "_stages", "_route")
+
+    def __init__(self, profiler: "RequestProfiler"):
+        self._profiler = profiler
+        self._last = time.perf_counter()
+        self._stages: List[Tuple[str, float]] = []
+        self._route: Optional[str] = None
+
+    def mark(self, stage: str):
+        now = time.perf_counter()
+        self._stages.append((stage, now - self._last))
+        self._last = now
+
+    def name(self, method: str, path: str):
+        self._route = f"{method.upper()} {path.replace(';', ',')}"
+
+    def finish(self):
+        if self._route is not None:
+            self._profiler.add(self._route, self._stages)
+
+
+class ProfiledStream:
+    def __init__(self, body: Iterable[bytes], trace: RequestTrace):
+        self._body = body
+        self._trace = trace
+
+    def __iter__(self) -> Iterator[bytes]:
+        return iter(self._body)
+
+    def close(self):
+        if hasattr(self._body, "close"):
+            self._body.close()
+        self._trace.mark("write")
+        self._trace.finish()
+
+
+class ProfiledBody(ProfiledStream):
+    def __len__(self) -> int:
+        return len(self._body)
+
+
+class RequestProfiler:
+    def __init__(self, sample_every: int = 1):
+        if sample_every < 1:
+            raise AttributeError("'sample_every' should be greater than 0")
+
+        self.sample_every = sample_every
+        self.started_at: float = time.time()
+        self.stopped_at: Optional[float] = None
+        self.sampled: int = 0
+        self._counter = itertools.count()
+        self._stacks: Dict[Tuple[str, str], float] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self.stopped_at is None
+
+    def trace(self) -> Optional[RequestTrace]:
+        if not self.running or next(self._counter) % self.sample_every:
+            return None
+        return RequestTrace(self)
+
+    def wrap(self, body: Iterable[bytes], trace: RequestTrace) -> ProfiledStream:
+        trace.mark("serialize")
+        return ProfiledBody(body, trace) if hasattr(body, "__len__") else ProfiledStream(body, trace)
+
+    def add(self, route: str, stages: List[Tuple[str, float]]):
+        with self._lock:
+            if not self.running:
+                return
+            self.sampled += 1
+            for stage, duration in stages:
+                key = (route, stage)
+                self._stacks[key] = self._stacks.get(key, 0.0) + duration
+
+    def stop(self):
+        if self.running:
+            self.stopped_at = time.time()
+
+    def stages(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            stacks = list(self._stacks.items())
+        result: Dict[str, Dict[str, float]] = {}
+        for (route, stage), duration in stacks:
+            result.setdefault(route, {})[stage] = duration
+        return result
+
+    def collapsed(self) -> str:
+        with self._lock:
+            stacks = sorted(self._stacks.items())
+        return "".join(
+            f"{ROOT_FRAME};{route};{stage} {round(duration * 1_000_000)}\n"
+            for (route, stage), duration in stacks
+        )
@@ -0,0 +1,123 @@
+import http.client
+import queue
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+HOP_BY_HOP_HEADERS = frozenset((
+    "CONNECTION", "KEEP-ALIVE", "PROXY-AUTHENTICATE", "PROXY-AUTHORIZATION",
+    "TE", "TRAILER", "TRANSFER-ENCODING", "UPGRADE", "HOST", "CONTENT-LENGTH",
+))
+
+
+class UpstreamError(Exception):
+    pass
+
+
+class RequestBody:
+    def __init__(self, stream: BinaryIO, length: Optional[int], chunk_size: int = 65536):
+        self.length = length
+        self._stream = stream
+        self._chunk_size = chunk_size
+        self._chunks: List[bytes] = []
+        self._exhausted = False
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield from list(self._chunks)
+        while not self._exhausted:
+            chunk = self._stream.read(self._chunk_size)
+            if not chunk:
+                self._exhausted = True
+                return
+            self._chunks.append(chunk)
+            yield chunk
+
+    def read_all(self) -> bytes:
+        for _ in self:
+            pass
+        return b"".join(self._chunks)
+
+
+class UpstreamPool:
+    def __init__(self, base_url: str, max_connections: int = 10, timeout: float = 10.0, chunk_size: int = 65536):
+        parts = urlsplit(base_url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise AttributeError(f"Unknown upstream '{base_url}'")
+
+        self.base_url = base_url.rstrip("/")
+        self._connection_class = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+        self._host = parts.hostname
+        self._port = parts.port
+        self._prefix = parts.path.rstrip("/")
+        self._timeout = timeout
+        self._chunk_size = chunk_size
+        self._idle: "queue.LifoQueue[http.client.HTTPConnection]" = queue.LifoQueue(max_connections)
+
+    def forward(self, method: str, path: str, headers: Dict[str, str],
+                body: Union[bytes, RequestBody, None]) -> Tuple[str, Dict[str, str], Optional[int], Iterator[bytes]]:
+        upstream_headers = {
+            name: value for name, value in headers.items()
+            if name.upper() not in HOP_BY_HOP_HEADERS
+        }
+        length = len(body) if isinstance(body, bytes) else getattr(body, "length", None)
+        if length is not None:
+            upstream_headers["Content-Length"] = str(length)
+
+        for attempt in range(2):
+            connection, reused = self._acquire()
+            try:
+                connection.request(method, self._prefix + path, body, upstream_headers)
+                upstream_response = connection.getresponse()
+            except (http.client.HTTPException, OSError) as error:
+                connection.close()
+                if reused and attempt == 0:
+                    continue
+                raise UpstreamError(f"Upstream {self.base_url} is not available: {error}") from error
+
+            response_headers = {
+                name: value for name, value in upstream_response.getheaders()
+                if name.upper() not in HOP_BY_HOP_HEADERS
+            }
+            status = f"{upstream_response.status} {upstream_response.reason}"
+            if method.upper() == "HEAD" or upstream_response.length == 0:
+                upstream_response.read()
+                self._release(connection, upstream_response)
+                return status, response_headers, 0, iter(())
+            return status, response_headers, upstream_response.length, self._stream(connection, upstream_response)
+
+    def close(self):
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+    def _acquire(self) -> Tuple[http.client.HTTPConnection, bool]:
+        try:
+            return self._idle.get_nowait(), True
+        except queue.Empty:
+            return self._connection_class(self._host, self._port, timeout=self._timeout), False
+
+    def _release(self, connection: http.client.HTTPConnection, upstream_response: http.client.HTTPResponse):
+        if upstream_response.will_close:
+            connection.close()
+            return
+        try:
+            self._idle.put_nowait(connection)
+        except queue.Full:
+            connection.close()
+
+    def _stream(self, connection: http.client.HTTPConnection,
+                upstream_response: http.client.HTTPResponse) -> Iterator[bytes]:
+        completed = False
+        try:
+            while True:
+                chunk = upstream_response.read1(self._chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+            completed = True
+        finally:
+            if completed:
+                self._release(connection, upstream_response)
+            else:
+                connection.close()
@@ -0,0 +1,326 @@
+import asyncio
+import base64
+import hashlib
+import json as json_lib
+import socket
+import struct
+import threading
+from abc import ABCMeta, abstractmethod
+from typing import Any, Callable, Iterator, List, Optional, Set, Tuple, Union
+
+from py_fake_server.faults import Fault
+from py_fake_server.request import Request
+from py_fake_server.route import Route
+from py_fake_server.snapshot import Freezable
+from py_fake_server.statistic import Statistic
+
+WEBSOCKET_GUID = b"258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+OPCODE_CONTINUATION = 0x0
+OPCODE_TEXT = 0x1
+OPCODE_BINARY = 0x2
+OPCODE_CLOSE = 0x8
+OPCODE_PING = 0x9
+OPCODE_PONG = 0xA
+
+Message = Union[str, bytes, dict, list]
+
+
+def websocket_accept(key: str) -> str:
+    return base64.b64encode(hashlib.sha1(key.encode("ascii") + WEBSOCKET_GUID).digest()).decode("ascii")
+
+
+def websocket_frame(opcode: int, payload: bytes) -> bytes:
+    length = len(payload)
+    if length < 126:
+        head = struct.pack("!BB", 0x80 | opcode, length)
+    elif length < 65536:
+        head = struct.pack("!BBH", 0x80 | opcode, 126, length)
+    else:
+        head = struct.pack("!BBQ", 0x80 | opcode, 127, length)
+    return head + payload
+
+
+def websocket_message(message: Message) -> bytes:
+    if isinstance(message, bytes):
+        return websocket_frame(OPCODE_BINARY, message)
+    if isinstance(message, (dict, list)):
+        message = json_lib.dumps(message)
+    return websocket_frame(OPCODE_TEXT, message.encode("utf-8"))
+
+
+def server_sent_event(data: Message, event: Optional[str] = None, event_id: Optional[str] = None) -> bytes:
+    if isinstance(data, (dict, list)):
+        data = json_lib.dumps(data)
+    elif isinstance(data, bytes):
+        data = data.decode("utf-8")
+    lines = [f"id: {event_id}"] if event_id is not None else []
+    if event is not None:
+        lines.append(f"event: {event}")
+    lines.extend(f"data: {line}" for line in data.split("\n"))
+    return ("\n".join(lines) + "\n\n").encode("utf-8")
+
+
+class Handoff(Fault):
+    def __init__(self, head: bytes, adopt: Callable[[socket.socket], None]):
+        self.head = head
+        self.adopt = adopt
+
+    def inject(self, channel, head, body):
+        channel.write_soon(self.head)
+        channel.handoff = self.adopt
+        return False
+
+
+class PushEndpoint(Freezable, metaclass=ABCMeta):
+    status: int = 200
+
+    def __init__(self, route: Route):
+        self.route = route
+        self.rate: Optional[float] = None
+        self.burst: int = 1
+        self.close_at_end: bool = False
+        self._messages: List[Tuple[bytes, int]] = []
+
+    def at_rate(self, messages_per_second: float, burst: int = 1) -> "PushEndpoint":
+        self._check_not_frozen()
+        if messages_per_second <= 0:
+            raise AttributeError("Rate should be greater than 0")
+        if burst < 1:
+            raise AttributeError("Burst should be greater than 0")
+
+        self.rate = messages_per_second
+        self.burst = burst
+        return self
+
+    def then_close(self) -> "PushEndpoint":
+        self._check_not_frozen()
+        self.close_at_end = True
+        return self
+
+    def frames(self) -> Iterator[bytes]:
+        for frame, times in self._messages:
+            for _ in range(times):
+                yield frame
+
+    def _add(self, frame: bytes, times: int) -> "PushEndpoint":
+        self._check_not_frozen()
+        if times < 1:
+            raise AttributeError("Message should be sent at least 1 time")
+
+        self._messages.append((frame, times))
+        return self
+
+    @abstractmethod
+    def handshake(self, request: Request) -> Optional[bytes]:
+        pass
+
+    @abstractmethod
+    def protocol(self, connections: Set["PushProtocol"], request: Request,
+                 received: Statistic) -> "PushProtocol":
+        pass
+
+
+class WebSocketEndpoint(PushEndpoint):
+    status = 101
+
+    def send(self, message: Message, times: int = 1) -> "WebSocketEndpoint":
+        return self._add(websocket_message(message), times)
+
+    def handshake(self, request):
+        headers = request.headers
+        key = headers.get("SEC-WEBSOCKET-KEY")
+        if key is None or headers.get("UPGRADE", "").lower() != "websocket" \
+                or headers.get("SEC-WEBSOCKET-VERSION") != "13":
+            return None
+        return (
+            "HTTP/1.1 101 Switching Protocols\r\n"
+            "Upgrade: websocket\r\n"
+            "Connection: Upgrade\r\n"
+            f"Sec-WebSocket-Accept: {websocket_accept(key)}\r\n\r\n"
+        ).encode("ascii")
+
+    def protocol(self, connections, request, received):
+        return WebSocketProtocol(self, connections, request, received)
+
+
+class SSEEndpoint(PushEndpoint):
+    def event(self, data: Message, event: Optional[str] = None, event_id: Optional[str] = None,
+              times: int = 1) -> "SSEEndpoint":
+        return self._add(server_sent_event(data, event, event_id), times)
+
+    def handshake(self, request):
+        return (
+            "HTTP/1.1 200 OK\r\n"
+            "Content-Type: text/event-stream\r\n"
+            "Cache-Control: no-cache\r\n"
+            "Connection: close\r\n\r\n"
+        ).encode("ascii")
+
+    def protocol(self, connections, request, received):
+        return PushProtocol(self, connections, request, received)
+
+
+class PushProtocol(asyncio.Protocol):
+    def __init__(self, endpoint: PushEndpoint, connections: Set["PushProtocol"], request: Request,
+                 received: Statistic):
+        self.endpoint = endpoint
+        self.request = request
+        self.received = received
+        self.transport: Optional[asyncio.Transport] = None
+        self._connections = connections
+        self._script: Optional[asyncio.Task] = None
+
+    def connection_made(self, transport: asyncio.Transport):
+        self.transport = transport
+        self._connections.add(self)
+        self._script = asyncio.get_event_loop().create_task(self._play())
+
+    def connection_lost(self, exc: Optional[Exception]):
+        self._connections.discard(self)
+        if self._script is not None:
+            self._script.cancel()
+
+    def data_received(self, data: bytes):
+        pass
+
+    async def _play(self):
+        endpoint = self.endpoint
+        interval = endpoint.burst / endpoint.rate if endpoint.rate else 0.0
+        for number, frame in enumerate(endpoint.frames(), start=1):
+            if self.transport.is_closing():
+                return
+            self.transport.write(frame)
+            if interval and number % endpoint.burst == 0:
+                await asyncio.sleep(interval)
+        if endpoint.close_at_end:
+            self.close()
+
+    def close(self):
+        self.transport.close()
+
+
+class WebSocketProtocol(PushProtocol):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._buffer = bytearray()
+        self._fragments: List[bytes] = []
+        self._fragments_opcode = OPCODE_TEXT
+
+    def data_received(self, data: bytes):
+        self._buffer += data
+        while True:
+            frame = self._parse_frame()
+            if frame is None:
+                return
+            self._handle_frame(*frame)
+
+    def _parse_frame(self) -> Optional[Tuple[bool, int, bytes]]:
+        buffer = self._buffer
+        if len(buffer) < 2:
+            return None
+        fin, opcode = bool(buffer[0] & 0x80), buffer[0] & 0x0F
+        masked, length = bool(buffer[1] & 0x80), buffer[1] & 0x7F
+        position = 2
+        if length == 126:
+            if len(buffer) < 4:
+                return None
+            length, = struct.unpack_from("!H", buffer, 2)
+            position = 4
+        elif length == 127:
+            if len(buffer) < 10:
+                return None
+            length, = struct.unpack_from("!Q", buffer, 2)
+            position = 10
+        mask = b""
+        if masked:
+            mask = bytes(buffer[position:position + 4])
+            position += 4
+        if len(buffer) < position + length:
+            return None
+        payload = bytes(buffer[position:position + length])
+        del buffer[:position + length]
+        if masked:
+            payload = bytes(byte ^ mask[index % 4] for index, byte in enumerate(payload))
+        return fin, opcode, payload
+
+    def _handle_frame(self, fin: bool, opcode: int, payload: bytes):
+        if opcode == OPCODE_CLOSE:
+            self.close(payload[:2] or struct.pack("!H", 1000))
+        elif opcode == OPCODE_PING:
+            self.transport.write(websocket_frame(OPCODE_PONG, payload))
+        elif opcode in (OPCODE_TEXT, OPCODE_BINARY, OPCODE_CONTINUATION):
+            if opcode != OPCODE_CONTINUATION:
+                self._fragments_opcode = opcode
+            self._fragments.append(payload)
+            if fin:
+                message, self._fragments = b"".join(self._fragments), []
+                self._record(message, self._fragments_opcode)
+
+    def _record(self, message: bytes, opcode: int):
+        request = self.request
+        self.received.record_request(Request.from_record(
+            number=0,
+            load_body=lambda: message,
+            content_type="text/plain" if opcode == OPCODE_TEXT else "application/octet-stream",
+            cookies=request.cookies,
+            headers=request.headers,
+            query_params=request.query_params,
+            files=None,
+        ))
+
+    def close(self, code: bytes = struct.pack("!H", 1000)):
+        if not self.transport.is_closing():
+            self.transport.write(websocket_frame(OPCODE_CLOSE, code))
+            self.transport.close()
+
+
+class PushLoop:
+    def __init__(self):
+        self.connections: Set[PushProtocol] = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def adopt(self, sock: socket.socket, protocol_factory: Callable[[], PushProtocol]):
+        loop = self._started_loop()
+        asyncio.run_coroutine_threadsafe(loop.connect_accepted_socket(protocol_factory, sock), loop)
+
+    def protocol_factory(self, endpoint: PushEndpoint, request: Request,
+                         received: Statistic) -> Callable[[], PushProtocol]:
+        return lambda: endpoint.protocol(self.connections, request, received)
+
+    def _started_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._loop.run_forever, name="py_fake_server.push",
+                                                daemon=True)
+                self._thread.start()
+            return self._loop
+
+    def close_connections(self):
+        loop = self._loop
+        if loop is not None:
+            self._call(loop, self._close_connections)
+
+    def _close_connections(self):
+        for connection in list(self.connections):
+            connection.close()
+
+    def stop(self):
+        with self._lock:
+            loop, thread, self._loop, self._thread = self._loop, self._thread, None, None
+        if loop is None:
+            return
+        self._call(loop, self._close_connections)
+        self._call(loop, lambda: None)
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+    def _call(self, loop: asyncio.AbstractEventLoop, function: Callable[[], Any]):
+        asyncio.run_coroutine_threadsafe(self._run(function), loop).result()
+
+    @staticmethod
+    async def _run(function: Callable[[], Any]):
+        function()
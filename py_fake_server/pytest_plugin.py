@@ -0,0 +1,85 @@
+from typing import Optional
+
+import pytest
+
+from py_fake_server.server import FakeServer
+from py_fake_server.snapshot import Snapshot
+from py_fake_server.timings import RouteTimings
+
+WORKER_OUTPUT_KEY = "py_fake_server_timings"
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("py_fake_server")
+    group.addoption("--fake-server-host", default="localhost",
+                    help="host of the fake server (default: localhost)")
+    group.addoption("--fake-server-port", type=int, default=0,
+                    help="port of the fake server, shifted by the xdist worker number (default: any free port)")
+    group.addoption("--fake-server-report", type=int, default=5,
+                    help="number of the slowest and the heaviest routes to report, 0 to disable (default: 5)")
+
+
+def pytest_configure(config):
+    config.pluginmanager.register(FakeServerReport(config), "py_fake_server_report")
+
+
+class FakeServerReport:
+    def __init__(self, config):
+        self._config = config
+        self.timings = RouteTimings()
+
+    def pytest_sessionfinish(self, session):
+        workeroutput = getattr(self._config, "workeroutput", None)
+        if workeroutput is not None:
+            workeroutput[WORKER_OUTPUT_KEY] = self.timings.to_list()
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error):
+        workeroutput = getattr(node, "workeroutput", None) or {}
+        self.timings.merge(RouteTimings.from_list(workeroutput.get(WORKER_OUTPUT_KEY, [])))
+
+    def pytest_terminal_summary(self, terminalreporter):
+        number = self._config.getoption("fake_server_report")
+        if not number or not len(self.timings) or hasattr(self._config, "workerinput"):
+            return
+
+        terminalreporter.section("fake server routes")
+        terminalreporter.line("slowest routes:")
+        for (method, url), timing in self.timings.slowest(number):
+            terminalreporter.line(f"{timing.slowest:.4f}s max {timing.mean:.4f}s mean [{method}] {url}")
+        terminalreporter.line("heaviest routes:")
+        for (method, url), timing in self.timings.heaviest(number):
+            terminalreporter.line(f"{timing.requests} requests [{method}] {url}")
+
+
+def _worker_number(config) -> int:
+    workerinput: Optional[dict] = getattr(config, "workerinput", None)
+    if workerinput is None:
+        return 0
+    return int(workerinput["workerid"].lstrip("gw") or 0)
+
+
+@pytest.fixture(scope="session")
+def fake_server_session(request) -> FakeServer:
+    config = request.config
+    port = config.getoption("fake_server_port")
+    server = FakeServer(host=config.getoption("fake_server_host"),
+                        port=port + _worker_number(config) if port else 0)
+    server.start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture(scope="session")
+def fake_server_baseline(fake_server_session: FakeServer) -> Snapshot:
+    return fake_server_session.snapshot()
+
+
+@pytest.fixture
+def fake_server(request, fake_server_session: FakeServer, fake_server_baseline: Snapshot) -> FakeServer:
+    report: FakeServerReport = request.config.pluginmanager.get_plugin("py_fake_server_report")
+    fake_server_session.restore(fake_server_baseline)
+    yield fake_server_session
+    report.timings.merge(fake_server_session.timings)
+    fake_server_session.timings.clear()
+    fake_server_session.restore(fake_server_baseline)
@@ -1,20 +1,79 @@
-from typing import Optional, Dict
+import json as json_lib
+from typing import Optional, Dict, Any, Callable, TYPE_CHECKING
 
-import falcon
+from py_fake_server.encoding import decompress
+
+if TYPE_CHECKING:  # pragma: no cover
+    import falcon
 
 
 class Request:
-    def __init__(self, request: falcon.Request, request_number: int):
+    __slots__ = ("cookies", "_body", "_load_body", "body_digest", "content_type", "files", "headers",
+                 "query_params", "number", "sequence", "path_params", "_json", "_json_parsed")
+
+    def __init__(self, request: "falcon.Request", request_number: int = 0, read_body: bool = True):
         self.cookies: Optional[Dict[str, str]] = request.cookies
-        self.body: Optional[bytes] = request.bounded_stream.read()
+        encoding = request.get_header("Content-Encoding")
+        self._body: Optional[bytes] = None
+        self._load_body: Optional[Callable[[], bytes]] = None
+        if read_body:
+            self._body = decompress(request.bounded_stream.read(), encoding)
+        else:
+            self._load_body = lambda: decompress(request.bounded_stream.read(), encoding)
+        self.body_digest: Optional[bytes] = None
         self.content_type: Optional[str] = request.content_type
         self.files: Optional[Dict[str, bytes]] = self._get_files(request)
         self.headers: Optional[Dict[str, str]] = request.headers
         self.query_params: Optional[Dict[str, str]] = request.params
         self.number = request_number
+        self.sequence = 0
+        self.path_params: Dict[str, str] = {}
+        self._json: Any = None
+        self._json_parsed = False
+
+    @classmethod
+    def from_record(cls, number: int, load_body: Callable[[], bytes], content_type: Optional[str],
+                    cookies: Dict[str, str], headers: Dict[str, str], query_params: Dict[str, str],
+                    files: Optional[Dict[str, bytes]], body_digest: Optional[bytes] = None,
+                    sequence: int = 0) -> "Request":
+        request = cls.__new__(cls)
+        request.cookies = cookies
+        request._body = None
+        request._load_body = load_body
+        request.body_digest = body_digest
+        request.content_type = content_type
+        request.files = files
+        request.headers = headers
+        request.query_params = query_params
+        request.number = number
+        request.sequence = sequence
+        request.path_params = {}
+        request._json = None
+        request._json_parsed = False
+        return request
+
+    @property
+    def body(self) -> bytes:
+        if self._body is None:
+            self._body = self._load_body()
+        return self._body
+
+    @body.setter
+    def body(self, body: bytes):
+        self._body = body
+
+    @property
+    def json(self) -> Any:
+        if not self._json_parsed:
+            self._json_parsed = True
+            try:
+                self._json = json_lib.loads(self.body.decode("utf-8"))
+            except (UnicodeDecodeError, json_lib.JSONDecodeError):
+                self._json = None
+        return self._json
 
     @staticmethod
-    def _get_files(request: falcon.Request) -> Optional[Dict[str, bytes]]:
+    def _get_files(request: "falcon.Request") -> Optional[Dict[str, bytes]]:
         files = {
             param_name: param_value.file.read()
             for param_name, param_value in request.params.items()
@@ -0,0 +1,78 @@
+import threading
+from array import array
+from bisect import bisect_right
+from typing import Dict, List, Tuple, Optional
+
+from py_fake_server.clock import Clock, SYSTEM_CLOCK
+from py_fake_server.route import Route
+
+
+class RequestLog:
+    def __init__(self, base: Optional[Tuple["RequestLog", int]] = None, clock: Clock = SYSTEM_CLOCK):
+        self._base = base
+        self._clock = clock
+        self._routes: List[Route] = []
+        self._timestamps = array("d")
+        self._sequences_by_route: Dict[Route, array] = {}
+        self._lock = threading.Condition(threading.RLock())
+
+    def __len__(self) -> int:
+        if self._base is not None:
+            return self._base[1]
+        return len(self._routes)
+
+    @property
+    def routes(self) -> List[Route]:
+        return self._materialize()._routes
+
+    @property
+    def timestamps(self) -> array:
+        return self._materialize()._timestamps
+
+    def fork(self) -> "RequestLog":
+        return RequestLog((self, len(self)), self._clock)
+
+    def record(self, route: Route) -> Tuple[int, float]:
+        self._materialize()
+        with self._lock:
+            timestamp = self._clock.now()
+            self._routes.append(route)
+            self._timestamps.append(timestamp)
+            sequence = len(self._routes)
+            self._sequences_by_route.setdefault(route, array("Q")).append(sequence)
+            self._lock.notify_all()
+        return sequence, timestamp
+
+    def wait_for(self, length: int, timeout: float) -> bool:
+        self._materialize()
+        with self._lock:
+            return self._lock.wait_for(lambda: len(self._routes) >= length, timeout)
+
+    def sequences(self, route: Route) -> array:
+        return self._materialize()._sequences_by_route.get(route, array("Q"))
+
+    def first_out_of_order(self, routes: List[Route]) -> int:
+        sequence = 0
+        for index, route in enumerate(routes):
+            sequences = self.sequences(route)
+            position = bisect_right(sequences, sequence)
+            if position == len(sequences):
+                return index
+            sequence = sequences[position]
+        return -1
+
+    def _materialize(self) -> "RequestLog":
+        if self._base is not None:
+            with self._lock:
+                if self._base is not None:
+                    log, length = self._base
+                    log._materialize()
+                    with log._lock:
+                        self._routes = log._routes[:length]
+                        self._timestamps = log._timestamps[:length]
+                        self._sequences_by_route = {
+                            route: sequences[:bisect_right(sequences, length)]
+                            for route, sequences in log._sequences_by_route.items()
+                        }
+                    self._base = None
+        return self
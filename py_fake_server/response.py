@@ -1,11 +1,25 @@
 import json as json_lib
-from typing import Optional, Dict
+from http import HTTPStatus
+from typing import Optional, Dict, Union, Tuple
+
+from py_fake_server.encoding import ENCODINGS, precompress
+
+from py_fake_server.request import Request
+from py_fake_server.template import Template
+
+
+def status_line(status: int) -> str:
+    try:
+        return f"{status} {HTTPStatus(status).phrase}"
+    except ValueError:
+        raise AttributeError(f"Unknown status {status}")
 
 
 class Response:
     def __init__(self, status: int, body: Optional[str] = None, content_type: Optional[str] = None,
                  headers: Optional[Dict[str, str]] = None, cookies: Optional[Dict[str, str]] = None,
-                 json: Optional[Dict] = None):
+                 json: Optional[Dict] = None, template: Optional[str] = None, delay: float = 0.0,
+                 compress: Union[bool, Tuple[str, ...]] = False):
         if status == 204 and body is not None:
             raise AttributeError("status == 204 and body != None in one response")
 
@@ -16,13 +30,38 @@ class Response:
             raise AttributeError("Explicit Cookies and Cookies in headers in one response")
         if body is not None and json is not None:
             raise AttributeError("'body' and 'json' in one response")
+        if template is not None and (body is not None or json is not None):
+            raise AttributeError("'template' and 'body' or 'json' in one response")
+        if status == 204 and template is not None:
+            raise AttributeError("status == 204 and template != None in one response")
+        if compress and template is not None:
+            raise AttributeError("'template' and 'compress' in one response")
 
         if json is not None:
             content_type = content_type or "application/json"
             body = json_lib.dumps(json)
 
         self.status = status
+        self.status_line = status_line(status)
         self.body = body
         self.content_type = content_type
         self.headers = headers or {}
         self.cookies = cookies or {}
+        self.delay = delay
+        self.variant: Optional[int] = None
+        self.template: Optional[Template] = Template(template) if template is not None else None
+        self.header_templates: Dict[str, Template] = {
+            name: Template(value) for name, value in self.headers.items() if "{{" in value
+        } if template is not None else {}
+        encodings = ENCODINGS if compress is True else tuple(compress or ())
+        self.encoded_bodies: Dict[str, bytes] = precompress(body.encode("utf-8"), encodings) if body else {}
+        self.encodings: Tuple[str, ...] = tuple(self.encoded_bodies)
+
+    def render_body(self, request: Request) -> bytes:
+        return self.template.render(request)
+
+    def render_headers(self, request: Request) -> Dict[str, str]:
+        headers = dict(self.headers)
+        for name, header_template in self.header_templates.items():
+            headers[name] = header_template.render_str(request)
+        return headers
@@ -1,11 +1,45 @@
+import re
+from typing import Optional, Dict, Pattern
+
+
 class Route:
+    _path_param = re.compile(r"\{(?P<name>[^{}/]*)\}")
+
     def __init__(self, method: str, base_url: str, uri: str):
         self.method = method.lower()
         self.url = base_url + uri.rstrip("/")
         self._route_as_tuple = (self.method, self.url)
+        self.path_pattern: Optional[Pattern] = None
 
     def __hash__(self):
         return hash(self._route_as_tuple)
 
     def __eq__(self, other):
         return hash(self) == hash(other)
+
+    def match_path_params(self, route: "Route") -> Optional[Dict[str, str]]:
+        if self.path_pattern is None or self.method != route.method:
+            return None
+        match = self.path_pattern.fullmatch(route.url)
+        return match.groupdict() if match else None
+
+    def with_path_params(self) -> "Route":
+        if "{" in self.url:
+            self.path_pattern = self._compile_path_pattern(self.url)
+        return self
+
+    @classmethod
+    def _compile_path_pattern(cls, url: str) -> Pattern:
+        pattern = ""
+        position = 0
+        names = set()
+        for match in cls._path_param.finditer(url):
+            name = match.group("name")
+            if not name.isidentifier():
+                raise AttributeError(f"Path parameter name '{name}' in '{url}' is not a valid identifier")
+            if name in names:
+                raise AttributeError(f"Path parameter '{name}' is used more than once in '{url}'")
+            names.add(name)
+            pattern += re.escape(url[position:match.start()]) + f"(?P<{name}>[^/]+)"
+            position = match.end()
+        return re.compile(pattern + re.escape(url[position:]))
@@ -0,0 +1,60 @@
+import threading
+from typing import Any, Optional, Dict, Tuple
+from weakref import WeakKeyDictionary, WeakSet
+
+from py_fake_server.request import Request
+from py_fake_server.snapshot import Generation, Generations
+
+
+class Scenario:
+    def __init__(self, name: str, initial_state: str = "started",
+                 client_header: Optional[str] = None, client_cookie: Optional[str] = None,
+                 generations: Optional[Generations] = None):
+        if client_header and client_cookie:
+            raise AttributeError("'client_header' and 'client_cookie' in one scenario")
+
+        self.name = name
+        self.initial_state = initial_state
+        self._client_header = client_header.upper() if client_header else None
+        self._client_cookie = client_cookie
+        self._generations = generations or Generations()
+        self._states: "WeakKeyDictionary[Generation, Dict[Optional[str], str]]" = WeakKeyDictionary()
+        self._resets: "WeakSet[Generation]" = WeakSet()
+        self._lock = threading.RLock()
+
+    def client_key(self, request: Request) -> Optional[str]:
+        if self._client_header:
+            return request.headers.get(self._client_header)
+        if self._client_cookie:
+            return request.cookies.get(self._client_cookie)
+        return None
+
+    def state_of(self, client_key: Optional[str] = None) -> str:
+        for generation in self._generations.current.lineage():
+            states = self._states.get(generation)
+            if states is not None and client_key in states:
+                return states[client_key]
+            if generation in self._resets:
+                break
+        return self.initial_state
+
+    def move_to(self, client_key: Optional[str], state: str):
+        with self._lock:
+            self._states.setdefault(self._generations.current, {})[client_key] = state
+
+    def take_transition(self, client_key: Optional[str],
+                        transitions: Dict[str, Tuple[Any, Optional[str]]]) -> Optional[Tuple[str, Any]]:
+        with self._lock:
+            state = self.state_of(client_key)
+            transition = transitions.get(state)
+            if transition is None:
+                return None
+            response, next_state = transition
+            if next_state is not None:
+                self.move_to(client_key, next_state)
+            return state, response
+
+    def reset(self):
+        with self._lock:
+            self._states[self._generations.current] = {}
+            self._resets.add(self._generations.current)
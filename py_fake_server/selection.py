@@ -0,0 +1,80 @@
+import copy
+import random
+import threading
+from abc import ABCMeta, abstractmethod
+from typing import List, Optional, Tuple
+
+from py_fake_server.response import Response
+from py_fake_server.snapshot import Generations, GenerationalValue
+
+
+class Selection(metaclass=ABCMeta):
+    def __init__(self):
+        self.responses: List[Response] = []
+
+    def add(self, response: Response, weight: float):
+        response.variant = len(self.responses)
+        self.responses.append(response)
+
+    @abstractmethod
+    def choose(self) -> Response:
+        pass
+
+
+class RoundRobinSelection(Selection):
+    def __init__(self, generations: Optional[Generations] = None):
+        super().__init__()
+        self._counter = GenerationalValue(generations or Generations(), 0)
+        self._counter_lock = threading.Lock()
+
+    def choose(self) -> Response:
+        with self._counter_lock:
+            counter = self._counter.get()
+            self._counter.set(counter + 1)
+        return self.responses[counter % len(self.responses)]
+
+
+class WeightedSelection(Selection):
+    def __init__(self, seed: Optional[int] = None, generations: Optional[Generations] = None):
+        super().__init__()
+        self._weights: List[float] = []
+        self._rng = GenerationalValue(generations or Generations(), random.Random(seed))
+        self._rng_lock = threading.Lock()
+        self._table: Optional[Tuple[List[float], List[int]]] = None
+
+    def add(self, response: Response, weight: float):
+        if weight <= 0:
+            raise AttributeError("Weight should be greater than 0")
+        super().add(response, weight)
+        self._weights.append(weight)
+        self._table = None
+
+    def choose(self) -> Response:
+        table = self._table
+        if table is None:
+            table = self._table = self._build_alias_table(self._weights)
+        probabilities, aliases = table
+
+        with self._rng_lock:
+            position = self._rng.get_own(copy.copy).random() * len(probabilities)
+        index = int(position)
+        if position - index >= probabilities[index]:
+            index = aliases[index]
+        return self.responses[index]
+
+    @staticmethod
+    def _build_alias_table(weights: List[float]) -> Tuple[List[float], List[int]]:
+        size = len(weights)
+        total = sum(weights)
+        scaled = [weight * size / total for weight in weights]
+        probabilities = [1.0] * size
+        aliases = list(range(size))
+        small = [index for index, value in enumerate(scaled) if value < 1.0]
+        large = [index for index, value in enumerate(scaled) if value >= 1.0]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            probabilities[less] = scaled[less]
+            aliases[less] = more
+            scaled[more] -= 1.0 - scaled[less]
+            (small if scaled[more] < 1.0 else large).append(more)
+        return probabilities, aliases
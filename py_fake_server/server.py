@@ -1,85 +1,625 @@
-from typing import Optional, Dict, Union
-
-import falcon
-from falcon_multipart.middleware import MultipartMiddleware
-from webtest.http import StopableWSGIServer
+import time
+from array import array
+from bisect import bisect_left
+from typing import Any, Optional, Dict, Union, List, Tuple, Callable, TYPE_CHECKING
 
+from py_fake_server.backends import StatisticsBackend, MemoryBackend
+from py_fake_server.bodies import BodyStore
+from py_fake_server.clock import Clock, SYSTEM_CLOCK
+from py_fake_server.encoding import decompress, negotiate
+from py_fake_server.faults import FAULT_ENVIRON_KEY
+from py_fake_server.history import BaseRequestHistory
+from py_fake_server.limits import BaseLimit, RateLimit, ConcurrencyLimit
+from py_fake_server.profiler import PROFILE_ENVIRON_KEY, NULL_TRACE, RequestProfiler
+from py_fake_server.request import Request
+from py_fake_server.request_log import RequestLog
+from py_fake_server.response import Response, status_line
 from py_fake_server.route import Route
 from py_fake_server.endpoint import Endpoint
+from py_fake_server.scenario import Scenario
+from py_fake_server.snapshot import Generations, Snapshot
 from py_fake_server.statistic import Statistic
+from py_fake_server.timings import RouteTimings
+from py_fake_server.traffic import Traffic
+from py_fake_server.unmatched import RouteIndex, UnmatchedRoutes
+
+if TYPE_CHECKING:  # pragma: no cover
+    import falcon
+    from py_fake_server.http2_server import HTTP2Server
+    from py_fake_server.proxy import RequestBody, UpstreamPool
+    from py_fake_server.push import PushEndpoint, PushLoop, SSEEndpoint, WebSocketEndpoint
+    from py_fake_server.wsgi_server import FakeWSGIServer
 
 
-class FakeServer(falcon.API):
-    def __init__(self, host: str, port: int):
-        super().__init__(middleware=[MultipartMiddleware()])
-        self.req_options = self._get_request_options()
+class FakeServer:
+    def __init__(self, host: str, port: int, body_store: Optional[BodyStore] = None,
+                 statistics_backend: Optional[StatisticsBackend] = None, tls: bool = False,
+                 certfile: Optional[str] = None, keyfile: Optional[str] = None, http2: bool = False,
+                 max_concurrent_streams: int = 100, admin: bool = False, threads: int = 4,
+                 clock: Clock = SYSTEM_CLOCK):
+        if keyfile and not certfile:
+            raise AttributeError("'keyfile' without 'certfile'")
+
+        self._app: Optional["falcon.API"] = None
+        self._admin: bool = admin
         self._host: str = host
         self._port: int = port
-        self._server: Optional[StopableWSGIServer] = None
+        self._tls: bool = tls or certfile is not None
+        self.certfile: Optional[str] = certfile
+        self._keyfile: Optional[str] = keyfile
+        self._ssl_context = None
+        self._http2: bool = http2
+        self._max_concurrent_streams: int = max_concurrent_streams
+        self._threads: int = threads
+        self.clock: Clock = clock
+        self._statistics_backend: StatisticsBackend = statistics_backend or MemoryBackend(body_store)
+        self._server: Optional[Union["FakeWSGIServer", "HTTP2Server"]] = None
         self._endpoints: Dict[Route, Endpoint] = {}
+        self._endpoints_with_path_params: List[Endpoint] = []
+        self._push_endpoints: Dict[Route, "PushEndpoint"] = {}
+        self._push_received: Dict[Route, Statistic] = {}
+        self._push_loop: Optional["PushLoop"] = None
         self._statistics: Dict[Route, Statistic] = {}
-        self.add_sink(self._handle_all)
+        self._statistics_base: Dict[Route, Tuple[BaseRequestHistory, int, int, Dict[int, int]]] = {}
+        self.request_log = RequestLog(clock=clock)
+        self._scenarios: Dict[str, Scenario] = {}
+        self._limits: List[BaseLimit] = []
+        self._generations = Generations()
+        self._shared = False
+        self.timings = RouteTimings()
+        self.traffic = Traffic()
+        self._unmatched = UnmatchedRoutes()
+        self._unmatched_status: str = status_line(500)
+        self._unmatched_code: int = 500
+        self._record_unmatched: bool = True
+        self._route_index: Optional[RouteIndex] = None
+        self._upstream: Optional["UpstreamPool"] = None
+        self.profiler: Optional[RequestProfiler] = None
 
-    @staticmethod
-    def _get_request_options():
-        options = falcon.RequestOptions()
-        options.auto_parse_qs_csv = False
-        return options
+    @property
+    def app(self) -> "falcon.API":
+        if self._app is None:
+            self._app = self._create_app()
+        return self._app
+
+    def _create_app(self) -> "falcon.API":
+        import falcon
+        from py_fake_server.multipart import LazyMultipartMiddleware
+
+        app = falcon.API(middleware=[LazyMultipartMiddleware()])
+        app.req_options.auto_parse_qs_csv = False
+        app.add_sink(self._handle_all)
+        if self._admin:
+            from py_fake_server.admin import add_admin_routes
+            add_admin_routes(self, app, max_streams=max(1, self._threads // 2))
+        return app
+
+    def __call__(self, environ: dict, start_response: Callable):
+        profiler = self.profiler
+        trace = profiler.trace() if profiler is not None else None
+        if trace is None:
+            return self.app(environ, start_response)
+        environ[PROFILE_ENVIRON_KEY] = trace
+        return profiler.wrap(self.app(environ, start_response), trace)
 
-    def _handle_all(self, request: falcon.Request, response: falcon.Response):
+    def _handle_all(self, request: "falcon.Request", response: "falcon.Response"):
+        started_at = time.perf_counter()
+        trace = request.env.get(PROFILE_ENVIRON_KEY, NULL_TRACE)
+        trace.mark("dispatch")
+        trace.name(request.method, request.path)
         route = Route(request.method, self.base_uri, request.path)
-        endpoint = self._endpoints.get(route, Endpoint(route))
+        endpoint = self._endpoints.get(route)
+        path_params = None
+        if endpoint is None and self._endpoints_with_path_params:
+            endpoint, path_params = self._find_endpoint_with_path_params(route)
+        if endpoint is None and not self._record_unmatched and self._upstream is None \
+                and route not in self._push_endpoints:
+            trace.mark("match")
+            self._reject_unmatched(response, route)
+            trace.mark("response")
+            return
 
-        self._set_response_attributes_from_endpoint(response, endpoint)
-        self._update_statistics(request, route)
+        captured_request = Request(request, read_body=endpoint is not None or self._upstream is None
+                                   or route in self._push_endpoints)
+        if path_params is not None:
+            captured_request.path_params = path_params
+        trace.mark("capture")
+        responder = endpoint.responder(captured_request) if endpoint is not None else None
+        trace.mark("match")
+
+        limits = self._limits + responder.all_limits if responder is not None and responder.all_limits \
+            else self._limits
+        rejected_by = self._acquire_limits(limits)
+        trace.mark("limits")
+        if rejected_by is not None:
+            self._set_response_attributes(response, rejected_by.rejection, captured_request)
+            trace.mark("response")
+            self._update_statistics(captured_request, route, rejected_by.rejection.status, rejected=True)
+            self.timings.record(route, time.perf_counter() - started_at)
+            trace.mark("statistics")
+            return
+
+        try:
+            if endpoint is None:
+                push_endpoint = self._push_endpoints.get(route) if self._push_endpoints else None
+                if push_endpoint is not None:
+                    status = self._accept_push(push_endpoint, request, response, captured_request)
+                    trace.mark("response")
+                elif self._upstream is not None:
+                    status = self._forward_unmatched(request, response, captured_request)
+                    trace.mark("proxy")
+                else:
+                    status = self._reject_unmatched(response, route)
+                    trace.mark("response")
+                self._update_statistics(captured_request, route, status)
+                self.timings.record(route, time.perf_counter() - started_at)
+                trace.mark("statistics")
+                return
+
+            recorded_response, fault = responder.respond(captured_request)
+            self._set_response_attributes(response, recorded_response, captured_request)
+            if fault is not None:
+                request.env[FAULT_ENVIRON_KEY] = fault
+            trace.mark("response")
+            self._update_statistics(captured_request, route, recorded_response.status,
+                                    variant=recorded_response.variant)
+            self.timings.record(route, time.perf_counter() - started_at)
+            trace.mark("statistics")
+        finally:
+            for limit in limits:
+                limit.release()
 
     @staticmethod
-    def _set_response_attributes_from_endpoint(response: falcon.Response, endpoint: Endpoint):
-        recorded_response = endpoint.pop_response()
+    def _acquire_limits(limits: List[BaseLimit]) -> Optional[BaseLimit]:
+        for index, limit in enumerate(limits):
+            if not limit.acquire():
+                for acquired_limit in limits[:index]:
+                    acquired_limit.release()
+                return limit
+        return None
+
+    def _find_endpoint_with_path_params(self, route: Route) -> Tuple[Optional[Endpoint], Optional[Dict[str, str]]]:
+        for endpoint in self._endpoints_with_path_params:
+            path_params = endpoint.route.match_path_params(route)
+            if path_params is not None:
+                return endpoint, path_params
+        return None, None
+
+    @staticmethod
+    def _read_forwarded_body(request: "falcon.Request", body: Optional["RequestBody"]) -> bytes:
+        if body is None:
+            return b""
+        return decompress(body.read_all(), request.get_header("Content-Encoding"))
+
+    def _reject_unmatched(self, response: "falcon.Response", route: Route) -> int:
+        response.status = self._unmatched_status
+        response.content_type = "text/plain"
+        response.data = self._unmatched.record(route)
+        return self._unmatched_code
 
-        response.status = getattr(falcon, f"HTTP_{recorded_response.status}")
-        response.body = recorded_response.body
+    def _forward_unmatched(self, request: "falcon.Request", response: "falcon.Response",
+                           captured_request: Request) -> int:
+        from py_fake_server.proxy import RequestBody, UpstreamError
+
+        path = f"{request.path}?{request.query_string}" if request.query_string else request.path
+        body = None
+        if request.content_length is not None or request.get_header("Transfer-Encoding"):
+            body = RequestBody(request.bounded_stream, request.content_length)
+        try:
+            status, headers, length, stream = self._upstream.forward(
+                request.method, path, captured_request.headers, body,
+            )
+        except UpstreamError as error:
+            captured_request.body = self._read_forwarded_body(request, body)
+            response.status = status_line(502)
+            response.content_type = "text/plain"
+            response.body = str(error)
+            return 502
+
+        captured_request.body = self._read_forwarded_body(request, body)
+        response.status = status
+        response.set_headers(headers)
+        response.stream = stream
+        response.stream_len = length
+        return int(status[:3])
+
+    def _accept_push(self, endpoint: "PushEndpoint", request: "falcon.Request", response: "falcon.Response",
+                     captured_request: Request) -> int:
+        from py_fake_server.push import Handoff
+
+        head = endpoint.handshake(captured_request)
+        if head is None:
+            response.status = status_line(400)
+            response.content_type = "text/plain"
+            response.body = f"Expected a WebSocket handshake for [GET] {endpoint.route.url}"
+            return 400
+
+        received = self.received_over_websocket(endpoint.route.url[len(self.base_uri):])
+        protocol_factory = self._push_loop.protocol_factory(endpoint, captured_request, received)
+        request.env[FAULT_ENVIRON_KEY] = Handoff(head, lambda sock: self._push_loop.adopt(sock, protocol_factory))
+        response.status = status_line(endpoint.status)
+        return endpoint.status
+
+    def _set_response_attributes(self, response: "falcon.Response", recorded_response: Response, request: Request):
+        if recorded_response.delay:
+            self.clock.sleep(recorded_response.delay)
+
+        response.status = recorded_response.status_line
+        if recorded_response.template is not None:
+            response.data = recorded_response.render_body(request)
+            headers = recorded_response.render_headers(request)
+        elif recorded_response.encodings:
+            encoding = negotiate(request.headers.get("ACCEPT-ENCODING", ""), recorded_response.encodings)
+            if encoding is not None:
+                response.data = recorded_response.encoded_bodies[encoding]
+                response.set_header("Content-Encoding", encoding)
+            else:
+                response.body = recorded_response.body
+            response.set_header("Vary", "Accept-Encoding")
+            headers = recorded_response.headers
+        else:
+            response.body = recorded_response.body
+            headers = recorded_response.headers
         if recorded_response.content_type:
             response.content_type = recorded_response.content_type
-        for header_name, header_value in recorded_response.headers.items():
+        for header_name, header_value in headers.items():
             response.set_header(header_name, header_value)
         for cookie_name, cookie_value in recorded_response.cookies.items():
             response.set_cookie(cookie_name, cookie_value)
 
-    def _update_statistics(self, request: falcon.Request, route: Route):
-        self._statistics.setdefault(route, Statistic(route.method, route.url))
+    def _update_statistics(self, request: Request, route: Route, status: int, rejected: bool = False,
+                           variant: Optional[int] = None):
+        statistic = self._get_statistic(route)
+        sequence, timestamp = self.request_log.record(route)
+        statistic.record_request(request, status, rejected, sequence, timestamp, variant)
+        self.traffic.record(route, status, len(request.body), rejected)
+
+    def _get_statistic(self, route: Route) -> Statistic:
         statistic = self._statistics.get(route)
-        statistic.record_request(request)
+        if statistic is None:
+            base = self._statistics_base.get(route)
+            if base is not None:
+                base_history, length, rejected_times, variant_hits = base
+                statistic = Statistic(route.method, route.url, history=base_history.fork(length))
+                statistic.rejected_times = rejected_times
+                statistic.variant_hits = dict(variant_hits)
+            else:
+                history = self._statistics_backend.history(route.method, route.url)
+                statistic = Statistic(route.method, route.url, history=history)
+            statistic = self._statistics.setdefault(route, statistic)
+        return statistic
 
     @property
     def base_uri(self):
-        return f"http://{self._host}:{self._port}"
+        scheme = "https" if self._tls else "http"
+        return f"{scheme}://{self._host}:{self._port}"
 
     def start(self):
-        self._server = StopableWSGIServer.create(self, host=self._host, port=self._port)
+        from py_fake_server.wsgi_server import FakeWSGIServer
+
+        if self._tls and self._ssl_context is None:
+            from py_fake_server.tls import certificate_for, server_context
+            self.certfile = self.certfile or certificate_for(self._host)
+            self._ssl_context = server_context(self.certfile, self._keyfile)
+        if self._http2:
+            from py_fake_server.http2_server import HTTP2Server
+            self._server = HTTP2Server.create(self, host=self._host, port=self._port, ssl_context=self._ssl_context,
+                                              max_concurrent_streams=self._max_concurrent_streams)
+        else:
+            self._server = FakeWSGIServer.create(self, host=self._host, port=self._port,
+                                                 ssl_context=self._ssl_context, threads=self._threads)
+        self._port = self._server.effective_port
 
     def stop(self):
         self._server.shutdown()
+        if self._push_loop is not None:
+            self._push_loop.stop()
+        self._set_upstream(None)
+        self._statistics_backend.flush()
 
     def clear(self):
         self._endpoints = {}
+        self._endpoints_with_path_params = []
         self._statistics = {}
+        self._statistics_base = {}
+        self._clear_push()
+        self.request_log = RequestLog(clock=self.clock)
+        self._scenarios = {}
+        self._limits = []
+        self._generations = Generations()
+        self._shared = False
+        self.timings.clear()
+        self.traffic.clear()
+        self._unmatched = UnmatchedRoutes()
+        self._unmatched_status = status_line(500)
+        self._unmatched_code = 500
+        self._record_unmatched = True
+        self._set_upstream(None)
+        self._route_index = None
+        self._statistics_backend.clear()
+
+    def snapshot(self) -> Snapshot:
+        self._check_snapshots_supported()
+        statistics = dict(self._statistics_base)
+        for route, statistic in list(self._statistics.items()):
+            statistics[route] = (statistic.requests, len(statistic.requests), statistic.rejected_times,
+                                 dict(statistic.variant_hits))
+        for endpoint in self._endpoints.values():
+            endpoint.freeze()
+        for push_endpoint in self._push_endpoints.values():
+            push_endpoint.freeze()
+        self._shared = True
+        return Snapshot(
+            generation=self._generations.freeze(),
+            endpoints=self._endpoints,
+            endpoints_with_path_params=self._endpoints_with_path_params,
+            push_endpoints=dict(self._push_endpoints),
+            scenarios=self._scenarios,
+            limits=self._limits,
+            statistics=statistics,
+            request_log=self.request_log.fork(),
+            unmatched=self._unmatched.copy(),
+            unmatched_settings=(self._unmatched_status, self._unmatched_code, self._record_unmatched, self._upstream),
+            traffic=self.traffic.copy(),
+        )
+
+    def restore(self, snapshot: Snapshot) -> "FakeServer":
+        self._check_snapshots_supported()
+        self._generations.restore(snapshot.generation)
+        self._endpoints = snapshot.endpoints
+        self._endpoints_with_path_params = snapshot.endpoints_with_path_params
+        self._clear_push()
+        self._push_endpoints = dict(snapshot.push_endpoints)
+        self._scenarios = snapshot.scenarios
+        self._limits = snapshot.limits
+        self._statistics = {}
+        self._statistics_base = snapshot.statistics
+        self.request_log = snapshot.request_log.fork()
+        self._unmatched = snapshot.unmatched.copy()
+        self._unmatched_status, self._unmatched_code, self._record_unmatched, upstream = snapshot.unmatched_settings
+        if upstream is not self._upstream:
+            self._set_upstream(upstream)
+        self.traffic = snapshot.traffic.copy()
+        self._route_index = None
+        self._shared = True
+        return self
+
+    def _check_snapshots_supported(self):
+        if not self._statistics_backend.supports_snapshots:
+            raise AttributeError(f"{type(self._statistics_backend).__name__} does not support snapshots")
+
+    def _unshare(self):
+        if self._shared:
+            self._endpoints = dict(self._endpoints)
+            self._scenarios = dict(self._scenarios)
+            self._shared = False
 
     def on_(self, method: str, url: str) -> Endpoint:
-        route = Route(method, self.base_uri, url)
-        new_endpoint = Endpoint(route)
+        route = Route(method, self.base_uri, url).with_path_params()
+        new_endpoint = Endpoint(route, generations=self._generations, clock=self.clock)
+        self._unshare()
+        self._route_index = None
         self._endpoints[route] = new_endpoint
+        if route.path_pattern is not None:
+            self._endpoints_with_path_params = [
+                endpoint for endpoint in self._endpoints_with_path_params if endpoint.route != route
+            ] + [new_endpoint]
         return new_endpoint
 
+    def on_websocket(self, url: str) -> "WebSocketEndpoint":
+        from py_fake_server.push import WebSocketEndpoint
+        return self._add_push_endpoint(WebSocketEndpoint(Route("get", self.base_uri, url)))
+
+    def on_sse(self, url: str) -> "SSEEndpoint":
+        from py_fake_server.push import SSEEndpoint
+        return self._add_push_endpoint(SSEEndpoint(Route("get", self.base_uri, url)))
+
+    def _add_push_endpoint(self, endpoint: "PushEndpoint") -> "PushEndpoint":
+        if self._tls or self._http2:
+            raise AttributeError("WebSocket and SSE endpoints are served over plain HTTP/1.1 only")
+
+        if self._push_loop is None:
+            from py_fake_server.push import PushLoop
+            self._push_loop = PushLoop()
+        self._push_endpoints[endpoint.route] = endpoint
+        self._push_received.pop(endpoint.route, None)
+        return endpoint
+
+    def received_over_websocket(self, url: str) -> Statistic:
+        route = Route("get", self.base_uri, url)
+        statistic = self._push_received.get(route)
+        if statistic is None:
+            statistic = self._push_received.setdefault(route, Statistic("ws", route.url))
+        return statistic
+
+    def _clear_push(self):
+        self._push_endpoints = {}
+        self._push_received = {}
+        if self._push_loop is not None:
+            self._push_loop.close_connections()
+
+    def unmatched(self, status: int = 500, max_routes: int = 1000, proxy_to: Optional[str] = None,
+                  max_connections: int = 10, record: bool = True) -> "FakeServer":
+        try:
+            self._unmatched_status = status_line(status)
+        except AttributeError:
+            raise AttributeError(f"Unknown status {status} for unmatched requests")
+        self._unmatched_code = status
+        self._unmatched.max_routes = max_routes
+        self._record_unmatched = record
+        if proxy_to is not None:
+            from py_fake_server.proxy import UpstreamPool
+            self._set_upstream(UpstreamPool(proxy_to, max_connections))
+        else:
+            self._set_upstream(None)
+        return self
+
+    def _set_upstream(self, upstream: Optional["UpstreamPool"]):
+        if self._upstream is not None:
+            self._upstream.close()
+        self._upstream = upstream
+
+    def unmatched_routes(self) -> List[Tuple[Route, int, List[Route]]]:
+        if self._route_index is None:
+            self._route_index = RouteIndex(self._endpoints.keys())
+        return [(route, count, self._route_index.closest(route)) for route, count in self._unmatched.most_common()]
+
+    def report(self) -> Dict[str, Any]:
+        traffic = self.traffic.items()
+        timings = dict(self.timings.items())
+        routes = []
+        statuses: Dict[str, int] = {}
+        for route, route_traffic in sorted(traffic, key=lambda item: item[1].requests, reverse=True):
+            timing = timings.get((route.method.upper(), route.url))
+            routes.append({
+                "method": route.method.upper(),
+                "url": route.url,
+                **route_traffic.to_dict(),
+                "mean_seconds": timing.mean if timing is not None else 0.0,
+                "slowest_seconds": timing.slowest if timing is not None else 0.0,
+            })
+            for status, count in route_traffic.statuses.items():
+                statuses[str(status)] = statuses.get(str(status), 0) + count
+
+        requested = {route for route, _ in traffic}
+        patterns = [route for route in self._endpoints if route.path_pattern is not None]
+        hit_patterns = {pattern for pattern in patterns
+                        if any(pattern.match_path_params(route) is not None for route in requested)}
+        never_hit = [
+            route for route in list(self._endpoints) + list(self._push_endpoints)
+            if route not in requested and route not in hit_patterns
+        ]
+        return {
+            "requests": sum(route["requests"] for route in routes),
+            "statuses": dict(sorted(statuses.items())),
+            "routes": routes,
+            "unmatched": [
+                {"method": route.method.upper(), "url": route.url, "requests": count,
+                 "closest": [f"[{endpoint.method.upper()}] {endpoint.url}" for endpoint in closest]}
+                for route, count, closest in self.unmatched_routes()
+            ],
+            "unmatched_overflow": self._unmatched.overflow,
+            "never_hit": [{"method": route.method.upper(), "url": route.url} for route in never_hit],
+        }
+
+    def start_profiling(self, sample_every: int = 1) -> RequestProfiler:
+        self.stop_profiling()
+        self.profiler = RequestProfiler(sample_every)
+        return self.profiler
+
+    def stop_profiling(self) -> Optional[RequestProfiler]:
+        profiler = self.profiler
+        if profiler is not None:
+            profiler.stop()
+        return profiler
+
+    def replace_endpoints(self, define: Callable[["FakeServer"], None]) -> "FakeServer":
+        staging = self._staging()
+        define(staging)
+        return self._publish(staging)
+
+    def add_endpoints(self, define: Callable[["FakeServer"], None]) -> "FakeServer":
+        staging = self._staging()
+        staging._endpoints = dict(self._endpoints)
+        staging._endpoints_with_path_params = list(self._endpoints_with_path_params)
+        staging._push_endpoints = dict(self._push_endpoints)
+        staging._scenarios = dict(self._scenarios)
+        define(staging)
+        return self._publish(staging)
+
+    def _staging(self) -> "FakeServer":
+        staging = FakeServer(self._host, self._port, statistics_backend=self._statistics_backend, clock=self.clock)
+        staging._generations = self._generations
+        staging._tls, staging._http2, staging._push_loop = self._tls, self._http2, self._push_loop
+        return staging
+
+    def _publish(self, staging: "FakeServer") -> "FakeServer":
+        self._endpoints = staging._endpoints
+        self._endpoints_with_path_params = staging._endpoints_with_path_params
+        self._push_endpoints = staging._push_endpoints
+        self._push_loop = staging._push_loop
+        self._scenarios = staging._scenarios
+        self._route_index = None
+        self._shared = False
+        return self
+
+    def rate_limit(self, rate: float, burst: Optional[int] = None, status: int = 429,
+                   queue_timeout: float = 0.0) -> "FakeServer":
+        self._limits = self._limits + [RateLimit(rate, burst, status, queue_timeout, self.clock, self._generations)]
+        return self
+
+    def max_concurrency(self, limit: int, status: int = 503, queue_timeout: float = 0.0) -> "FakeServer":
+        self._limits = self._limits + [ConcurrencyLimit(limit, status, queue_timeout)]
+        return self
+
+    def scenario(self, name: str, initial_state: str = "started",
+                 client_header: Optional[str] = None, client_cookie: Optional[str] = None) -> Scenario:
+        if name not in self._scenarios:
+            self._unshare()
+            self._scenarios[name] = Scenario(name, initial_state, client_header, client_cookie, self._generations)
+        return self._scenarios[name]
+
     def was_requested(self, method: str, url: str) -> Statistic:
         route = Route(method, self.base_uri, url)
-        self._statistics.setdefault(route, Statistic(route.method, route.url))
-        return self._statistics.get(route)
+        return self._get_statistic(route)
+
+    def requested_in_order(self, *routes: Tuple[str, str]) -> bool:
+        expected_routes = [Route(method, self.base_uri, url) for method, url in routes]
+        index = self.request_log.first_out_of_order(expected_routes)
+        if index == -1:
+            return True
+
+        expected_order = "\n".join(f"[{route.method.upper()}] {route.url}" for route in expected_routes)
+        missed_route = expected_routes[index]
+        error_message = f"Expect that server was requested in order:\n{expected_order}.\n" \
+                        f"But [{missed_route.method.upper()}] {missed_route.url} was not requested"
+        if index:
+            previous_route = expected_routes[index - 1]
+            error_message += f" after [{previous_route.method.upper()}] {previous_route.url}"
+        raise AssertionError(error_message + ".")
+
+    def all_requests_matched(self) -> bool:
+        unmatched_routes = self.unmatched_routes()
+        if not unmatched_routes and not self._unmatched.overflow:
+            return True
+
+        error_message = "Expect that all requests matched endpoints."
+        for route, count, closest_routes in unmatched_routes:
+            error_message += f"\nBut [{route.method.upper()}] {route.url} was requested {count} times."
+            if closest_routes:
+                error_message += " Closest endpoints: " + ", ".join(
+                    f"[{closest.method.upper()}] {closest.url}" for closest in closest_routes
+                ) + "."
+        if self._unmatched.overflow:
+            error_message += f"\nAnd {self._unmatched.overflow} requests to other routes."
+        raise AssertionError(error_message)
+
+    def requests_since(self, sequence: int, limit: Optional[int] = None) -> List[list]:
+        request_log = self.request_log
+        end = len(request_log) if limit is None else min(len(request_log), sequence + limit)
+        base_uri_length = len(self.base_uri)
+        columns: Dict[Route, Tuple[array, array]] = {}
+        rows = []
+        for number in range(sequence + 1, end + 1):
+            route = request_log.routes[number - 1]
+            if route not in columns:
+                history = self._get_statistic(route).requests
+                columns[route] = (history.sequences, history.statuses)
+            sequences, statuses = columns[route]
+            position = bisect_left(sequences, number)
+            if position >= len(sequences) or sequences[position] != number:
+                try:
+                    position = sequences.index(number)
+                except ValueError:
+                    break
+            rows.append([
+                number, round(request_log.timestamps[number - 1], 6), route.method.upper(),
+                route.url[base_uri_length:], statuses[position],
+            ])
+        return rows
 
     def was_not_requested(self, method: str, url: str) -> Statistic:
-        route = Route(method, self.base_uri, url)
-        self._statistics.setdefault(route, Statistic(route.method, route.url))
-        statistic: Statistic = self._statistics.get(route)
+        statistic = self._get_statistic(Route(method, self.base_uri, url))
         statistic.exactly_0_times()
         return statistic
 
@@ -0,0 +1,81 @@
+from typing import Optional, Dict, List, Tuple, Iterator, Any, Callable
+from weakref import WeakKeyDictionary
+
+
+class Generation:
+    __slots__ = ("parent", "__weakref__")
+
+    def __init__(self, parent: Optional["Generation"] = None):
+        self.parent = parent
+
+    def lineage(self) -> Iterator["Generation"]:
+        generation = self
+        while generation is not None:
+            yield generation
+            generation = generation.parent
+
+
+class Generations:
+    def __init__(self):
+        self.current = Generation()
+
+    def freeze(self) -> Generation:
+        frozen = self.current
+        self.current = Generation(frozen)
+        return frozen
+
+    def restore(self, frozen: Generation):
+        self.current = Generation(frozen)
+
+
+class GenerationalValue:
+    def __init__(self, generations: Generations, default: Any):
+        self._generations = generations
+        self._default = default
+        self._values: "WeakKeyDictionary[Generation, Any]" = WeakKeyDictionary()
+
+    def get(self) -> Any:
+        for generation in self._generations.current.lineage():
+            value = self._values.get(generation)
+            if value is not None:
+                return value
+        return self._default
+
+    def set(self, value: Any):
+        self._values[self._generations.current] = value
+
+    def get_own(self, copy: Callable[[Any], Any]) -> Any:
+        current = self._generations.current
+        value = self._values.get(current)
+        if value is None:
+            value = self._values[current] = copy(self.get())
+        return value
+
+
+class Freezable:
+    _frozen: bool = False
+
+    def freeze(self):
+        self._frozen = True
+
+    def _check_not_frozen(self):
+        if self._frozen:
+            raise AttributeError(f"[{self.route.method.upper()}] {self.route.url} belongs to a snapshot, "
+                                 f"define it again to change it")
+
+
+class Snapshot:
+    def __init__(self, generation: Generation, endpoints: Dict, endpoints_with_path_params: List, push_endpoints: Dict,
+                 scenarios: Dict, limits: List, statistics: Dict[Any, Tuple[Any, int, int, Dict[int, int]]],
+                 request_log: Any, unmatched: Any, unmatched_settings: Tuple[str, int, bool, Any], traffic: Any):
+        self.generation = generation
+        self.endpoints = endpoints
+        self.endpoints_with_path_params = endpoints_with_path_params
+        self.push_endpoints = push_endpoints
+        self.scenarios = scenarios
+        self.limits = limits
+        self.statistics = statistics
+        self.request_log = request_log
+        self.unmatched = unmatched
+        self.unmatched_settings = unmatched_settings
+        self.traffic = traffic
@@ -0,0 +1,212 @@
+import json
+import pickle
+import queue
+import sqlite3
+import threading
+import time
+from array import array
+from typing import Optional, Dict, List, Tuple, Iterable
+
+from py_fake_server.backends import StatisticsBackend
+from py_fake_server.history import BaseRequestHistory
+from py_fake_server.request import Request
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS routes (
+    id INTEGER PRIMARY KEY,
+    method TEXT NOT NULL,
+    url TEXT NOT NULL,
+    UNIQUE (method, url)
+);
+CREATE TABLE IF NOT EXISTS requests (
+    route_id INTEGER NOT NULL,
+    generation INTEGER NOT NULL,
+    number INTEGER NOT NULL,
+    sequence INTEGER NOT NULL,
+    timestamp REAL NOT NULL,
+    status INTEGER NOT NULL,
+    rejected INTEGER NOT NULL,
+    content_type TEXT,
+    body BLOB NOT NULL,
+    cookies TEXT NOT NULL,
+    headers TEXT NOT NULL,
+    query_params TEXT NOT NULL,
+    files BLOB,
+    PRIMARY KEY (route_id, generation, number)
+);
+CREATE INDEX IF NOT EXISTS requests_sequence ON requests (sequence);
+CREATE TABLE IF NOT EXISTS request_headers (
+    route_id INTEGER NOT NULL,
+    generation INTEGER NOT NULL,
+    number INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    value TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS request_headers_value ON request_headers (name, value, route_id, generation);
+"""
+
+
+class SQLiteBackend(StatisticsBackend):
+    def __init__(self, path: str, indexed_headers: Iterable[str] = (), batch_size: int = 1000):
+        self.path = path
+        self.indexed_headers = [header_name.upper() for header_name in indexed_headers]
+        self.batch_size = batch_size
+        self._route_ids: Dict[Tuple[str, str], int] = {}
+        self._queue: "queue.Queue[Optional[tuple]]" = queue.Queue()
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript(_SCHEMA)
+        (self._generation,), = self._connection.execute("SELECT COALESCE(MAX(generation), 0) FROM requests")
+        self.write_errors: List[Exception] = []
+        self._lock = threading.Lock()
+        self._writer = threading.Thread(target=self._write_batches, daemon=True)
+        self._writer.start()
+
+    def history(self, method: str, url: str) -> "SQLiteRequestHistory":
+        return SQLiteRequestHistory(self, self._route_id(method, url), self._generation)
+
+    def put(self, row: tuple):
+        self._queue.put(row)
+
+    def fetch(self, sql: str, parameters: tuple = ()) -> List[tuple]:
+        self.flush()
+        with self._lock:
+            return self._connection.execute(sql, parameters).fetchall()
+
+    def flush(self):
+        self._queue.join()
+
+    def clear(self):
+        self.flush()
+        with self._lock:
+            self._generation += 1
+            self._connection.execute("DELETE FROM requests")
+            self._connection.execute("DELETE FROM request_headers")
+
+    def close(self):
+        if self._writer.is_alive():
+            self._queue.put(None)
+            self._writer.join()
+        self._connection.close()
+
+    def _route_id(self, method: str, url: str) -> int:
+        route_id = self._route_ids.get((method, url))
+        if route_id is None:
+            with self._lock:
+                self._connection.execute("INSERT OR IGNORE INTO routes (method, url) VALUES (?, ?)", (method, url))
+                route_id, = self._connection.execute("SELECT id FROM routes WHERE method = ? AND url = ?",
+                                                     (method, url)).fetchone()
+            self._route_ids[(method, url)] = route_id
+        return route_id
+
+    def _write_batches(self):
+        connection = sqlite3.connect(self.path, isolation_level=None)
+        stopped = False
+        while not stopped:
+            batch = [self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            rows = [row for row in batch if row is not None]
+            stopped = len(rows) != len(batch)
+            try:
+                self._write(connection, rows)
+            except Exception as error:
+                if connection.in_transaction:
+                    connection.execute("ROLLBACK")
+                self.write_errors.append(error)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+        connection.close()
+
+    def _write(self, connection: sqlite3.Connection, rows: List[tuple]):
+        header_rows = [
+            (row[0], row[1], row[2], header_name, header_value)
+            for row in rows
+            for header_name, header_value in json.loads(row[10]).items()
+            if header_name in self.indexed_headers
+        ]
+        connection.execute("BEGIN")
+        connection.executemany("INSERT INTO requests VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+        connection.executemany("INSERT INTO request_headers VALUES (?, ?, ?, ?, ?)", header_rows)
+        connection.execute("COMMIT")
+
+
+class SQLiteRequestHistory(BaseRequestHistory):
+    def __init__(self, backend: SQLiteBackend, route_id: int, generation: int):
+        self._backend = backend
+        self._route_id = route_id
+        self._generation = generation
+        (self._count,), = backend.fetch("SELECT COUNT(*) FROM requests WHERE route_id = ? AND generation = ?",
+                                        (route_id, generation))
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, request: Request, status: int = 0, rejected: bool = False,
+               sequence: int = 0, timestamp: Optional[float] = None) -> int:
+        with self._lock:
+            self._count += 1
+            number = self._count
+            self._backend.put((
+                self._route_id, self._generation, number, sequence,
+                time.perf_counter() if timestamp is None else timestamp,
+                status, rejected, request.content_type, request.body,
+                json.dumps(request.cookies or {}), json.dumps(request.headers or {}),
+                json.dumps(request.query_params or {}, default=str),
+                pickle.dumps(request.files) if request.files else None,
+            ))
+        return number
+
+    def _get(self, index: int) -> Request:
+        number = index + 1
+        sequence, content_type, cookies, headers, query_params, files = self._backend.fetch(
+            "SELECT sequence, content_type, cookies, headers, query_params, files FROM requests "
+            "WHERE route_id = ? AND generation = ? AND number = ?", (self._route_id, self._generation, number))[0]
+        return Request.from_record(
+            number=number,
+            sequence=sequence,
+            load_body=lambda: self._fetch_body(number),
+            content_type=content_type,
+            cookies=json.loads(cookies),
+            headers=json.loads(headers),
+            query_params=json.loads(query_params),
+            files=pickle.loads(files) if files else None,
+        )
+
+    @property
+    def timestamps(self) -> array:
+        return array("d", self._fetch_column("timestamp"))
+
+    @property
+    def sequences(self) -> array:
+        return array("Q", self._fetch_column("sequence"))
+
+    @property
+    def statuses(self) -> array:
+        return array("H", self._fetch_column("status"))
+
+    @property
+    def rejected(self) -> bytearray:
+        return bytearray(self._fetch_column("rejected"))
+
+    def numbers_with_header(self, name: str, value: str) -> List[int]:
+        rows = self._backend.fetch("SELECT number FROM request_headers WHERE name = ? AND value = ? "
+                                   "AND route_id = ? AND generation = ? ORDER BY number",
+                                   (name.upper(), value, self._route_id, self._generation))
+        return [number for number, in rows]
+
+    def _fetch_body(self, number: int) -> bytes:
+        body, = self._backend.fetch("SELECT body FROM requests WHERE route_id = ? AND generation = ? AND number = ?",
+                                    (self._route_id, self._generation, number))[0]
+        return bytes(body)
+
+    def _fetch_column(self, column: str) -> List:
+        rows = self._backend.fetch(f"SELECT {column} FROM requests WHERE route_id = ? AND generation = ? "
+                                   f"ORDER BY number", (self._route_id, self._generation))
+        return [value for value, in rows]
@@ -1,8 +1,8 @@
 import re
 from typing import Optional, List, Callable, Dict
 
-import falcon
-
+from py_fake_server.bodies import BodyStore
+from py_fake_server.history import BaseRequestHistory, RequestHistory
 from py_fake_server.request import Request
 from py_fake_server.validators import (
     WithQueryParams, WithCookies, WithBody, WithJson,
@@ -11,17 +11,24 @@ from py_fake_server.validators import (
 
 
 class Statistic:
-    def __init__(self, method: str, url: str):
+    def __init__(self, method: str, url: str, body_store: Optional[BodyStore] = None,
+                 history: Optional[BaseRequestHistory] = None):
         self.method: str = method
         self.url: str = url
-        self.requests: List[Request] = []
+        self.requests = history if history is not None else RequestHistory(body_store)
+        self.rejected_times: int = 0
+        self.variant_hits: Dict[int, int] = {}
         self._current_request_index: Optional[int] = None
         self._number_of_requests_not_specify: bool = True
         self._error_messages: List[str] = [f"Expect that server was requested with [{method.upper()}] {url}."]
 
-    def record_request(self, request: falcon.Request):
-        request_number = self.requested_times + 1
-        self.requests.append(Request(request, request_number))
+    def record_request(self, request: Request, status: int = 0, rejected: bool = False,
+                       sequence: int = 0, timestamp: Optional[float] = None, variant: Optional[int] = None):
+        request.number = self.requests.append(request, status, rejected, sequence, timestamp)
+        if rejected:
+            self.rejected_times += 1
+        if variant is not None:
+            self.variant_hits[variant] = self.variant_hits.get(variant, 0) + 1
 
     @property
     def requested_times(self) -> int:
@@ -33,6 +40,12 @@ class Statistic:
     def exactly_twice(self) -> "Statistic":
         return self.exactly_2_times()
 
+    def rejected_once(self) -> "Statistic":
+        return self.rejected_1_times()
+
+    def rejected_twice(self) -> "Statistic":
+        return self.rejected_2_times()
+
     def for_the_first_time(self) -> "Statistic":
         return self.for_the_1_time()
 
@@ -46,6 +59,12 @@ class Statistic:
             number = int(exactly_times_result.groupdict()["number"])
             return self._exactly_times(number)
 
+        rejected_times_pattern = r"^rejected_(?P<number>\d+)_times$"
+        rejected_times_result = re.match(rejected_times_pattern, item)
+        if rejected_times_result:
+            number = int(rejected_times_result.groupdict()["number"])
+            return self._rejected_times(number)
+
         for_the_time_pattern = r"^for_the_(?P<number>\d+)_time$"
         for_the_time_result = re.match(for_the_time_pattern, item)
         if for_the_time_result:
@@ -62,6 +81,13 @@ class Statistic:
             self._raise_assertion()
         return lambda: self
 
+    def _rejected_times(self, expected_rejected_times: int) -> Callable[[], "Statistic"]:
+        if expected_rejected_times != self.rejected_times:
+            self._error_messages.append(f" Rejected {expected_rejected_times} times.\n"
+                                        f"But server rejected {self.rejected_times} times.")
+            self._raise_assertion()
+        return lambda: self
+
     def _for_the_time(self, times: int) -> Callable[[], "Statistic"]:
         if self.requested_times < times:
             self._error_messages.append(f" At least {times} times.\n"
@@ -92,6 +118,34 @@ class Statistic:
     def with_query_params(self, query_params: Dict[str, str]) -> "Statistic":
         return self.validate(WithQueryParams(query_params))
 
+    def served_variant(self, variant: int, times: int) -> "Statistic":
+        served_times = self.variant_hits.get(variant, 0)
+        if served_times != times:
+            self._error_messages.append(f"\nWith variant {variant} served {times} times.\n"
+                                        f"But it was served {served_times} times.")
+        return self
+
+    def with_rate_at_most(self, requests_per_second: float, window: float = 1.0) -> "Statistic":
+        max_requests = self.requests.max_requests_in_window(window)
+        if max_requests > requests_per_second * window:
+            self._error_messages.append(f"\nWith rate at most {requests_per_second} requests per second.\n"
+                                        f"But there were {max_requests} requests in {window} seconds.")
+        return self
+
+    def with_interval_at_least(self, seconds: float) -> "Statistic":
+        min_interval = self.requests.min_interval()
+        if min_interval is not None and min_interval < seconds:
+            self._error_messages.append(f"\nWith interval between requests at least {seconds} seconds.\n"
+                                        f"But the shortest interval was {min_interval:.6f} seconds.")
+        return self
+
+    def completed_within(self, seconds: float) -> "Statistic":
+        duration = self.requests.duration()
+        if duration > seconds:
+            self._error_messages.append(f"\nWith all requests within {seconds} seconds.\n"
+                                        f"But requests took {duration:.6f} seconds.")
+        return self
+
     @property
     def current_request(self) -> Request:
         if self._current_request_index is None:
@@ -0,0 +1,80 @@
+import json as json_lib
+import re
+from typing import Callable, List, Optional, Union, Any
+
+from py_fake_server.request import Request
+
+Getter = Callable[[Request], Any]
+
+
+class Template:
+    _placeholder = re.compile(r"\{\{\s*(?P<variable>[\w.\-]+)\s*\}\}")
+
+    def __init__(self, source: str):
+        self.source = source
+        self._parts: List[Union[bytes, Getter]] = []
+
+        position = 0
+        for match in self._placeholder.finditer(source):
+            if match.start() > position:
+                self._parts.append(source[position:match.start()].encode("utf-8"))
+            self._parts.append(self._compile_variable(match.group("variable")))
+            position = match.end()
+        if position < len(source):
+            self._parts.append(source[position:].encode("utf-8"))
+
+        self._static: Optional[bytes] = None
+        if all(isinstance(part, bytes) for part in self._parts):
+            self._static = b"".join(self._parts)
+
+    def render(self, request: Request) -> bytes:
+        if self._static is not None:
+            return self._static
+        return b"".join(part if part.__class__ is bytes else self._to_bytes(part(request))
+                        for part in self._parts)
+
+    def render_str(self, request: Request) -> str:
+        return self.render(request).decode("utf-8")
+
+    @staticmethod
+    def _to_bytes(value: Any) -> bytes:
+        if value is None:
+            return b""
+        if isinstance(value, str):
+            return value.encode("utf-8")
+        return json_lib.dumps(value).encode("utf-8")
+
+    @staticmethod
+    def _compile_variable(variable: str) -> Getter:
+        root, _, path = variable.partition(".")
+
+        if root == "uuid" and not path:
+            import uuid
+            return lambda request: str(uuid.uuid4())
+        if root == "body" and not path:
+            return lambda request: request.body.decode("utf-8", errors="replace")
+        if root == "path" and path:
+            return lambda request: request.path_params.get(path)
+        if root == "query" and path:
+            return lambda request: request.query_params.get(path)
+        if root == "headers" and path:
+            header_name = path.upper()
+            return lambda request: request.headers.get(header_name)
+        if root == "cookies" and path:
+            return lambda request: request.cookies.get(path)
+        if root == "json" and path:
+            keys = path.split(".")
+            return lambda request: Template._get_json_field(request.json, keys)
+
+        raise AttributeError(f"Unknown template variable '{variable}'")
+
+    @staticmethod
+    def _get_json_field(json: Any, keys: List[str]) -> Any:
+        for key in keys:
+            if isinstance(json, dict):
+                json = json.get(key)
+            elif isinstance(json, list) and key.isdigit() and int(key) < len(json):
+                json = json[int(key)]
+            else:
+                return None
+        return json
@@ -0,0 +1,66 @@
+import threading
+from typing import Dict, List, Tuple
+
+from py_fake_server.route import Route
+
+
+class RouteTiming:
+    __slots__ = ("requests", "total", "slowest")
+
+    def __init__(self, requests: int = 0, total: float = 0.0, slowest: float = 0.0):
+        self.requests = requests
+        self.total = total
+        self.slowest = slowest
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.requests if self.requests else 0.0
+
+
+class RouteTimings:
+    def __init__(self):
+        self._timings: Dict[Tuple[str, str], RouteTiming] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._timings)
+
+    def record(self, route: Route, duration: float):
+        self.add(route.method.upper(), route.url, 1, duration, duration)
+
+    def add(self, method: str, url: str, requests: int, total: float, slowest: float):
+        with self._lock:
+            timing = self._timings.get((method, url))
+            if timing is None:
+                timing = self._timings[(method, url)] = RouteTiming()
+            timing.requests += requests
+            timing.total += total
+            timing.slowest = max(timing.slowest, slowest)
+
+    def merge(self, other: "RouteTimings"):
+        for (method, url), timing in other.items():
+            self.add(method, url, timing.requests, timing.total, timing.slowest)
+
+    def items(self) -> List[Tuple[Tuple[str, str], RouteTiming]]:
+        with self._lock:
+            return list(self._timings.items())
+
+    def slowest(self, number: int) -> List[Tuple[Tuple[str, str], RouteTiming]]:
+        return sorted(self.items(), key=lambda item: item[1].slowest, reverse=True)[:number]
+
+    def heaviest(self, number: int) -> List[Tuple[Tuple[str, str], RouteTiming]]:
+        return sorted(self.items(), key=lambda item: item[1].requests, reverse=True)[:number]
+
+    def clear(self):
+        with self._lock:
+            self._timings = {}
+
+    def to_list(self) -> List[list]:
+        return [[method, url, timing.requests, timing.total, timing.slowest] for (method, url), timing in self.items()]
+
+    @classmethod
+    def from_list(cls, rows: List[list]) -> "RouteTimings":
+        timings = cls()
+        for method, url, requests, total, slowest in rows:
+            timings.add(method, url, requests, total, slowest)
+        return timings
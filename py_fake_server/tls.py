@@ -0,0 +1,61 @@
+import ipaddress
+import os
+import shutil
+import ssl
+import subprocess
+import tempfile
+from typing import Optional
+
+
+def default_cache_dir() -> str:
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_home, "py_fake_server")
+
+
+def certificate_for(host: str, cache_dir: Optional[str] = None) -> str:
+    cache_dir = cache_dir or default_cache_dir()
+    path = os.path.join(cache_dir, f"{host}.pem")
+    if os.path.exists(path):
+        return path
+
+    openssl = shutil.which("openssl")
+    if openssl is None:
+        raise RuntimeError("Can't generate a certificate without openssl, pass 'certfile' explicitly")
+
+    os.makedirs(cache_dir, exist_ok=True)
+    with tempfile.TemporaryDirectory(dir=cache_dir) as directory:
+        keyfile, certfile = os.path.join(directory, "key.pem"), os.path.join(directory, "cert.pem")
+        subprocess.run([
+            openssl, "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "3650",
+            "-keyout", keyfile, "-out", certfile, "-subj", f"/CN={host}",
+            "-addext", f"subjectAltName={_subject_alt_names(host)}",
+        ], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+        combined = os.path.join(directory, "combined.pem")
+        descriptor = os.open(combined, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with open(descriptor, "wb") as pem, open(keyfile, "rb") as key, open(certfile, "rb") as cert:
+            pem.write(key.read() + cert.read())
+        os.replace(combined, path)
+    return path
+
+
+def _subject_alt_names(host: str) -> str:
+    names = {f"IP:{host}" if _is_ip(host) else f"DNS:{host}"}
+    if host == "localhost":
+        names.add("IP:127.0.0.1")
+    return ",".join(sorted(names))
+
+
+def _is_ip(host: str) -> bool:
+    try:
+        ipaddress.ip_address(host)
+    except ValueError:
+        return False
+    return True
+
+
+def server_context(certfile: str, keyfile: Optional[str] = None) -> ssl.SSLContext:
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(certfile, keyfile)
+    context.options &= ~ssl.OP_NO_TICKET
+    return context
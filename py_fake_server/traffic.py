@@ -0,0 +1,77 @@
+import threading
+from typing import Any, Dict, List, Tuple
+
+from py_fake_server.route import Route
+
+
+def size_bucket(size: int) -> int:
+    return 1 << (size - 1).bit_length() if size else 0
+
+
+class RouteTraffic:
+    __slots__ = ("requests", "rejected", "statuses", "body_sizes", "body_bytes", "largest_body")
+
+    def __init__(self):
+        self.requests = 0
+        self.rejected = 0
+        self.statuses: Dict[int, int] = {}
+        self.body_sizes: Dict[int, int] = {}
+        self.body_bytes = 0
+        self.largest_body = 0
+
+    def copy(self) -> "RouteTraffic":
+        traffic = RouteTraffic()
+        traffic.requests = self.requests
+        traffic.rejected = self.rejected
+        traffic.statuses = dict(self.statuses)
+        traffic.body_sizes = dict(self.body_sizes)
+        traffic.body_bytes = self.body_bytes
+        traffic.largest_body = self.largest_body
+        return traffic
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "rejected": self.rejected,
+            "statuses": {str(status): count for status, count in sorted(self.statuses.items())},
+            "body_sizes": {str(bucket): count for bucket, count in sorted(self.body_sizes.items())},
+            "body_bytes": self.body_bytes,
+            "largest_body": self.largest_body,
+        }
+
+
+class Traffic:
+    def __init__(self):
+        self._routes: Dict[Route, RouteTraffic] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._routes)
+
+    def record(self, route: Route, status: int, body_size: int, rejected: bool = False):
+        bucket = size_bucket(body_size)
+        with self._lock:
+            traffic = self._routes.get(route)
+            if traffic is None:
+                traffic = self._routes[route] = RouteTraffic()
+            traffic.requests += 1
+            traffic.rejected += rejected
+            traffic.statuses[status] = traffic.statuses.get(status, 0) + 1
+            traffic.body_sizes[bucket] = traffic.body_sizes.get(bucket, 0) + 1
+            traffic.body_bytes += body_size
+            if body_size > traffic.largest_body:
+                traffic.largest_body = body_size
+
+    def copy(self) -> "Traffic":
+        traffic = Traffic()
+        with self._lock:
+            traffic._routes = {route: route_traffic.copy() for route, route_traffic in self._routes.items()}
+        return traffic
+
+    def items(self) -> List[Tuple[Route, RouteTraffic]]:
+        with self._lock:
+            return [(route, traffic.copy()) for route, traffic in self._routes.items()]
+
+    def clear(self):
+        with self._lock:
+            self._routes = {}
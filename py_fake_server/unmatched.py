@@ -0,0 +1,73 @@
+import heapq
+import threading
+from collections import Counter
+from typing import Dict, List, Tuple, Iterable, Set
+from urllib.parse import urlsplit
+
+from py_fake_server.route import Route
+
+
+class RouteIndex:
+    def __init__(self, routes: Iterable[Route]):
+        self._routes: List[Route] = list(routes)
+        self._grams: List[Set[str]] = [self._ngrams(route) for route in self._routes]
+        self._postings: Dict[str, List[int]] = {}
+        for position, grams in enumerate(self._grams):
+            for gram in grams:
+                self._postings.setdefault(gram, []).append(position)
+
+    def closest(self, route: Route, number: int = 3, threshold: float = 0.3) -> List[Route]:
+        grams = self._ngrams(route)
+        shared = Counter(position for gram in grams for position in self._postings.get(gram, ()))
+        scores = (
+            (count / (len(grams) + len(self._grams[position]) - count), -position)
+            for position, count in shared.items()
+        )
+        return [
+            self._routes[-negative_position]
+            for score, negative_position in heapq.nlargest(number, scores)
+            if score >= threshold
+        ]
+
+    @staticmethod
+    def _ngrams(route: Route, size: int = 3) -> Set[str]:
+        key = f"^{route.method.upper()} {urlsplit(route.url).path}$"
+        return {key[i:i + size] for i in range(len(key) - size + 1)}
+
+
+def unmatched_body(route: Route) -> bytes:
+    return f"Server has not responses for [{route.method.upper()}] {route.url}".encode("utf-8")
+
+
+class UnmatchedRoutes:
+    def __init__(self, max_routes: int = 1000, counts: Dict[Route, int] = None, overflow: int = 0,
+                 bodies: Dict[Route, bytes] = None):
+        self.max_routes = max_routes
+        self.overflow = overflow
+        self._counts: Dict[Route, int] = dict(counts or {})
+        self._bodies: Dict[Route, bytes] = dict(bodies or {})
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def record(self, route: Route) -> bytes:
+        with self._lock:
+            if route in self._counts:
+                self._counts[route] += 1
+                return self._bodies[route]
+            body = unmatched_body(route)
+            if len(self._counts) < self.max_routes:
+                self._counts[route] = 1
+                self._bodies[route] = body
+            else:
+                self.overflow += 1
+            return body
+
+    def most_common(self) -> List[Tuple[Route, int]]:
+        with self._lock:
+            return sorted(self._counts.items(), key=lambda item: item[1], reverse=True)
+
+    def copy(self) -> "UnmatchedRoutes":
+        with self._lock:
+            return UnmatchedRoutes(self.max_routes, self._counts, self.overflow, self._bodies)
@@ -2,6 +2,7 @@ import json
 from abc import ABCMeta, abstractmethod
 from typing import Dict
 
+from py_fake_server.bodies import body_digest
 from py_fake_server.request import Request
 
 
@@ -29,8 +30,12 @@ class WithCookies(BaseValidator):
 class WithBody(BaseValidator):
     def __init__(self, body: str):
         self.body = body
+        self.digest = body_digest(body.encode("utf-8"))
 
     def validate(self, request):
+        if request.body_digest == self.digest:
+            return
+
         actual_body = request.body.decode("utf-8", errors="skip")
         assert self.body == actual_body, \
             f"\nFor the {request.number} time: with body {self.body.__repr__()}.\n" \
@@ -40,8 +45,15 @@ class WithBody(BaseValidator):
 class WithJson(BaseValidator):
     def __init__(self, json_dict: Dict):
         self.json = json_dict
+        self.digests = {
+            body_digest(json.dumps(self.json).encode("utf-8")),
+            body_digest(json.dumps(self.json, sort_keys=True).encode("utf-8")),
+        }
 
     def validate(self, request):
+        if request.body_digest in self.digests:
+            return
+
         body = json.dumps(self.json, sort_keys=True)
         actual_body = request.body.decode("utf-8", errors="skip")
 
@@ -0,0 +1,208 @@
+import heapq
+import select
+import ssl
+import threading
+import socket
+import time
+from typing import Callable, List, Tuple, Optional
+
+from waitress.channel import HTTPChannel
+from waitress.task import WSGITask
+from webtest.http import StopableWSGIServer
+
+from py_fake_server.faults import FAULT_ENVIRON_KEY
+
+
+class FaultyTask(WSGITask):
+    _head = b""
+    _body: List[bytes] = []
+
+    @property
+    def fault(self):
+        return self.environ.get(FAULT_ENVIRON_KEY) if self.environ else None
+
+    def write(self, data: bytes):
+        if self.fault is None:
+            return super().write(data)
+
+        if not self.complete:
+            raise RuntimeError("start_response was not called before body written")
+        if not self.wrote_header:
+            self._head = self.build_response_header()
+            self._body = []
+            self.wrote_header = True
+        if data and self.has_body:
+            self._body.append(data)
+        self.content_bytes_written += len(data)
+
+    def finish(self):
+        fault = self.fault
+        if fault is None:
+            return super().finish()
+
+        if not self.wrote_header:
+            self.write(b"")
+        if fault.inject(self.channel, self._head, b"".join(self._body)):
+            self.close_on_finish = True
+
+
+class FaultyChannel(HTTPChannel):
+    task_class = FaultyTask
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.delayed_writes: List[Tuple[float, bytes]] = []
+        self.handoff: Optional[Callable[[socket.socket], None]] = None
+
+    def write_later(self, delay: float, data: bytes):
+        resume_at = time.monotonic() + delay
+        self.delayed_writes.append((resume_at, data))
+        self.server.wake_up_at(resume_at)
+
+    def writable(self):
+        if self.handoff is not None:
+            return not self.requests
+        if self.delayed_writes:
+            return self.total_outbufs_len or self.delayed_writes[0][0] <= time.monotonic()
+        return super().writable()
+
+    def readable(self):
+        return not self.delayed_writes and self.handoff is None and super().readable()
+
+    def handle_write(self):
+        if self.handoff is not None:
+            return self._hand_off()
+
+        now = time.monotonic()
+        while self.delayed_writes and self.delayed_writes[0][0] <= now and self.connected:
+            _, data = self.delayed_writes.pop(0)
+            self.write_soon(data)
+
+        if not self.delayed_writes:
+            return super().handle_write()
+
+        close_when_flushed, self.close_when_flushed = self.close_when_flushed, False
+        super().handle_write()
+        self.close_when_flushed = close_when_flushed
+
+    def _hand_off(self):
+        if self.total_outbufs_len:
+            self.close_when_flushed = False
+            super().handle_write()
+        if self.total_outbufs_len or not self.connected:
+            return
+        sock, handoff, self.handoff = self.socket, self.handoff, None
+        self.del_channel()
+        self.connected = False
+        handoff(sock)
+
+
+class TLSWantsMore(Exception):
+    pass
+
+
+class TLSChannel(FaultyChannel):
+    def __init__(self, server, sock, *args, **kwargs):
+        sock = server.ssl_context.wrap_socket(sock, server_side=True, do_handshake_on_connect=False)
+        self._tls_lock = threading.Lock()
+        super().__init__(server, sock, *args, **kwargs)
+        self._handshake_done = False
+        self._handshake_wants_write = False
+
+    def readable(self):
+        if not self._handshake_done:
+            return not self._handshake_wants_write
+        return super().readable()
+
+    def writable(self):
+        if not self._handshake_done:
+            return self._handshake_wants_write
+        return super().writable()
+
+    def handle_read(self):
+        if self._handshake_done or self._handshake():
+            try:
+                super().handle_read()
+            except TLSWantsMore:
+                pass
+
+    def handle_write(self):
+        if self._handshake_done or self._handshake():
+            super().handle_write()
+
+    def _handshake(self) -> bool:
+        try:
+            self.socket.do_handshake()
+        except ssl.SSLWantReadError:
+            self._handshake_wants_write = False
+            return False
+        except ssl.SSLWantWriteError:
+            self._handshake_wants_write = True
+            return False
+        except OSError:
+            self.handle_close()
+            return False
+        self._handshake_done = True
+        self._handshake_wants_write = False
+        return True
+
+    def recv(self, buffer_size: int) -> bytes:
+        try:
+            with self._tls_lock:
+                data = self.socket.recv(buffer_size)
+                while data and self.socket.pending():
+                    data += self.socket.recv(self.socket.pending())
+        except (ssl.SSLWantReadError, ssl.SSLWantWriteError):
+            raise TLSWantsMore()
+        except OSError:
+            data = b""
+        if not data:
+            self.handle_close()
+        return data
+
+    def send(self, data: bytes, do_close: bool = True) -> int:
+        try:
+            with self._tls_lock:
+                return self.socket.send(data)
+        except (ssl.SSLWantReadError, ssl.SSLWantWriteError):
+            return 0
+        except OSError:
+            if do_close:
+                self.handle_close()
+            return 0
+
+
+class FakeWSGIServer(StopableWSGIServer):
+    channel_class = FaultyChannel
+    poll_timeout = .5
+
+    def __init__(self, *args, ssl_context: Optional[ssl.SSLContext] = None, **kwargs):
+        self.ssl_context = ssl_context
+        if ssl_context is not None:
+            self.channel_class = TLSChannel
+            kwargs["url_scheme"] = "https"
+        super().__init__(*args, **kwargs)
+        self._wake_ups: List[float] = []
+        self._wake_ups_lock = threading.Lock()
+
+    def wake_up_at(self, moment: float):
+        with self._wake_ups_lock:
+            heapq.heappush(self._wake_ups, moment)
+        self.pull_trigger()
+
+    def run(self):
+        try:
+            while self._map:
+                self.asyncore.loop(self._next_poll_timeout(), map=self._map, count=1)
+        except select.error:  # pragma: no cover
+            if not self.was_shutdown:
+                raise
+
+    def _next_poll_timeout(self) -> float:
+        now = time.monotonic()
+        with self._wake_ups_lock:
+            while self._wake_ups and self._wake_ups[0] <= now:
+                heapq.heappop(self._wake_ups)
+            if not self._wake_ups:
+                return self.poll_timeout
+            return min(self.poll_timeout, self._wake_ups[0] - now)
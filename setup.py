@@ -29,6 +29,11 @@ requires = [
     "falcon-multipart==0.2.0",
 ]
 
+extras_require = {
+    "http2": ["h2>=3.0"],
+    "yaml": ["PyYAML"],
+}
+
 tests_require = [
     "pytest",
     "requests",
@@ -45,8 +50,13 @@ setup(
     license="MIT",
     packages=find_packages(exclude=["tests"]),
     install_requires=requires,
+    extras_require=extras_require,
     tests_require=tests_require,
     setup_requires=["pytest-runner"],
+    entry_points={
+        "pytest11": ["py_fake_server.pytest_plugin = py_fake_server.pytest_plugin"],
+        "console_scripts": ["py-fake-server = py_fake_server.cli:main"],
+    },
     classifiers=[
         'Programming Language :: Python :: 3.6',
         'Topic :: Software Development :: Libraries :: Python Modules',
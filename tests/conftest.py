@@ -1,8 +1,29 @@
+from typing import List
+
 import pytest
 
 from py_fake_server import FakeServer
 
 
+class Servers:
+    def __init__(self):
+        self._started: List[FakeServer] = []
+
+    def start(self, **options) -> FakeServer:
+        server = FakeServer(host="localhost", port=0, **options)
+        server.start()
+        self._started.append(server)
+        return server
+
+    def clear(self):
+        for server in self._started:
+            server.clear()
+
+    def stop(self):
+        for server in self._started:
+            server.stop()
+
+
 @pytest.fixture(scope="session")
 def server() -> FakeServer:
     server = FakeServer(host="localhost", port=8081)
@@ -11,8 +32,17 @@ def server() -> FakeServer:
     server.stop()
 
 
+@pytest.fixture(scope="module")
+def servers() -> Servers:
+    servers = Servers()
+    yield servers
+    servers.stop()
+
+
 @pytest.fixture(autouse=True)
-def clear_server(server: FakeServer):
+def clear_server(server: FakeServer, servers: Servers):
     server.clear()
+    servers.clear()
     yield
     server.clear()
+    servers.clear()
@@ -245,6 +245,15 @@ def test_add_response_with_204_and_body_raise_exception(server: FakeServer):
     assert str(error.value) == "status == 204 and body != None in one response"
 
 
+def test_add_response_with_unknown_status_raise_exception(server: FakeServer):
+    with pytest.raises(AttributeError) as error:
+        server. \
+            on_("get", "/error"). \
+            response(status=999)
+
+    assert str(error.value) == "Unknown status 999"
+
+
 def test_route_with_ending_slash(server: FakeServer):
     server. \
         on_("get", "/users/"). \
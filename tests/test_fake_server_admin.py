@@ -0,0 +1,180 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.error import HTTPError
+
+import pytest
+import requests
+
+from py_fake_server import FakeServer, FakeServerClient
+from py_fake_server.request import Request
+from py_fake_server.route import Route
+
+
+@pytest.fixture(scope="module")
+def admin_server(servers) -> FakeServer:
+    return servers.start(admin=True)
+
+
+@pytest.fixture
+def client(admin_server: FakeServer) -> FakeServerClient:
+    return FakeServerClient(admin_server.base_uri)
+
+
+def test_register_stubs(admin_server: FakeServer, client: FakeServerClient):
+    registered = client.register_stubs([
+        {"method": "get", "url": "/users", "responses": [{"status": 200, "json": {"users": []}}]},
+        {"method": "post", "url": "/auth", "responses": [
+            {"status": 401, "times": 1},
+            {"status": 201, "body": "Welcome!", "headers": {"X-Token": "1"}},
+        ]},
+    ])
+
+    assert registered == 2
+    assert requests.get(admin_server.base_uri + "/users").json() == {"users": []}
+    assert requests.post(admin_server.base_uri + "/auth").status_code == 401
+    response = requests.post(admin_server.base_uri + "/auth")
+    assert (response.status_code, response.text, response.headers["X-Token"]) == (201, "Welcome!", "1")
+
+
+def test_register_many_stubs(admin_server: FakeServer, client: FakeServerClient):
+    client.register_stubs([
+        {"method": "get", "url": f"/users/{number}", "responses": [{"status": 200, "body": str(number)}]}
+        for number in range(2000)
+    ])
+
+    assert requests.get(admin_server.base_uri + "/users/1999").text == "1999"
+
+
+def test_register_invalid_stub(client: FakeServerClient):
+    with pytest.raises(HTTPError) as error:
+        client.register_stubs([{"method": "get", "url": "/users", "responses": [{"status": 204, "body": "No"}]}])
+
+    assert error.value.code == 400
+
+
+def test_register_stub_with_duplicate_path_params(client: FakeServerClient):
+    with pytest.raises(HTTPError) as error:
+        client.register_stubs([{"method": "get", "url": "/users/{id}/games/{id}", "responses": [{"status": 200}]}])
+
+    assert error.value.code == 400
+
+
+def test_register_stubs_is_atomic(admin_server: FakeServer, client: FakeServerClient):
+    with pytest.raises(HTTPError) as error:
+        client.register_stubs([
+            {"method": "get", "url": "/users", "responses": [{"status": 200}]},
+            {"method": "get", "url": "/games", "responses": [{"status": 204, "body": "No"}]},
+        ])
+
+    assert error.value.code == 400
+    assert requests.get(admin_server.base_uri + "/users").status_code == 500
+
+
+def test_admin_requests_are_not_recorded(admin_server: FakeServer, client: FakeServerClient):
+    client.register_stubs([])
+
+    assert client.requests_since(0) == ([], 0)
+    assert admin_server.all_requests_matched()
+
+
+def test_clear(admin_server: FakeServer, client: FakeServerClient):
+    client.register_stubs([{"method": "get", "url": "/users", "responses": [{"status": 200}]}])
+    requests.get(admin_server.base_uri + "/users")
+
+    client.clear()
+
+    assert requests.get(admin_server.base_uri + "/users").status_code == 500
+    assert client.statistic("get", "/users") == {"requested_times": 1, "rejected_times": 0}
+
+
+def test_requests_since(admin_server: FakeServer, client: FakeServerClient):
+    admin_server.on_("post", "/auth").response(status=201)
+    requests.post(admin_server.base_uri + "/auth")
+    requests.get(admin_server.base_uri + "/users")
+    requests.post(admin_server.base_uri + "/auth")
+
+    rows, last = client.requests_since(1, limit=1)
+    assert [row[:1] + row[2:] for row in rows] == [[2, "GET", "/users", 500]]
+    assert last == 2
+
+    rows, last = client.requests_since(last)
+    assert [row[:1] + row[2:] for row in rows] == [[3, "POST", "/auth", 201]]
+    assert last == 3
+
+
+def test_requests_since_when_history_is_appended_out_of_order(admin_server: FakeServer):
+    route = Route("get", admin_server.base_uri, "/users")
+    statistic = admin_server.was_requested("get", "/users")
+    request = Request.from_record(number=1, load_body=lambda: b"", content_type=None,
+                                  cookies={}, headers={}, query_params={}, files=None)
+    first_sequence, first_timestamp = admin_server.request_log.record(route)
+    second_sequence, second_timestamp = admin_server.request_log.record(route)
+
+    assert [row[4] for row in admin_server.requests_since(0)] == []
+    statistic.record_request(request, 201, sequence=second_sequence, timestamp=second_timestamp)
+    assert [row[4] for row in admin_server.requests_since(0)] == []
+    statistic.record_request(request, 200, sequence=first_sequence, timestamp=first_timestamp)
+    assert [row[4] for row in admin_server.requests_since(0)] == [200, 201]
+
+
+def test_stream_requests(admin_server: FakeServer, client: FakeServerClient):
+    requests.get(admin_server.base_uri + "/users")
+
+    def send_later():
+        admin_server.request_log.wait_for(1, 1)
+        requests.get(admin_server.base_uri + "/games")
+
+    sender = threading.Thread(target=send_later)
+    sender.start()
+    rows = list(client.stream_requests(since=0, timeout=0.5))
+    sender.join()
+
+    assert [(row[0], row[3]) for row in rows] == [(1, "/users"), (2, "/games")]
+
+
+def test_streams_do_not_starve_workers(admin_server: FakeServer):
+    admin_server.on_("get", "/users").response(status=200)
+    stream_url = admin_server.base_uri + "/__admin/requests/stream?timeout=30"
+    started_at = time.monotonic()
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        streams = [executor.submit(requests.get, stream_url, timeout=5) for _ in range(2)]
+        time.sleep(0.3)
+        assert requests.get(stream_url, timeout=5).status_code == 503
+        assert requests.get(admin_server.base_uri + "/users", timeout=5).status_code == 200
+
+        assert [len(stream.result().text.splitlines()) for stream in streams] == [1, 1]
+    assert time.monotonic() - started_at < 3
+
+
+def test_statistic(admin_server: FakeServer, client: FakeServerClient):
+    requests.get(admin_server.base_uri + "/users")
+
+    assert client.statistic("get", "/users") == {"requested_times": 1, "rejected_times": 0}
+
+
+def test_profiler(admin_server: FakeServer, client: FakeServerClient):
+    admin_server.on_("get", "/users").response(status=200)
+    client.start_profiling()
+    requests.get(admin_server.base_uri + "/users")
+
+    stacks = client.stop_profiling().splitlines()
+
+    assert [stack.rsplit(" ", 1)[0] for stack in stacks] == [
+        f"fake_server;GET /users;{stage}"
+        for stage in sorted(["capture", "dispatch", "limits", "match", "response", "serialize", "statistics", "write"])
+    ]
+    assert admin_server.profiler.running is False
+    assert client.profile() == "\n".join(stacks) + "\n"
+
+
+def test_report(admin_server: FakeServer, client: FakeServerClient):
+    admin_server.on_("get", "/users").response(status=200)
+    requests.get(admin_server.base_uri + "/users")
+
+    report = client.report()
+
+    assert [(route["url"], route["requests"]) for route in report["routes"]] == [
+        (admin_server.base_uri + "/users", 1),
+    ]
@@ -0,0 +1,99 @@
+import pytest
+import requests
+
+from py_fake_server import FakeServer
+from py_fake_server.bodies import BodyStore, DeduplicatedBodyStore, body_digest
+
+
+def test_body_store_keeps_every_body():
+    store = BodyStore()
+    keys = [store.put(b"first"), store.put(b""), store.put(b"first")]
+
+    assert keys == [0, 1, 2]
+    assert [store.get(key) for key in keys] == [b"first", b"", b"first"]
+    assert store.digest(0) is None
+
+
+def test_deduplicated_body_store_keeps_one_copy():
+    store = DeduplicatedBodyStore()
+    keys = [store.put(b"first"), store.put(b"second"), store.put(b"first")]
+
+    assert keys == [0, 1, 0]
+    assert len(store) == 2
+    assert store.get(1) == b"second"
+    assert store.digest(0) == body_digest(b"first")
+
+
+@pytest.mark.parametrize("compression", ["zlib", "lzma"])
+def test_deduplicated_body_store_compresses_cold_bodies(compression: str):
+    store = DeduplicatedBodyStore(compression=compression, hot_bodies=1)
+    body = b"a" * 10000
+    cold_key = store.put(body)
+    store.put(b"hot")
+
+    assert len(store._contents[cold_key]) < len(body)
+    assert store.get(cold_key) == body
+
+
+def test_deduplicated_body_store_puts_cold_body_again():
+    store = DeduplicatedBodyStore(compression="zlib", hot_bodies=1)
+    keys = [store.put(b"first"), store.put(b"second"), store.put(b"first"), store.put(b"second")]
+
+    assert keys == [0, 1, 0, 1]
+    assert [store.get(0), store.get(1)] == [b"first", b"second"]
+
+
+def test_deduplicated_body_store_unknown_compression():
+    with pytest.raises(AttributeError) as error:
+        DeduplicatedBodyStore(compression="zip")
+
+    assert str(error.value) == "Unknown compression 'zip'"
+
+
+@pytest.fixture(scope="module")
+def deduplicating_server(servers) -> FakeServer:
+    return servers.start(body_store=DeduplicatedBodyStore(compression="zlib", hot_bodies=1))
+
+
+def test_server_with_deduplicated_body_store(deduplicating_server: FakeServer):
+    for _ in range(3):
+        requests.post(deduplicating_server.base_uri + "/orders", json={"type": "market", "size": 10})
+    requests.post(deduplicating_server.base_uri + "/orders", data="Hello!")
+
+    assert deduplicating_server.was_requested("post", "/orders"). \
+        exactly_4_times(). \
+        for_the_first_time(). \
+        with_json({"type": "market", "size": 10}). \
+        for_the_3_time(). \
+        with_json({"size": 10, "type": "market"}). \
+        for_the_4_time(). \
+        with_body("Hello!").check()
+    assert len(deduplicating_server._statistics_backend.body_store) == 2
+
+
+def test_server_with_deduplicated_body_store_reports_wrong_body(deduplicating_server: FakeServer):
+    requests.post(deduplicating_server.base_uri + "/orders", data="Hello!")
+
+    with pytest.raises(AssertionError) as error:
+        deduplicating_server.was_requested("post", "/orders"). \
+            for_the_first_time(). \
+            with_body("Bye!").check()
+
+    assert str(error.value) == "Expect that server was requested with " \
+                               f"[POST] {deduplicating_server.base_uri}/orders.\n" \
+                               "For the 1 time: with body 'Bye!'.\n" \
+                               "But for the 1 time: body was 'Hello!'."
+
+
+def test_snapshot_keeps_bodies_after_clear(deduplicating_server: FakeServer):
+    requests.post(deduplicating_server.base_uri + "/orders", data="first")
+    snapshot = deduplicating_server.snapshot()
+    deduplicating_server.clear()
+    requests.post(deduplicating_server.base_uri + "/orders", data="second")
+
+    deduplicating_server.restore(snapshot)
+
+    assert deduplicating_server.was_requested("post", "/orders"). \
+        exactly_once(). \
+        for_the_first_time(). \
+        with_body("first").check()
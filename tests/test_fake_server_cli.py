@@ -0,0 +1,123 @@
+import json
+import subprocess
+import sys
+import time
+
+import pytest
+import requests
+
+from py_fake_server import FakeServer
+from py_fake_server.cli import apply_config, build_parser
+from py_fake_server.config import load_config, register_stubs
+
+
+def wait_until(condition, timeout: float = 5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if condition():
+                return
+        except requests.ConnectionError:
+            pass
+        time.sleep(0.05)
+    raise AssertionError("Condition was not met in time")
+
+
+@pytest.fixture
+def config_path(tmp_path):
+    path = tmp_path / "stubs.json"
+    path.write_text(json.dumps({
+        "unmatched": {"status": 404},
+        "stubs": [{"method": "get", "url": "/users", "responses": [{"status": 200, "body": "first"}]}],
+    }))
+    return path
+
+
+def test_serve_with_hot_reload(config_path):
+    process = subprocess.Popen([
+        sys.executable, "-m", "py_fake_server.cli", "serve",
+        "--host", "localhost", "--port", "0", "--config", str(config_path), "--reload-interval", "0.05",
+    ], stderr=subprocess.PIPE, universal_newlines=True)
+    try:
+        base_uri = process.stderr.readline().split()[-1]
+        wait_until(lambda: requests.get(base_uri + "/users").text == "first")
+        assert requests.get(base_uri + "/games").status_code == 404
+
+        with requests.Session() as session:
+            assert session.get(base_uri + "/users").text == "first"
+            config_path.write_text(json.dumps([
+                {"method": "get", "url": "/users", "responses": [{"status": 200, "body": "second"}]},
+            ]))
+            wait_until(lambda: session.get(base_uri + "/users").text == "second")
+        assert requests.get(base_uri + "/games").status_code == 500
+
+        statistic = requests.get(base_uri + "/__admin/statistics",
+                                 params={"method": "get", "url": "/users"}).json()
+        assert statistic["requested_times"] >= 3
+    finally:
+        process.terminate()
+        assert process.wait(10) == 0
+
+
+def test_load_yaml_config(tmp_path):
+    pytest.importorskip("yaml")
+    path = tmp_path / "stubs.yaml"
+    path.write_text("- method: get\n"
+                    "  url: /users\n"
+                    "  responses:\n"
+                    "    - status: 200\n"
+                    "      json: {users: []}\n")
+
+    assert load_config(str(path)) == {"stubs": [
+        {"method": "get", "url": "/users", "responses": [{"status": 200, "json": {"users": []}}]},
+    ]}
+
+
+def test_load_invalid_config(tmp_path):
+    path = tmp_path / "stubs.json"
+    path.write_text('"stubs"')
+
+    with pytest.raises(AttributeError) as error:
+        load_config(str(path))
+
+    assert str(error.value) == f"Config '{path}' should be a list of stubs or a mapping"
+
+
+def test_replace_endpoints_keeps_statistics(server: FakeServer):
+    server.on_("get", "/users").response(status=200, body="first")
+    requests.get(server.base_uri + "/users")
+
+    server.replace_endpoints(lambda staging: register_stubs(staging, [
+        {"method": "get", "url": "/users", "responses": [{"status": 201}]},
+    ]))
+
+    assert requests.get(server.base_uri + "/users").status_code == 201
+    assert server.was_requested("get", "/users").exactly_twice().check()
+
+
+def test_apply_config_validates_stubs_before_unmatched_settings(server: FakeServer, config_path):
+    applied_unmatched = apply_config(server, str(config_path))
+    config_path.write_text(json.dumps({
+        "unmatched": {"status": 418},
+        "stubs": [{"method": "get", "url": "/users", "responses": [{"status": 204, "body": "No"}]}],
+    }))
+
+    with pytest.raises(AttributeError):
+        apply_config(server, str(config_path), applied_unmatched)
+
+    assert requests.get(server.base_uri + "/users").text == "first"
+    assert requests.get(server.base_uri + "/games").status_code == 404
+
+
+def test_apply_config_resets_removed_unmatched_settings(server: FakeServer, config_path):
+    applied_unmatched = apply_config(server, str(config_path))
+    config_path.write_text(json.dumps({"stubs": []}))
+
+    assert apply_config(server, str(config_path), applied_unmatched) == {}
+    assert requests.get(server.base_uri + "/games").status_code == 500
+
+
+def test_parser_defaults():
+    arguments = build_parser().parse_args(["serve"])
+
+    assert (arguments.host, arguments.port, arguments.workers, arguments.config) == ("0.0.0.0", 8081, 4, None)
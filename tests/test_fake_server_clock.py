@@ -0,0 +1,96 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+
+from py_fake_server import FakeServer, ManualClock, AcceleratedClock, expect_that
+
+
+@pytest.fixture(scope="module")
+def clock() -> ManualClock:
+    return ManualClock()
+
+
+@pytest.fixture(scope="module")
+def clocked_server(servers, clock: ManualClock) -> FakeServer:
+    return servers.start(clock=clock)
+
+
+def test_delay_waits_for_manual_clock(clocked_server: FakeServer, clock: ManualClock):
+    clocked_server.on_("get", "/slow").response(status=200, delay=600)
+    started_at, real_started_at = clock.now(), time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        responses = [executor.submit(requests.get, clocked_server.base_uri + "/slow") for _ in range(3)]
+        assert clock.wait_for_sleepers(3)
+        assert not any(response.done() for response in responses)
+        clock.advance(600)
+
+        assert [response.result().status_code for response in responses] == [200] * 3
+    assert clock.now() - started_at == 600
+    assert time.perf_counter() - real_started_at < 5
+    expect_that(clocked_server.was_requested("get", "/slow").exactly_3_times())
+
+
+def test_manual_clock_sleep_waits_for_target():
+    clock = ManualClock()
+    sleeper = threading.Thread(target=clock.sleep, args=(10,))
+    sleeper.start()
+    assert clock.wait_for_sleepers(1)
+
+    clock.advance(5)
+    sleeper.join(0.1)
+    assert sleeper.is_alive()
+
+    clock.advance(5)
+    sleeper.join(5)
+    assert not sleeper.is_alive()
+    assert clock.sleepers == 0
+
+
+def test_statistic_uses_clock(clocked_server: FakeServer, clock: ManualClock):
+    for _ in range(3):
+        requests.get(clocked_server.base_uri + "/users")
+        clock.advance(60)
+
+    expect_that(clocked_server.was_requested("get", "/users").
+                with_rate_at_most(1, window=60).
+                completed_within(120))
+
+    with pytest.raises(AssertionError):
+        clocked_server.was_requested("get", "/users").completed_within(119).check()
+
+
+def test_rate_limit_refills_with_clock(clocked_server: FakeServer, clock: ManualClock):
+    clocked_server.on_("get", "/quota").response(status=200).rate_limit(1 / 60, burst=1)
+
+    assert requests.get(clocked_server.base_uri + "/quota").status_code == 200
+    assert requests.get(clocked_server.base_uri + "/quota").status_code == 429
+    clock.advance(60)
+    assert requests.get(clocked_server.base_uri + "/quota").status_code == 200
+
+
+def test_manual_clock_can_not_go_backwards():
+    with pytest.raises(AttributeError) as error:
+        ManualClock().advance(-1)
+
+    assert str(error.value) == "Clock can't go backwards"
+
+
+def test_accelerated_clock():
+    clock = AcceleratedClock(speed=1000)
+    started_at, real_started_at = clock.now(), time.perf_counter()
+
+    clock.sleep(100)
+
+    assert clock.now() - started_at >= 100
+    assert time.perf_counter() - real_started_at < 1
+
+
+def test_accelerated_clock_speed():
+    with pytest.raises(AttributeError) as error:
+        AcceleratedClock(speed=0)
+
+    assert str(error.value) == "Clock speed should be greater than 0"
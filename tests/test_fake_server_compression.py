@@ -0,0 +1,74 @@
+import gzip
+import zlib
+
+import pytest
+import requests
+
+from py_fake_server import FakeServer, expect_that
+from py_fake_server.encoding import negotiate
+
+
+def test_compressed_response(server: FakeServer):
+    server.on_("get", "/users").response(status=200, json={"users": ["Roman"]}, compress=True)
+
+    response = requests.get(server.base_uri + "/users", headers={"Accept-Encoding": "gzip"}, stream=True)
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["Vary"] == "Accept-Encoding"
+    assert gzip.decompress(response.raw.read(decode_content=False)) == b'{"users": ["Roman"]}'
+
+
+def test_compressed_response_by_quality(server: FakeServer):
+    server.on_("get", "/users").response(status=200, body="users", compress=("gzip", "deflate"))
+
+    response = requests.get(server.base_uri + "/users", headers={"Accept-Encoding": "gzip;q=0.5, deflate"})
+
+    assert response.headers["Content-Encoding"] == "deflate"
+    assert response.text == "users"
+
+
+def test_compressed_response_without_accept_encoding(server: FakeServer):
+    server.on_("get", "/users").response(status=200, body="users", compress=True)
+
+    response = requests.get(server.base_uri + "/users", headers={"Accept-Encoding": "identity"})
+
+    assert "Content-Encoding" not in response.headers
+    assert response.text == "users"
+
+
+def test_compressed_response_with_template():
+    with pytest.raises(AttributeError) as error:
+        FakeServer(host="localhost", port=8081).on_("get", "/users"). \
+            response(status=200, template="{{ uuid }}", compress=True)
+
+    assert str(error.value) == "'template' and 'compress' in one response"
+
+
+def test_compressed_response_with_unknown_encoding():
+    with pytest.raises(AttributeError) as error:
+        FakeServer(host="localhost", port=8081).on_("get", "/users").response(status=200, body="users", compress=("br",))
+
+    assert str(error.value) == "Unknown encoding 'br'"
+
+
+@pytest.mark.parametrize("encoding, compress", [("gzip", gzip.compress), ("deflate", zlib.compress)])
+def test_compressed_request_body(server: FakeServer, encoding: str, compress):
+    requests.post(server.base_uri + "/orders", data=compress(b'{"size": 10}'),
+                  headers={"Content-Encoding": encoding, "Content-Type": "application/json"})
+
+    expect_that(server.was_requested("post", "/orders").
+                for_the_first_time().
+                with_json({"size": 10}).
+                with_body('{"size": 10}'))
+
+
+@pytest.mark.parametrize("accept_encoding, expected_encoding", [
+    ("gzip, deflate", "gzip"),
+    ("deflate;q=0.9, gzip;q=0.8", "deflate"),
+    ("*", "gzip"),
+    ("gzip;q=0", None),
+    ("br", None),
+    ("", None),
+])
+def test_negotiate(accept_encoding: str, expected_encoding: str):
+    assert negotiate(accept_encoding, ("gzip", "deflate")) == expected_encoding
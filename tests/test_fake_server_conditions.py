@@ -0,0 +1,107 @@
+import requests
+
+from py_fake_server import FakeServer
+
+
+def test_when_query_selects_response(server: FakeServer):
+    server. \
+        on_("get", "/items"). \
+        response(status=200, body="Default page"). \
+        when(query={"page": "2"}).response(status=200, body="Second page"). \
+        when(query={"page": "3"}).response(status=404)
+
+    assert requests.get(server.base_uri + "/items").text == "Default page"
+    assert requests.get(server.base_uri + "/items?page=2").text == "Second page"
+    assert requests.get(server.base_uri + "/items?page=3").status_code == 404
+    assert requests.get(server.base_uri + "/items?page=4").text == "Default page"
+
+
+def test_when_headers_selects_response(server: FakeServer):
+    server. \
+        on_("post", "/auth"). \
+        when(headers={"X-Tenant": "first"}).response(status=200, json={"tenant": "first"}). \
+        when(headers={"x-tenant": "second"}).response(status=200, json={"tenant": "second"})
+
+    response_0 = requests.post(server.base_uri + "/auth", headers={"X-Tenant": "first"})
+    response_1 = requests.post(server.base_uri + "/auth", headers={"X-Tenant": "second"})
+    response_2 = requests.post(server.base_uri + "/auth")
+    assert response_0.json() == {"tenant": "first"}
+    assert response_1.json() == {"tenant": "second"}
+    assert response_2.status_code == 500
+
+
+def test_when_json_selects_response(server: FakeServer):
+    server. \
+        on_("post", "/orders"). \
+        when(json={"type": "market", "size": 10}).response(status=201). \
+        when(json={"type": "limit"}).response(status=400)
+
+    assert requests.post(server.base_uri + "/orders", json={"type": "market", "size": 10}).status_code == 201
+    assert requests.post(server.base_uri + "/orders", json={"type": "limit", "size": 10}).status_code == 400
+    assert requests.post(server.base_uri + "/orders", json={"type": "market", "size": 5}).status_code == 500
+    assert requests.post(server.base_uri + "/orders", data="not json").status_code == 500
+
+
+def test_when_json_keeps_value_types(server: FakeServer):
+    server. \
+        on_("post", "/orders"). \
+        when(json={"id": 2}).response(status=201). \
+        when(json={"id": "2"}).response(status=202). \
+        when(json={"id": None}).response(status=400)
+
+    assert requests.post(server.base_uri + "/orders", json={"id": 2}).status_code == 201
+    assert requests.post(server.base_uri + "/orders", json={"id": "2"}).status_code == 202
+    assert requests.post(server.base_uri + "/orders", json={"id": None}).status_code == 400
+    assert requests.post(server.base_uri + "/orders", json={"id": 2.5}).status_code == 500
+
+
+def test_when_all_conditions_must_match(server: FakeServer):
+    server. \
+        on_("get", "/reports"). \
+        when(query={"year": "2017"}, headers={"X-Tenant": "first"}).response(status=200). \
+        when(query={"year": "2017"}).response(status=403)
+
+    assert requests.get(server.base_uri + "/reports?year=2017", headers={"X-Tenant": "first"}).status_code == 200
+    assert requests.get(server.base_uri + "/reports?year=2017", headers={"X-Tenant": "other"}).status_code == 403
+
+
+def test_when_first_registered_condition_wins(server: FakeServer):
+    server. \
+        on_("get", "/search"). \
+        when(headers={"X-Tenant": "first"}).response(status=201). \
+        when(query={"q": "py"}).response(status=202)
+
+    response = requests.get(server.base_uri + "/search?q=py", headers={"X-Tenant": "first"})
+    assert response.status_code == 201
+
+
+def test_when_stub_supports_number_of_responses(server: FakeServer):
+    server. \
+        on_("get", "/items"). \
+        response(status=200). \
+        when(query={"page": "2"}).response(status=201).once()
+
+    assert requests.get(server.base_uri + "/items?page=2").status_code == 201
+    assert requests.get(server.base_uri + "/items?page=2").status_code == 500
+
+
+def test_when_many_conditions(server: FakeServer):
+    endpoint = server.on_("get", "/users")
+    for user_id in range(300):
+        endpoint.when(query={"id": str(user_id)}).response(status=200, body=f"User {user_id}")
+
+    assert requests.get(server.base_uri + "/users?id=0").text == "User 0"
+    assert requests.get(server.base_uri + "/users?id=299").text == "User 299"
+
+
+def test_request_with_condition_is_recorded(server: FakeServer):
+    server. \
+        on_("post", "/orders"). \
+        when(json={"type": "market"}).response(status=201)
+
+    requests.post(server.base_uri + "/orders", json={"type": "market"})
+
+    assert server.was_requested("post", "/orders"). \
+        exactly_once(). \
+        for_the_first_time(). \
+        with_json({"type": "market"}).check()
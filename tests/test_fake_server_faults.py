@@ -0,0 +1,173 @@
+import http.client
+import socket
+import time
+
+import pytest
+import requests
+
+from py_fake_server import (
+    FakeServer, ConnectionReset, TruncatedBody, MalformedHeaders, SlowHeaders, StalledBody
+)
+
+
+def raw_get(server: FakeServer, path: str) -> bytes:
+    with socket.create_connection(("localhost", 8081), timeout=5) as connection:
+        connection.sendall(f"GET {path} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode())
+        chunks = []
+        while True:
+            chunk = connection.recv(65536)
+            if not chunk:
+                return b"".join(chunks)
+            chunks.append(chunk)
+
+
+def test_connection_reset(server: FakeServer):
+    server. \
+        on_("get", "/reset"). \
+        response(status=200, body="Never sent"). \
+        with_fault(ConnectionReset())
+
+    with pytest.raises(requests.ConnectionError):
+        requests.get(server.base_uri + "/reset")
+
+    assert server.was_requested("get", "/reset").exactly_once().check()
+
+
+def test_truncated_body(server: FakeServer):
+    server. \
+        on_("get", "/truncated"). \
+        response(status=200, body="0123456789"). \
+        with_fault(TruncatedBody(size=4))
+
+    connection = http.client.HTTPConnection("localhost", 8081, timeout=5)
+    connection.request("GET", "/truncated")
+    response = connection.getresponse()
+    with pytest.raises(http.client.IncompleteRead) as error:
+        response.read()
+
+    assert error.value.partial == b"0123"
+
+
+def test_malformed_headers(server: FakeServer):
+    server. \
+        on_("get", "/malformed"). \
+        response(status=200, body="Body", headers={"X-Header": "value"}). \
+        with_fault(MalformedHeaders())
+
+    raw_response = raw_get(server, "/malformed")
+
+    assert raw_response.startswith(b"HTTP/1.1 200 OK\r\n")
+    assert b"X-Header value\r\n" in raw_response
+    assert raw_response.endswith(b"\r\n\r\nBody")
+
+
+def test_slow_headers(server: FakeServer):
+    server. \
+        on_("get", "/slow"). \
+        response(status=200, body="Slow"). \
+        with_fault(SlowHeaders(delay=0.3))
+
+    started_at = time.monotonic()
+    response = requests.get(server.base_uri + "/slow")
+
+    assert response.text == "Slow"
+    assert time.monotonic() - started_at >= 0.3
+
+
+def test_slow_headers_do_not_block_other_requests(server: FakeServer):
+    server.on_("get", "/slow").response(status=200).with_fault(SlowHeaders(delay=2))
+    server.on_("get", "/fast").response(status=200)
+    slow_connections = [socket.create_connection(("localhost", 8081)) for _ in range(8)]
+    for connection in slow_connections:
+        connection.sendall(b"GET /slow HTTP/1.1\r\nHost: localhost\r\n\r\n")
+
+    started_at = time.monotonic()
+    response = requests.get(server.base_uri + "/fast")
+
+    assert response.status_code == 200
+    assert time.monotonic() - started_at < 1
+    for connection in slow_connections:
+        connection.close()
+
+
+def test_stalled_body(server: FakeServer):
+    server. \
+        on_("get", "/stalled"). \
+        response(status=200, body="0123456789"). \
+        with_fault(StalledBody(delay=0.3, size=5))
+
+    connection = http.client.HTTPConnection("localhost", 8081, timeout=5)
+    connection.request("GET", "/stalled")
+    response = connection.getresponse()
+    started_at = time.monotonic()
+
+    assert response.read(5) == b"01234"
+    assert response.read() == b"56789"
+    assert time.monotonic() - started_at >= 0.2
+
+
+def test_fault_on_scheduled_requests(server: FakeServer):
+    server. \
+        on_("get", "/scheduled"). \
+        response(status=200). \
+        with_fault(ConnectionReset(), on_requests=[2])
+
+    assert requests.get(server.base_uri + "/scheduled").status_code == 200
+    with pytest.raises(requests.ConnectionError):
+        requests.get(server.base_uri + "/scheduled")
+    assert requests.get(server.base_uri + "/scheduled").status_code == 200
+
+
+def test_fault_every_nth_request(server: FakeServer):
+    server. \
+        on_("get", "/every"). \
+        response(status=200, body="0123456789"). \
+        with_fault(TruncatedBody(size=1), every=2)
+
+    assert requests.get(server.base_uri + "/every").text == "0123456789"
+    with pytest.raises(requests.exceptions.ChunkedEncodingError):
+        requests.get(server.base_uri + "/every")
+    assert requests.get(server.base_uri + "/every").text == "0123456789"
+
+
+@pytest.mark.parametrize(["probability", "expected_faults"], [(0.0001, 0), (0.9999, 10)])
+def test_fault_with_probability(server: FakeServer, probability: float, expected_faults: int):
+    server. \
+        on_("get", "/probable"). \
+        response(status=200). \
+        with_fault(ConnectionReset(), probability=probability)
+
+    faults = 0
+    for _ in range(10):
+        try:
+            requests.get(server.base_uri + "/probable")
+        except requests.ConnectionError:
+            faults += 1
+
+    assert faults == expected_faults
+
+
+def test_fault_on_stub(server: FakeServer):
+    server. \
+        on_("get", "/stubbed"). \
+        response(status=200). \
+        when(query={"broken": "1"}).response(status=200).with_fault(ConnectionReset())
+
+    assert requests.get(server.base_uri + "/stubbed").status_code == 200
+    with pytest.raises(requests.ConnectionError):
+        requests.get(server.base_uri + "/stubbed?broken=1")
+    assert requests.get(server.base_uri + "/stubbed?broken=0").status_code == 200
+
+
+def test_fault_in_scenario_state(server: FakeServer):
+    outage = server.scenario("outage")
+    server. \
+        on_("get", "/flaky"). \
+        in_state(outage, "started").response(status=200).to_state("down"). \
+        in_state(outage, "down").response(status=200).with_fault(ConnectionReset()).to_state("up"). \
+        in_state(outage, "up").response(status=200)
+
+    assert requests.get(server.base_uri + "/flaky").status_code == 200
+    with pytest.raises(requests.ConnectionError):
+        requests.get(server.base_uri + "/flaky")
+    assert requests.get(server.base_uri + "/flaky").status_code == 200
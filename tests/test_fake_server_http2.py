@@ -0,0 +1,116 @@
+import socket
+import ssl
+import time
+from typing import Dict, List, Tuple
+from urllib.parse import urlsplit
+
+import pytest
+
+from py_fake_server import FakeServer, expect_that
+from py_fake_server.tls import certificate_for
+
+h2 = pytest.importorskip("h2")
+import h2.config  # noqa: E402
+import h2.connection  # noqa: E402
+import h2.events  # noqa: E402
+import h2.settings  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def http2_server(servers) -> FakeServer:
+    return servers.start(http2=True, max_concurrent_streams=10)
+
+
+def connect(server: FakeServer) -> socket.socket:
+    return socket.create_connection(("localhost", urlsplit(server.base_uri).port))
+
+
+def request_all(sock: socket.socket, requests: List[Tuple[str, str, bytes]]) -> Tuple[Dict[int, Tuple[Dict, bytes]], int]:
+    connection = h2.connection.H2Connection(h2.config.H2Configuration(client_side=True))
+    connection.initiate_connection()
+    sock.sendall(connection.data_to_send())
+
+    responses = {}
+    for method, path, body in requests:
+        stream_id = connection.get_next_available_stream_id()
+        connection.send_headers(stream_id, [
+            (":method", method), (":path", path), (":authority", "localhost"), (":scheme", "http"),
+            ("content-type", "application/json"),
+        ], end_stream=not body)
+        if body:
+            connection.send_data(stream_id, body, end_stream=True)
+        responses[stream_id] = ({}, b"")
+    sock.sendall(connection.data_to_send())
+
+    ended = set()
+    max_concurrent_streams = 0
+    while len(ended) < len(responses):
+        for event in connection.receive_data(sock.recv(65535)):
+            if isinstance(event, h2.events.ResponseReceived):
+                responses[event.stream_id] = (dict(event.headers), b"")
+            elif isinstance(event, h2.events.DataReceived):
+                headers, body = responses[event.stream_id]
+                responses[event.stream_id] = (headers, body + event.data)
+                connection.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+            elif isinstance(event, h2.events.StreamEnded):
+                ended.add(event.stream_id)
+            elif isinstance(event, h2.events.RemoteSettingsChanged):
+                setting = event.changed_settings.get(h2.settings.SettingCodes.MAX_CONCURRENT_STREAMS)
+                if setting is not None:
+                    max_concurrent_streams = setting.new_value
+        sock.sendall(connection.data_to_send())
+    return responses, max_concurrent_streams
+
+
+def test_http2_server(http2_server: FakeServer):
+    http2_server.on_("post", "/orders").response(status=201, json={"id": 1})
+
+    with connect(http2_server) as sock:
+        responses, max_concurrent_streams = request_all(sock, [("POST", "/orders?side=buy", b'{"size": 10}')])
+
+    headers, body = responses[1]
+    assert headers[b":status"] == b"201"
+    assert body == b'{"id": 1}'
+    assert max_concurrent_streams == 10
+    expect_that(http2_server.was_requested("post", "/orders").
+                exactly_once().
+                for_the_first_time().
+                with_query_params({"side": "buy"}).
+                with_json({"size": 10}))
+
+
+def test_http2_streams_are_served_concurrently(http2_server: FakeServer):
+    http2_server.on_("get", "/slow").response(status=200, body="slow", delay=0.3)
+
+    started_at = time.monotonic()
+    with connect(http2_server) as sock:
+        responses, _ = request_all(sock, [("GET", "/slow", b"")] * 5)
+
+    assert time.monotonic() - started_at < 1.0
+    assert [body for _, body in responses.values()] == [b"slow"] * 5
+    expect_that(http2_server.was_requested("get", "/slow").exactly_5_times())
+
+
+def test_http2_flow_control(http2_server: FakeServer):
+    body = "a" * 200000
+    http2_server.on_("get", "/large").response(status=200, body=body)
+
+    with connect(http2_server) as sock:
+        responses, _ = request_all(sock, [("GET", "/large", b""), ("GET", "/large", b"")])
+
+    assert [len(body) for _, body in responses.values()] == [200000, 200000]
+
+
+def test_http2_with_tls(servers, tmp_path):
+    certfile = certificate_for("localhost", str(tmp_path))
+    server = servers.start(certfile=certfile, http2=True)
+    server.on_("get", "/users").response(status=200, body="users")
+    context = ssl.create_default_context(cafile=certfile)
+    context.set_alpn_protocols(["h2"])
+
+    with context.wrap_socket(connect(server), server_hostname="localhost") as sock:
+        assert sock.selected_alpn_protocol() == "h2"
+        responses, _ = request_all(sock, [("GET", "/users", b"")])
+
+    assert responses[1][1] == b"users"
+    assert server.base_uri.startswith("https://localhost:")
@@ -0,0 +1,136 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+import pytest
+import requests
+
+from py_fake_server import FakeServer, expect_that
+
+
+def request_concurrently(url: str, number: int) -> List[int]:
+    with ThreadPoolExecutor(max_workers=number) as executor:
+        return sorted(response.status_code for response in executor.map(requests.get, [url] * number))
+
+
+def test_rate_limit_rejects_requests_above_burst(server: FakeServer):
+    server. \
+        on_("get", "/quota"). \
+        response(status=200). \
+        rate_limit(1, burst=2)
+
+    statuses = [requests.get(server.base_uri + "/quota").status_code for _ in range(3)]
+
+    assert statuses == [200, 200, 429]
+
+
+def test_rate_limit_refills_tokens(server: FakeServer):
+    server. \
+        on_("get", "/quota"). \
+        response(status=200). \
+        rate_limit(20, burst=1)
+
+    assert requests.get(server.base_uri + "/quota").status_code == 200
+    time.sleep(0.1)
+    assert requests.get(server.base_uri + "/quota").status_code == 200
+
+
+def test_rate_limit_with_queue_delays_requests(server: FakeServer):
+    server. \
+        on_("get", "/quota"). \
+        response(status=200). \
+        rate_limit(5, burst=1, queue_timeout=1)
+
+    started_at = time.monotonic()
+    statuses = [requests.get(server.base_uri + "/quota").status_code for _ in range(3)]
+
+    assert statuses == [200, 200, 200]
+    assert time.monotonic() - started_at >= 0.35
+
+
+def test_rate_limit_rejection_response(server: FakeServer):
+    server. \
+        on_("get", "/quota"). \
+        response(status=200). \
+        rate_limit(1, status=503)
+
+    requests.get(server.base_uri + "/quota")
+    response = requests.get(server.base_uri + "/quota")
+
+    assert response.status_code == 503
+    assert response.text == "Rate limit of 1 requests per second exceeded"
+
+
+def test_max_concurrency_rejects_requests(server: FakeServer):
+    server. \
+        on_("get", "/busy"). \
+        response(status=200, delay=0.5). \
+        max_concurrency(1)
+
+    assert request_concurrently(server.base_uri + "/busy", 2) == [200, 503]
+
+
+def test_max_concurrency_with_queue(server: FakeServer):
+    server. \
+        on_("get", "/busy"). \
+        response(status=200, delay=0.2). \
+        max_concurrency(1, queue_timeout=2)
+
+    assert request_concurrently(server.base_uri + "/busy", 2) == [200, 200]
+
+
+def test_server_wide_limit(server: FakeServer):
+    server.rate_limit(1, burst=1)
+    server.on_("get", "/first").response(status=200)
+    server.on_("get", "/second").response(status=200)
+
+    assert requests.get(server.base_uri + "/first").status_code == 200
+    assert requests.get(server.base_uri + "/second").status_code == 429
+
+
+def test_stub_limit(server: FakeServer):
+    server. \
+        on_("get", "/search"). \
+        response(status=200). \
+        when(query={"expensive": "1"}).response(status=200).rate_limit(1, burst=1)
+
+    statuses = [requests.get(server.base_uri + "/search?expensive=1").status_code for _ in range(2)]
+
+    assert statuses == [200, 429]
+    assert requests.get(server.base_uri + "/search").status_code == 200
+
+
+def test_rejected_requests_are_recorded(server: FakeServer):
+    server. \
+        on_("get", "/quota"). \
+        response(status=200). \
+        rate_limit(1, burst=1)
+
+    for _ in range(3):
+        requests.get(server.base_uri + "/quota")
+
+    expect_that(server.was_requested("get", "/quota").exactly_3_times().rejected_twice())
+    assert server.was_requested("get", "/quota").rejected_times == 2
+
+
+def test_rejected_times_raise_assertion(server: FakeServer):
+    server. \
+        on_("get", "/quota"). \
+        response(status=200). \
+        rate_limit(1, burst=1)
+
+    requests.get(server.base_uri + "/quota")
+    requests.get(server.base_uri + "/quota")
+
+    with pytest.raises(AssertionError) as error:
+        server.was_requested("get", "/quota").rejected_3_times()
+
+    assert str(error.value) == "Expect that server was requested with [GET] http://localhost:8081/quota. " \
+                               "Rejected 3 times.\nBut server rejected 1 times."
+
+
+def test_wrong_limit_raise_exception(server: FakeServer):
+    with pytest.raises(AttributeError) as error:
+        server.on_("get", "/quota").rate_limit(0)
+
+    assert str(error.value) == "Rate limit should be greater than 0"
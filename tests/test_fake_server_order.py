@@ -0,0 +1,58 @@
+import pytest
+import requests
+
+from py_fake_server import FakeServer, expect_that
+
+
+def test_requested_in_order(server: FakeServer):
+    requests.post(server.base_uri + "/auth")
+    requests.get(server.base_uri + "/users/34")
+    requests.patch(server.base_uri + "/portfolios/34")
+
+    assert expect_that(server).requested_in_order(("post", "/auth"), ("patch", "/portfolios/34"))
+
+
+def test_requested_in_order_with_repeated_routes(server: FakeServer):
+    requests.post(server.base_uri + "/auth")
+    requests.patch(server.base_uri + "/portfolios/34")
+    requests.post(server.base_uri + "/auth")
+    requests.patch(server.base_uri + "/portfolios/34")
+
+    assert server.requested_in_order(("post", "/auth"), ("patch", "/portfolios/34"),
+                                     ("post", "/auth"), ("patch", "/portfolios/34"))
+
+
+def test_requested_in_order_raise_assertion(server: FakeServer):
+    requests.patch(server.base_uri + "/portfolios/34")
+    requests.post(server.base_uri + "/auth")
+
+    with pytest.raises(AssertionError) as error:
+        server.requested_in_order(("post", "/auth"), ("patch", "/portfolios/34"))
+
+    assert str(error.value) == "Expect that server was requested in order:\n" \
+                               "[POST] http://localhost:8081/auth\n" \
+                               "[PATCH] http://localhost:8081/portfolios/34.\n" \
+                               "But [PATCH] http://localhost:8081/portfolios/34 was not requested " \
+                               "after [POST] http://localhost:8081/auth."
+
+
+def test_requested_in_order_raise_assertion_for_first_route(server: FakeServer):
+    with pytest.raises(AssertionError) as error:
+        server.requested_in_order(("post", "/auth"))
+
+    assert str(error.value) == "Expect that server was requested in order:\n" \
+                               "[POST] http://localhost:8081/auth.\n" \
+                               "But [POST] http://localhost:8081/auth was not requested."
+
+
+def test_requests_have_global_sequence(server: FakeServer):
+    requests.post(server.base_uri + "/auth")
+    requests.get(server.base_uri + "/users")
+    requests.post(server.base_uri + "/auth")
+
+    auth_requests = server.was_requested("post", "/auth").requests
+    users_requests = server.was_requested("get", "/users").requests
+    assert [request.sequence for request in auth_requests] == [1, 3]
+    assert [request.sequence for request in users_requests] == [2]
+    assert len(server.request_log) == 3
+    assert list(server.request_log.timestamps) == sorted(server.request_log.timestamps)
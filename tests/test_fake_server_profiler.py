@@ -0,0 +1,82 @@
+import pytest
+import requests
+
+from py_fake_server import FakeServer
+from py_fake_server.profiler import RequestProfiler
+
+
+@pytest.fixture(autouse=True)
+def stop_profiling(server: FakeServer):
+    yield
+    server.profiler = None
+
+
+def test_profiler_is_off_by_default(server: FakeServer):
+    server.on_("get", "/users").response(status=200)
+    requests.get(server.base_uri + "/users")
+
+    assert server.profiler is None
+
+
+def test_profile_stages_per_route(server: FakeServer):
+    server.on_("get", "/users").response(status=200, body="[]")
+    server.on_("post", "/users").response(status=201)
+    profiler = server.start_profiling()
+
+    requests.get(server.base_uri + "/users")
+    requests.post(server.base_uri + "/users", files={"avatar": b"image"})
+    requests.get(server.base_uri + "/unknown")
+
+    stages = profiler.stages()
+    assert sorted(stages) == ["GET /unknown", "GET /users", "POST /users"]
+    assert set(stages["GET /users"]) == {"dispatch", "capture", "match", "limits", "response", "statistics",
+                                         "serialize", "write"}
+    assert "multipart" in stages["POST /users"]
+    assert "multipart" not in stages["GET /users"]
+    assert all(duration >= 0 for route_stages in stages.values() for duration in route_stages.values())
+    assert profiler.sampled == 3
+
+
+def test_profile_window(server: FakeServer):
+    server.on_("get", "/users").response(status=200)
+    requests.get(server.base_uri + "/users")
+    profiler = server.start_profiling()
+    requests.get(server.base_uri + "/users")
+
+    assert server.stop_profiling() is profiler
+    requests.get(server.base_uri + "/users")
+
+    assert profiler.running is False
+    assert profiler.sampled == 1
+    assert profiler.started_at <= profiler.stopped_at
+
+
+def test_profile_sampling(server: FakeServer):
+    server.on_("get", "/users").response(status=200)
+    profiler = server.start_profiling(sample_every=3)
+
+    for _ in range(7):
+        requests.get(server.base_uri + "/users")
+
+    assert profiler.sampled == 3
+
+
+def test_collapsed_stacks(server: FakeServer):
+    server.on_("get", "/users;v=1").response(status=200)
+    profiler = server.start_profiling()
+    requests.get(server.base_uri + "/users;v=1")
+
+    lines = profiler.collapsed().splitlines()
+
+    assert len(lines) == 8
+    for line in lines:
+        stack, count = line.rsplit(" ", 1)
+        assert stack.startswith("fake_server;GET /users,v=1;")
+        assert int(count) >= 0
+
+
+def test_wrong_sample_every():
+    with pytest.raises(AttributeError) as error:
+        RequestProfiler(sample_every=0)
+
+    assert str(error.value) == "'sample_every' should be greater than 0"
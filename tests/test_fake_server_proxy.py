@@ -0,0 +1,115 @@
+import gzip
+import io
+
+import pytest
+import requests
+
+from py_fake_server import FakeServer, expect_that
+from py_fake_server.proxy import RequestBody, UpstreamPool
+
+
+@pytest.fixture(scope="module")
+def upstream(servers) -> FakeServer:
+    return servers.start()
+
+
+def test_proxy_unmatched_requests(server: FakeServer, upstream: FakeServer):
+    server.unmatched(proxy_to=upstream.base_uri)
+    upstream.on_("get", "/users").response(status=200, json={"users": []}, headers={"X-Upstream": "yes"})
+
+    response = requests.get(server.base_uri + "/users?limit=10", headers={"X-Client": "tests"})
+
+    assert response.status_code == 200
+    assert response.json() == {"users": []}
+    assert response.headers["X-Upstream"] == "yes"
+    expect_that(upstream.was_requested("get", "/users").
+                exactly_once().
+                for_the_first_time().
+                with_query_params({"limit": "10"}).
+                with_headers({"X-Client": "tests"}))
+    expect_that(server.was_requested("get", "/users").exactly_once())
+    assert server.all_requests_matched()
+
+
+def test_proxy_does_not_frame_requests_without_body(server: FakeServer, upstream: FakeServer):
+    server.unmatched(proxy_to=upstream.base_uri)
+    upstream.on_("get", "/users").response(status=200)
+
+    assert requests.get(server.base_uri + "/users").status_code == 200
+
+    upstream_headers = upstream.was_requested("get", "/users").requests[0].headers
+    assert "TRANSFER-ENCODING" not in upstream_headers
+    assert "CONTENT-LENGTH" not in upstream_headers
+
+
+def test_proxy_keeps_stubbed_endpoints(server: FakeServer, upstream: FakeServer):
+    server.unmatched(proxy_to=upstream.base_uri)
+    server.on_("get", "/users").response(status=200, body="fake")
+
+    assert requests.get(server.base_uri + "/users").text == "fake"
+    expect_that(upstream.was_not_requested("get", "/users"))
+
+
+def test_proxy_request_body_and_status(server: FakeServer, upstream: FakeServer):
+    server.unmatched(proxy_to=upstream.base_uri)
+    upstream.on_("post", "/orders").response(status=409, body="Conflict")
+
+    response = requests.post(server.base_uri + "/orders", json={"size": 10})
+
+    assert response.status_code == 409
+    assert response.text == "Conflict"
+    expect_that(upstream.was_requested("post", "/orders").for_the_first_time().with_json({"size": 10}))
+    expect_that(server.was_requested("post", "/orders").for_the_first_time().with_json({"size": 10}))
+
+
+def test_proxy_streams_large_and_compressed_bodies(server: FakeServer, upstream: FakeServer):
+    server.unmatched(proxy_to=upstream.base_uri)
+    upstream.on_("post", "/uploads").response(status=201)
+    body = "0123456789" * 100000
+
+    assert requests.post(server.base_uri + "/uploads", data=body).status_code == 201
+    assert requests.post(server.base_uri + "/uploads", data=gzip.compress(b"packed"),
+                         headers={"Content-Encoding": "gzip"}).status_code == 201
+
+    expect_that(upstream.was_requested("post", "/uploads").for_the_first_time().with_body(body))
+    expect_that(upstream.was_requested("post", "/uploads").for_the_second_time().with_body("packed"))
+    expect_that(server.was_requested("post", "/uploads").for_the_first_time().with_body(body))
+    expect_that(server.was_requested("post", "/uploads").for_the_second_time().with_body("packed"))
+
+
+def test_request_body_is_read_in_chunks_and_replayed():
+    stream = io.BytesIO(b"0123456789")
+    body = RequestBody(stream, 10, chunk_size=4)
+
+    assert next(iter(body)) == b"0123"
+    assert stream.tell() == 4
+    assert list(body) == [b"0123", b"4567", b"89"]
+    assert body.read_all() == b"0123456789"
+
+
+def test_proxy_unavailable_upstream(server: FakeServer):
+    server.unmatched(proxy_to="http://localhost:1")
+
+    response = requests.get(server.base_uri + "/users")
+
+    assert response.status_code == 502
+    assert response.text.startswith("Upstream http://localhost:1 is not available")
+
+
+def test_proxy_unknown_upstream(server: FakeServer):
+    with pytest.raises(AttributeError) as error:
+        server.unmatched(proxy_to="localhost:8084")
+
+    assert str(error.value) == "Unknown upstream 'localhost:8084'"
+
+
+def test_upstream_pool_reuses_connections(upstream: FakeServer):
+    upstream.on_("get", "/users").response(status=200, body="users")
+    pool = UpstreamPool(upstream.base_uri, max_connections=2)
+
+    for _ in range(3):
+        status, headers, length, stream = pool.forward("GET", "/users", {}, b"")
+        assert (status, length, b"".join(stream)) == ("200 OK", 5, b"users")
+
+    assert pool._idle.qsize() == 1
+    pool.close()
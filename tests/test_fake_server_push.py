@@ -0,0 +1,182 @@
+import base64
+import json
+import os
+import socket
+import struct
+import time
+from typing import List, Tuple
+from urllib.parse import urlsplit
+
+import pytest
+import requests
+
+from py_fake_server import FakeServer, expect_that
+
+
+class WebSocketClient:
+    def __init__(self, server: FakeServer, path: str):
+        address = urlsplit(server.base_uri)
+        self.socket = socket.create_connection((address.hostname, address.port), timeout=5)
+        key = base64.b64encode(os.urandom(16)).decode("ascii")
+        self.socket.sendall((
+            f"GET {path} HTTP/1.1\r\nHost: localhost\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+            f"Sec-WebSocket-Key: {key}\r\nSec-WebSocket-Version: 13\r\n\r\n"
+        ).encode("ascii"))
+        self._buffer = b""
+        while b"\r\n\r\n" not in self._buffer:
+            self._buffer += self.socket.recv(4096)
+        self.head, self._buffer = self._buffer.split(b"\r\n\r\n", 1)
+
+    def send(self, payload: bytes, opcode: int = 0x1):
+        mask = os.urandom(4)
+        masked = bytes(byte ^ mask[index % 4] for index, byte in enumerate(payload))
+        self.socket.sendall(struct.pack("!BB", 0x80 | opcode, 0x80 | len(payload)) + mask + masked)
+
+    def receive(self) -> Tuple[int, bytes]:
+        self._read(2)
+        opcode, length = self._buffer[0] & 0x0F, self._buffer[1] & 0x7F
+        self._buffer = self._buffer[2:]
+        if length == 126:
+            self._read(2)
+            length, = struct.unpack("!H", self._buffer[:2])
+            self._buffer = self._buffer[2:]
+        self._read(length)
+        payload, self._buffer = self._buffer[:length], self._buffer[length:]
+        return opcode, payload
+
+    def _read(self, size: int):
+        while len(self._buffer) < size:
+            data = self.socket.recv(4096)
+            if not data:
+                raise ConnectionError("Connection closed")
+            self._buffer += data
+
+    def close(self):
+        self.socket.close()
+
+
+@pytest.fixture
+def connect(server: FakeServer):
+    clients: List[WebSocketClient] = []
+
+    def connect_(path: str) -> WebSocketClient:
+        clients.append(WebSocketClient(server, path))
+        return clients[-1]
+
+    yield connect_
+    for client in clients:
+        client.close()
+
+
+def test_websocket_plays_script(server: FakeServer, connect):
+    server.on_websocket("/feed").send("hello").send({"price": 1}, times=2).send(b"\x00\x01").then_close()
+
+    client = connect("/feed")
+
+    assert client.head.startswith(b"HTTP/1.1 101 Switching Protocols")
+    assert [client.receive() for _ in range(5)] == [
+        (0x1, b"hello"), (0x1, b'{"price": 1}'), (0x1, b'{"price": 1}'), (0x2, b"\x00\x01"), (0x8, b"\x03\xe8"),
+    ]
+    expect_that(server.was_requested("get", "/feed").exactly_once())
+
+
+def test_websocket_records_inbound_messages(server: FakeServer, connect):
+    server.on_websocket("/feed")
+
+    client = connect("/feed?token=1")
+    client.send(b"subscribe")
+    client.send(json.dumps({"ticker": "ACME"}).encode("utf-8"))
+    client.send(b"ping", opcode=0x9)
+
+    assert client.receive() == (0xA, b"ping")
+    expect_that(server.received_over_websocket("/feed").exactly_twice())
+    expect_that(server.received_over_websocket("/feed").for_the_first_time().with_body("subscribe")
+                .with_query_params({"token": "1"}))
+    expect_that(server.received_over_websocket("/feed").for_the_second_time().with_json({"ticker": "ACME"}))
+
+
+def test_websocket_received_assertion(server: FakeServer):
+    server.on_websocket("/feed")
+
+    with pytest.raises(AssertionError) as error:
+        expect_that(server.received_over_websocket("/feed").exactly_once())
+
+    assert str(error.value) == "Expect that server was requested with [WS] http://localhost:8081/feed. 1 times.\n" \
+                               "But server was requested 0 times."
+
+
+def test_websocket_closes_on_client_close(server: FakeServer, connect):
+    server.on_websocket("/feed")
+
+    client = connect("/feed")
+    client.send(struct.pack("!H", 1001), opcode=0x8)
+
+    assert client.receive() == (0x8, struct.pack("!H", 1001))
+
+
+def test_websocket_rate_and_burst(server: FakeServer, connect):
+    server.on_websocket("/feed").send("tick", times=6).at_rate(20, burst=3)
+
+    client = connect("/feed")
+    started_at = time.monotonic()
+    for _ in range(6):
+        client.receive()
+
+    assert 0.1 <= time.monotonic() - started_at < 1.0
+
+
+def test_websocket_without_handshake(server: FakeServer):
+    server.on_websocket("/feed")
+
+    response = requests.get(server.base_uri + "/feed")
+
+    assert response.status_code == 400
+    assert response.text == "Expected a WebSocket handshake for [GET] http://localhost:8081/feed"
+
+
+def test_sse_plays_script(server: FakeServer):
+    server.on_sse("/events").event({"price": 1}, event="price", event_id="1").event("a\nb").then_close()
+
+    response = requests.get(server.base_uri + "/events", stream=True, timeout=5)
+
+    assert response.headers["Content-Type"] == "text/event-stream"
+    assert response.text == 'id: 1\nevent: price\ndata: {"price": 1}\n\ndata: a\ndata: b\n\n'
+    expect_that(server.was_requested("get", "/events").exactly_once())
+
+
+def test_idle_subscribers_do_not_hold_threads(server: FakeServer):
+    server.on_sse("/events").event("welcome")
+    server.on_("get", "/users").response(status=200)
+
+    subscribers = [requests.get(server.base_uri + "/events", stream=True, timeout=5) for _ in range(20)]
+
+    assert all(next(subscriber.iter_lines(chunk_size=1)) == b"data: welcome" for subscriber in subscribers)
+    assert requests.get(server.base_uri + "/users").status_code == 200
+    for subscriber in subscribers:
+        subscriber.close()
+
+
+def test_clear_closes_subscribers(server: FakeServer):
+    server.on_sse("/events").event("welcome")
+    subscriber = requests.get(server.base_uri + "/events", stream=True, timeout=5)
+    lines = subscriber.iter_lines(chunk_size=1)
+    assert next(lines) == b"data: welcome"
+
+    server.clear()
+
+    assert list(lines) == [b""]
+    assert requests.get(server.base_uri + "/events").status_code == 500
+
+
+def test_push_endpoints_configuration_errors(server: FakeServer):
+    with pytest.raises(AttributeError) as error:
+        server.on_sse("/events").at_rate(0)
+    assert str(error.value) == "Rate should be greater than 0"
+
+    with pytest.raises(AttributeError) as error:
+        server.on_websocket("/feed").send("tick", times=0)
+    assert str(error.value) == "Message should be sent at least 1 time"
+
+    with pytest.raises(AttributeError) as error:
+        FakeServer(host="localhost", port=0, tls=True).on_websocket("/feed")
+    assert str(error.value) == "WebSocket and SSE endpoints are served over plain HTTP/1.1 only"
@@ -0,0 +1,69 @@
+import json
+
+import requests
+
+from py_fake_server import FakeServer
+
+
+def test_empty_report(server: FakeServer):
+    assert server.report() == {
+        "requests": 0, "statuses": {}, "routes": [], "unmatched": [], "unmatched_overflow": 0, "never_hit": [],
+    }
+
+
+def test_report(server: FakeServer):
+    server.on_("post", "/users").response(status=201).response(status=409)
+    server.on_("get", "/users/{id}").response(status=200)
+    server.on_("get", "/orders").response(status=200)
+    server.on_("delete", "/orders").response(status=204)
+
+    requests.post(server.base_uri + "/users", data=b"")
+    requests.post(server.base_uri + "/users", data=b"x" * 100)
+    requests.get(server.base_uri + "/users/1")
+    requests.get(server.base_uri + "/order")
+
+    report = json.loads(json.dumps(server.report()))
+
+    assert report["requests"] == 4
+    assert report["statuses"] == {"200": 1, "201": 1, "409": 1, "500": 1}
+    users = report["routes"][0]
+    assert {key: value for key, value in users.items() if not key.endswith("_seconds")} == {
+        "method": "POST", "url": "http://localhost:8081/users", "requests": 2, "rejected": 0,
+        "statuses": {"201": 1, "409": 1}, "body_sizes": {"0": 1, "128": 1}, "body_bytes": 100, "largest_body": 100,
+    }
+    assert users["slowest_seconds"] >= users["mean_seconds"] > 0
+    assert report["unmatched"] == [{
+        "method": "GET", "url": "http://localhost:8081/order", "requests": 1,
+        "closest": ["[GET] http://localhost:8081/orders"],
+    }]
+    assert report["never_hit"] == [
+        {"method": "GET", "url": "http://localhost:8081/orders"},
+        {"method": "DELETE", "url": "http://localhost:8081/orders"},
+    ]
+
+
+def test_report_counts_rejected_requests(server: FakeServer):
+    server.on_("get", "/users").rate_limit(rate=0.001, burst=1).response(status=200)
+
+    requests.get(server.base_uri + "/users")
+    requests.get(server.base_uri + "/users")
+
+    route = server.report()["routes"][0]
+    assert (route["requests"], route["rejected"], route["statuses"]) == (2, 1, {"200": 1, "429": 1})
+
+
+def test_report_does_not_create_statistics(server: FakeServer):
+    server.on_("get", "/users").response(status=200)
+
+    server.report()
+
+    assert server._statistics == {}
+
+
+def test_report_is_cleared(server: FakeServer):
+    server.on_("get", "/users").response(status=200)
+    requests.get(server.base_uri + "/users")
+
+    server.clear()
+
+    assert server.report()["routes"] == []
@@ -0,0 +1,136 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+
+from py_fake_server import FakeServer
+
+
+def test_scenario_moves_through_states(server: FakeServer):
+    retries = server.scenario("retries")
+    server. \
+        on_("get", "/flaky"). \
+        in_state(retries, "started").response(status=503).to_state("failed_once"). \
+        in_state(retries, "failed_once").response(status=503).to_state("failed_twice"). \
+        in_state(retries, "failed_twice").response(status=200, body="Finally!")
+
+    statuses = [requests.get(server.base_uri + "/flaky").status_code for _ in range(4)]
+    assert statuses == [503, 503, 200, 200]
+    assert retries.state_of() == "failed_twice"
+
+
+def test_scenario_state_is_shared_between_endpoints(server: FakeServer):
+    token = server.scenario("token", initial_state="valid")
+    server. \
+        on_("get", "/items"). \
+        in_state(token, "valid").response(status=200).to_state("expired"). \
+        in_state(token, "expired").response(status=401)
+    server. \
+        on_("post", "/refresh"). \
+        in_state(token, "expired").response(status=200).to_state("valid")
+
+    assert requests.get(server.base_uri + "/items").status_code == 200
+    assert requests.get(server.base_uri + "/items").status_code == 401
+    assert requests.post(server.base_uri + "/refresh").status_code == 200
+    assert requests.get(server.base_uri + "/items").status_code == 200
+
+
+def test_scenario_state_per_client_header(server: FakeServer):
+    retries = server.scenario("retries", client_header="X-Client-Id")
+    server. \
+        on_("get", "/flaky"). \
+        in_state(retries, "started").response(status=503).to_state("ready"). \
+        in_state(retries, "ready").response(status=200)
+
+    first_client = {"X-Client-Id": "first"}
+    second_client = {"X-Client-Id": "second"}
+    assert requests.get(server.base_uri + "/flaky", headers=first_client).status_code == 503
+    assert requests.get(server.base_uri + "/flaky", headers=first_client).status_code == 200
+    assert requests.get(server.base_uri + "/flaky", headers=second_client).status_code == 503
+    assert retries.state_of("first") == "ready"
+
+
+def test_scenario_state_per_client_cookie(server: FakeServer):
+    session = server.scenario("session", client_cookie="session")
+    server. \
+        on_("get", "/me"). \
+        in_state(session, "started").response(status=200).to_state("logged_out"). \
+        in_state(session, "logged_out").response(status=401)
+
+    assert requests.get(server.base_uri + "/me", cookies={"session": "a"}).status_code == 200
+    assert requests.get(server.base_uri + "/me", cookies={"session": "b"}).status_code == 200
+    assert requests.get(server.base_uri + "/me", cookies={"session": "a"}).status_code == 401
+
+
+def test_scenario_without_response_for_state_falls_back_to_responses(server: FakeServer):
+    scenario = server.scenario("partial", initial_state="unknown")
+    server. \
+        on_("get", "/partial"). \
+        response(status=204). \
+        in_state(scenario, "known").response(status=200)
+
+    assert requests.get(server.base_uri + "/partial").status_code == 204
+
+
+def test_in_state_applies_to_next_response_only(server: FakeServer):
+    outage = server.scenario("outage", initial_state="down")
+    server. \
+        on_("get", "/items"). \
+        in_state(outage, "down").response(status=503).to_state("up"). \
+        response(status=200).twice(). \
+        response(status=404)
+
+    statuses = [requests.get(server.base_uri + "/items").status_code for _ in range(5)]
+
+    assert statuses == [503, 200, 200, 404, 404]
+
+
+def test_scenario_transitions_are_atomic(server: FakeServer):
+    tickets = server.scenario("tickets")
+    server. \
+        on_("post", "/tickets"). \
+        in_state(tickets, "started").response(status=201).to_state("sold_out"). \
+        in_state(tickets, "sold_out").response(status=409)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        statuses = list(executor.map(lambda _: requests.post(server.base_uri + "/tickets").status_code, range(16)))
+
+    assert sorted(statuses) == [201] + [409] * 15
+
+
+def test_scenario_is_reset_by_clear(server: FakeServer):
+    scenario = server.scenario("cleared")
+    scenario.move_to(None, "moved")
+
+    server.clear()
+
+    assert server.scenario("cleared").state_of() == "started"
+
+
+def test_endpoint_in_two_scenarios_raise_exception(server: FakeServer):
+    with pytest.raises(AttributeError) as error:
+        server. \
+            on_("get", "/two"). \
+            in_state(server.scenario("first"), "started").response(status=200). \
+            in_state(server.scenario("second"), "started").response(status=200)
+
+    assert str(error.value) == "Endpoint [GET] http://localhost:8081/two already belongs to scenario 'first'"
+
+
+def test_to_state_without_response_raise_exception(server: FakeServer):
+    with pytest.raises(AttributeError) as error:
+        server. \
+            on_("get", "/empty"). \
+            in_state(server.scenario("empty"), "started").to_state("next")
+
+    assert str(error.value) == "'to_state' without response in state"
+
+
+def test_times_for_state_response_raise_exception(server: FakeServer):
+    with pytest.raises(AttributeError) as error:
+        server. \
+            on_("get", "/once"). \
+            in_state(server.scenario("once"), "started").response(status=200).twice()
+
+    assert str(error.value) == "'times' for a response in state 'started', " \
+                               "a state response is served every time the state is entered"
@@ -0,0 +1,79 @@
+from collections import Counter
+
+import pytest
+import requests
+
+from py_fake_server import FakeServer, expect_that
+from py_fake_server.response import Response
+from py_fake_server.selection import WeightedSelection
+
+
+def test_round_robin(server: FakeServer):
+    server.on_("get", "/users").round_robin(). \
+        response(status=200, body="first"). \
+        response(status=200, body="second"). \
+        response(status=503)
+
+    responses = [requests.get(server.base_uri + "/users") for _ in range(6)]
+
+    assert [response.status_code for response in responses] == [200, 200, 503] * 2
+    assert [response.text for response in responses[:2]] == ["first", "second"]
+    expect_that(server.was_requested("get", "/users").
+                served_variant(0, 2).
+                served_variant(1, 2).
+                served_variant(2, 2))
+
+
+def test_weighted_is_reproducible_with_seed(server: FakeServer):
+    def statuses():
+        server.on_("get", "/users").weighted(seed=42). \
+            response(status=200, weight=90). \
+            response(status=503, weight=10)
+        return [requests.get(server.base_uri + "/users").status_code for _ in range(30)]
+
+    assert statuses() == statuses()
+
+
+def test_served_variant_raise_assertion(server: FakeServer):
+    server.on_("get", "/users").weighted().response(status=200)
+    requests.get(server.base_uri + "/users")
+
+    with pytest.raises(AssertionError) as error:
+        server.was_requested("get", "/users").served_variant(1, 1).check()
+
+    assert str(error.value) == "Expect that server was requested with [GET] http://localhost:8081/users.\n" \
+                               "With variant 1 served 1 times.\n" \
+                               "But it was served 0 times."
+
+
+def test_weighted_selection_distribution():
+    selection = WeightedSelection(seed=1)
+    for weight in (97, 2, 1):
+        selection.add(Response(status=200), weight)
+
+    counts = Counter(selection.choose().variant for _ in range(100000))
+
+    assert abs(counts[0] / 100000 - 0.97) < 0.005
+    assert abs(counts[1] / 100000 - 0.02) < 0.005
+    assert abs(counts[2] / 100000 - 0.01) < 0.005
+
+
+def test_weighted_selection_weight():
+    with pytest.raises(AttributeError) as error:
+        WeightedSelection().add(Response(status=200), 0)
+
+    assert str(error.value) == "Weight should be greater than 0"
+
+
+def test_selection_configuration_errors(server: FakeServer):
+    with pytest.raises(AttributeError) as error:
+        server.on_("get", "/users").response(status=200, weight=2)
+    assert str(error.value) == "'weight' is only supported for responses after 'weighted()'"
+
+    with pytest.raises(AttributeError) as error:
+        server.on_("get", "/users").response(status=200).weighted()
+    assert str(error.value) == "'weighted' should be called before responses of [GET] http://localhost:8081/users"
+
+    with pytest.raises(AttributeError) as error:
+        server.on_("get", "/users").round_robin().response(status=200).round_robin()
+    assert str(error.value) == "'round_robin' should be called before responses of [GET] http://localhost:8081/users"
@@ -0,0 +1,151 @@
+import pytest
+import requests
+
+from py_fake_server import FakeServer, expect_that
+
+
+def test_restore_rewinds_responses(server: FakeServer):
+    server.on_("get", "/users").response(status=200, body="first").once().then().response(status=500)
+    snapshot = server.snapshot()
+
+    assert requests.get(server.base_uri + "/users").text == "first"
+    assert requests.get(server.base_uri + "/users").status_code == 500
+
+    server.restore(snapshot)
+    assert requests.get(server.base_uri + "/users").text == "first"
+
+
+def test_restore_rewinds_statistics(server: FakeServer):
+    requests.get(server.base_uri + "/users")
+    snapshot = server.snapshot()
+    requests.get(server.base_uri + "/users")
+    requests.post(server.base_uri + "/auth")
+
+    server.restore(snapshot)
+
+    expect_that(server.was_requested("get", "/users").exactly_once())
+    expect_that(server.was_not_requested("post", "/auth"))
+    assert len(server.request_log) == 1
+
+
+def test_restore_same_snapshot_twice(server: FakeServer):
+    server.on_("post", "/auth").response(status=201).once()
+    snapshot = server.snapshot()
+
+    for _ in range(2):
+        server.restore(snapshot)
+        assert requests.post(server.base_uri + "/auth").status_code == 201
+        expect_that(server.was_requested("post", "/auth").exactly_once())
+
+
+def test_restore_keeps_snapshot_history_untouched(server: FakeServer):
+    requests.post(server.base_uri + "/auth", data="first")
+    snapshot = server.snapshot()
+
+    server.restore(snapshot)
+    requests.post(server.base_uri + "/auth", data="second")
+    server.restore(snapshot)
+
+    expect_that(server.was_requested("post", "/auth").exactly_once().for_the_first_time().with_body("first"))
+
+
+def test_restore_discards_endpoints_defined_after_snapshot(server: FakeServer):
+    snapshot = server.snapshot()
+    server.on_("get", "/users").response(status=200)
+
+    server.restore(snapshot)
+
+    assert requests.get(server.base_uri + "/users").status_code == 500
+
+
+def test_restore_rewinds_scenario_states(server: FakeServer):
+    checkout = server.scenario("checkout")
+    server.on_("post", "/cart"). \
+        in_state(checkout, "started").response(status=201).to_state("paid"). \
+        in_state(checkout, "paid").response(status=409)
+    snapshot = server.snapshot()
+
+    assert requests.post(server.base_uri + "/cart").status_code == 201
+    assert requests.post(server.base_uri + "/cart").status_code == 409
+
+    server.restore(snapshot)
+    assert requests.post(server.base_uri + "/cart").status_code == 201
+
+
+def test_restore_discards_limits_added_after_snapshot(server: FakeServer):
+    snapshot = server.snapshot()
+    server.rate_limit(0.001, burst=1)
+    requests.get(server.base_uri + "/users")
+
+    server.restore(snapshot)
+
+    assert requests.get(server.base_uri + "/users").status_code == 500
+
+
+def test_nested_snapshots(server: FakeServer):
+    server.on_("get", "/users").response(status=200, body="1").once()\
+        .then().response(status=200, body="2").once()\
+        .then().response(status=200, body="3")
+    first = server.snapshot()
+    requests.get(server.base_uri + "/users")
+    second = server.snapshot()
+    requests.get(server.base_uri + "/users")
+
+    server.restore(second)
+    assert requests.get(server.base_uri + "/users").text == "2"
+    server.restore(first)
+    assert requests.get(server.base_uri + "/users").text == "1"
+
+
+
+def test_endpoints_of_snapshot_can_not_be_changed(server: FakeServer):
+    endpoint = server.on_("get", "/users").response(status=200, body="first")
+    events = server.on_sse("/events").event("first")
+    server.snapshot()
+
+    with pytest.raises(AttributeError) as error:
+        endpoint.response(status=500)
+    with pytest.raises(AttributeError):
+        events.event("second")
+
+    assert str(error.value) == f"[GET] {server.base_uri}/users belongs to a snapshot, define it again to change it"
+    assert requests.get(server.base_uri + "/users").text == "first"
+
+
+def test_restore_rewinds_rate_limits(server: FakeServer):
+    server.on_("get", "/users").rate_limit(0.001, burst=1).response(status=200)
+    snapshot = server.snapshot()
+
+    assert requests.get(server.base_uri + "/users").status_code == 200
+    assert requests.get(server.base_uri + "/users").status_code == 429
+
+    server.restore(snapshot)
+    assert requests.get(server.base_uri + "/users").status_code == 200
+
+
+def test_restore_rewinds_response_selection(server: FakeServer):
+    server.on_("get", "/users").round_robin().response(status=200, body="a").response(status=200, body="b")
+    server.on_("get", "/games").weighted(seed=7). \
+        response(status=200, body="a", weight=1).response(status=200, body="b", weight=1)
+    snapshot = server.snapshot()
+
+    served = [requests.get(server.base_uri + url).text for url in ["/users", "/games"] * 5]
+    server.restore(snapshot)
+
+    assert [requests.get(server.base_uri + url).text for url in ["/users", "/games"] * 5] == served
+    assert served[:4:2] == ["a", "b"]
+
+
+def test_restore_rewinds_traffic_and_unmatched_settings(server: FakeServer):
+    requests.get(server.base_uri + "/users")
+    snapshot = server.snapshot()
+    server.unmatched(status=404, record=False)
+    requests.get(server.base_uri + "/users")
+    requests.get(server.base_uri + "/games")
+
+    server.restore(snapshot)
+
+    assert server.report()["requests"] == 1
+    assert [route["url"] for route in server.report()["routes"]] == [server.base_uri + "/users"]
+    assert requests.get(server.base_uri + "/games").status_code == 500
+    expect_that(server.was_requested("get", "/games").exactly_once())
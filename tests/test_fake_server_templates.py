@@ -0,0 +1,119 @@
+import uuid
+
+import pytest
+import requests
+
+from py_fake_server import FakeServer
+
+
+def test_template_renders_path_params(server: FakeServer):
+    server. \
+        on_("get", "/users/{user_id}/games/{game_id}"). \
+        response(status=200, template='{"user": "{{ path.user_id }}", "game": {{path.game_id}}}',
+                 content_type="application/json")
+
+    response = requests.get(server.base_uri + "/users/34/games/7")
+    assert response.json() == {"user": "34", "game": 7}
+    assert response.headers["Content-Type"] == "application/json"
+
+
+def test_template_renders_query_headers_and_cookies(server: FakeServer):
+    server. \
+        on_("get", "/echo"). \
+        response(status=200, template="{{query.page}} {{headers.X-Request-Id}} {{cookies.token}}")
+
+    response = requests.get(server.base_uri + "/echo?page=2", headers={"X-Request-Id": "abc"},
+                            cookies={"token": "secret"})
+    assert response.text == "2 abc secret"
+
+
+def test_template_renders_json_fields(server: FakeServer):
+    server. \
+        on_("post", "/orders"). \
+        response(status=201, template='{"id": {{json.order.id}}, "first": {{json.items.0}}, "missing": "{{json.no}}"}')
+
+    response = requests.post(server.base_uri + "/orders", json={"order": {"id": 5}, "items": [{"a": 1}]})
+    assert response.json() == {"id": 5, "first": {"a": 1}, "missing": ""}
+
+
+def test_template_renders_body_and_uuid(server: FakeServer):
+    server. \
+        on_("post", "/echo"). \
+        response(status=200, template="{{body}}|{{uuid}}")
+
+    body_0, uuid_0 = requests.post(server.base_uri + "/echo", data="Hello").text.split("|")
+    body_1, uuid_1 = requests.post(server.base_uri + "/echo", data="World").text.split("|")
+    assert (body_0, body_1) == ("Hello", "World")
+    assert uuid.UUID(uuid_0) != uuid.UUID(uuid_1)
+
+
+def test_template_renders_headers(server: FakeServer):
+    server. \
+        on_("get", "/echo"). \
+        response(status=200, template="ok", headers={"X-Request-Id": "{{headers.X-Request-Id}}", "X-Static": "1"})
+
+    response = requests.get(server.base_uri + "/echo", headers={"X-Request-Id": "abc"})
+    assert response.headers["X-Request-Id"] == "abc"
+    assert response.headers["X-Static"] == "1"
+
+
+def test_path_params_route_does_not_match_other_paths(server: FakeServer):
+    server. \
+        on_("get", "/users/{user_id}"). \
+        response(status=200)
+
+    assert requests.get(server.base_uri + "/users/34").status_code == 200
+    assert requests.get(server.base_uri + "/users/34/games").status_code == 500
+    assert requests.post(server.base_uri + "/users/34").status_code == 500
+
+
+def test_path_params_route_is_recorded_with_concrete_url(server: FakeServer):
+    server. \
+        on_("get", "/users/{user_id}"). \
+        response(status=200)
+
+    requests.get(server.base_uri + "/users/34")
+
+    assert server.was_requested("get", "/users/34").exactly_once().check()
+
+
+def test_requested_path_with_braces_is_recorded(server: FakeServer):
+    server. \
+        on_("get", "/users/{user_id}"). \
+        response(status=200)
+
+    assert requests.get(server.base_uri + "/x/%7B1%7D").status_code == 500
+    assert requests.get(server.base_uri + "/x/%7Ba%7D/%7Ba%7D").status_code == 500
+
+    assert server.was_requested("get", "/x/{1}").exactly_once().check()
+    assert server.was_requested("get", "/x/{a}/{a}").exactly_once().check()
+
+
+@pytest.mark.parametrize("url, message", [
+    ("/users/{id}/games/{id}", "Path parameter 'id' is used more than once in '{base_uri}/users/{id}/games/{id}'"),
+    ("/users/{1}", "Path parameter name '1' in '{base_uri}/users/{1}' is not a valid identifier"),
+    ("/users/{user-id}", "Path parameter name 'user-id' in '{base_uri}/users/{user-id}' is not a valid identifier"),
+])
+def test_invalid_path_params_raise_exception(server: FakeServer, url: str, message: str):
+    with pytest.raises(AttributeError) as error:
+        server.on_("get", url)
+
+    assert str(error.value) == message.replace("{base_uri}", server.base_uri)
+
+
+def test_template_with_unknown_variable_raise_exception(server: FakeServer):
+    with pytest.raises(AttributeError) as error:
+        server. \
+            on_("get", "/error"). \
+            response(status=200, template="{{ unknown.variable }}")
+
+    assert str(error.value) == "Unknown template variable 'unknown.variable'"
+
+
+def test_template_and_body_raise_exception(server: FakeServer):
+    with pytest.raises(AttributeError) as error:
+        server. \
+            on_("get", "/error"). \
+            response(status=200, body="body", template="template")
+
+    assert str(error.value) == "'template' and 'body' or 'json' in one response"
@@ -0,0 +1,69 @@
+import os
+import socket
+import ssl
+from urllib.parse import urlsplit
+
+import pytest
+import requests
+
+from py_fake_server import FakeServer, expect_that
+from py_fake_server.tls import certificate_for
+
+
+@pytest.fixture(scope="module")
+def tls_server(servers, tmp_path_factory) -> FakeServer:
+    return servers.start(certfile=certificate_for("localhost", str(tmp_path_factory.mktemp("certificates"))))
+
+
+def test_tls_server(tls_server: FakeServer):
+    tls_server.on_("post", "/orders").response(status=201, json={"id": 1})
+
+    response = requests.post(tls_server.base_uri + "/orders", json={"size": 10}, verify=tls_server.certfile)
+
+    assert tls_server.base_uri.startswith("https://localhost:")
+    assert response.status_code == 201
+    assert response.json() == {"id": 1}
+    expect_that(tls_server.was_requested("post", "/orders").exactly_once().for_the_first_time().with_json({"size": 10}))
+
+
+def test_tls_server_with_large_body(tls_server: FakeServer):
+    body = "a" * 100000
+    tls_server.on_("post", "/orders").response(status=200, body=body)
+
+    with requests.Session() as session:
+        for _ in range(3):
+            response = session.post(tls_server.base_uri + "/orders", data=body, verify=tls_server.certfile)
+            assert response.text == body
+
+    expect_that(tls_server.was_requested("post", "/orders").exactly_3_times().for_the_3_time().with_body(body))
+
+
+def test_tls_session_resumption(tls_server: FakeServer):
+    context = ssl.create_default_context(cafile=tls_server.certfile)
+    context.maximum_version = ssl.TLSVersion.TLSv1_2
+
+    def connect(session=None) -> ssl.SSLSocket:
+        connection = socket.create_connection(("localhost", urlsplit(tls_server.base_uri).port))
+        return context.wrap_socket(connection, server_hostname="localhost", session=session)
+
+    with connect() as first_connection:
+        session = first_connection.session
+    with connect(session) as second_connection:
+        assert second_connection.session_reused
+
+
+def test_certificate_is_cached(tmp_path):
+    path = certificate_for("localhost", str(tmp_path))
+    modified_at = os.stat(path).st_mtime_ns
+
+    assert certificate_for("localhost", str(tmp_path)) == path
+    assert os.stat(path).st_mtime_ns == modified_at
+    assert os.listdir(str(tmp_path)) == ["localhost.pem"]
+    assert os.stat(path).st_mode & 0o777 == 0o600
+
+
+def test_keyfile_without_certfile():
+    with pytest.raises(AttributeError) as error:
+        FakeServer(host="localhost", port=0, keyfile="key.pem")
+
+    assert str(error.value) == "'keyfile' without 'certfile'"
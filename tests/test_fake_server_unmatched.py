@@ -0,0 +1,95 @@
+import pytest
+import requests
+
+from py_fake_server import FakeServer, expect_that
+from py_fake_server.route import Route
+from py_fake_server.unmatched import RouteIndex, UnmatchedRoutes
+
+
+def test_unmatched_request_status(server: FakeServer):
+    server.unmatched(status=404)
+
+    response = requests.get(server.base_uri + "/missing")
+
+    assert response.status_code == 404
+    assert response.text == "Server has not responses for [GET] http://localhost:8081/missing"
+    expect_that(server.was_requested("get", "/missing").exactly_once())
+
+
+def test_unmatched_requests_without_recording(server: FakeServer):
+    server.unmatched(status=404, record=False)
+    server.on_("get", "/users").response(status=200)
+
+    responses = [requests.get(server.base_uri + "/missing") for _ in range(3)]
+
+    assert [response.status_code for response in responses] == [404] * 3
+    assert responses[0].text == "Server has not responses for [GET] http://localhost:8081/missing"
+    expect_that(server.was_requested("get", "/missing").exactly_0_times())
+    assert len(server.request_log) == 0
+    assert server.report()["unmatched"] == [{
+        "method": "GET", "url": "http://localhost:8081/missing", "requests": 3,
+        "closest": [],
+    }]
+    with pytest.raises(AssertionError):
+        server.all_requests_matched()
+
+
+def test_unmatched_request_unknown_status(server: FakeServer):
+    with pytest.raises(AttributeError) as error:
+        server.unmatched(status=999)
+
+    assert str(error.value) == "Unknown status 999 for unmatched requests"
+
+
+def test_all_requests_matched(server: FakeServer):
+    server.on_("get", "/users").response(status=200)
+    requests.get(server.base_uri + "/users")
+
+    assert expect_that(server).all_requests_matched()
+
+
+def test_all_requests_matched_raise_assertion_with_closest_endpoints(server: FakeServer):
+    server.on_("get", "/users").response(status=200)
+    server.on_("get", "/users/{id}").response(status=200)
+    server.on_("post", "/auth").response(status=201)
+    requests.get(server.base_uri + "/user")
+    requests.get(server.base_uri + "/user")
+    requests.delete(server.base_uri + "/games")
+
+    with pytest.raises(AssertionError) as error:
+        server.all_requests_matched()
+
+    assert str(error.value) == "Expect that all requests matched endpoints.\n" \
+                               "But [GET] http://localhost:8081/user was requested 2 times. " \
+                               "Closest endpoints: [GET] http://localhost:8081/users, " \
+                               "[GET] http://localhost:8081/users/{id}.\n" \
+                               "But [DELETE] http://localhost:8081/games was requested 1 times."
+
+
+def test_unmatched_routes_are_bounded(server: FakeServer):
+    server.unmatched(max_routes=1)
+    requests.get(server.base_uri + "/first")
+    requests.get(server.base_uri + "/second")
+    requests.get(server.base_uri + "/third")
+
+    with pytest.raises(AssertionError) as error:
+        server.all_requests_matched()
+
+    assert str(error.value) == "Expect that all requests matched endpoints.\n" \
+                               "But [GET] http://localhost:8081/first was requested 1 times.\n" \
+                               "And 2 requests to other routes."
+
+
+def test_route_index_prefers_same_method():
+    index = RouteIndex([Route("post", "", "/users"), Route("get", "", "/users")])
+
+    assert index.closest(Route("get", "", "/user"), number=1) == [Route("get", "", "/users")]
+
+
+def test_unmatched_routes_copy_is_independent():
+    unmatched = UnmatchedRoutes()
+    unmatched.record(Route("get", "", "/users"))
+    copy = unmatched.copy()
+    unmatched.record(Route("get", "", "/users"))
+
+    assert copy.most_common() == [(Route("get", "", "/users"), 1)]
@@ -0,0 +1,41 @@
+import json
+import subprocess
+import sys
+
+HEAVY_MODULES = ("falcon", "falcon_multipart", "webtest", "waitress", "http.client", "ssl", "urllib.request", "h2",
+                 "hashlib", "lzma", "uuid", "socket")
+
+IMPORT_SCRIPT = """
+import json
+import sys
+import time
+
+loaded = set(sys.modules)
+start = time.perf_counter()
+from py_fake_server import FakeServer, FakeServerClient, expect_that
+elapsed = time.perf_counter() - start
+modules = [module for module in %r if module in sys.modules and module not in loaded]
+
+start = time.perf_counter()
+import falcon, falcon_multipart, waitress, webtest
+serving_stack = time.perf_counter() - start
+print(json.dumps({"elapsed": elapsed, "serving_stack": serving_stack, "modules": modules}))
+"""
+
+
+def import_package() -> dict:
+    output = subprocess.check_output([sys.executable, "-c", IMPORT_SCRIPT % (HEAVY_MODULES,)])
+    return json.loads(output)
+
+
+def test_import_does_not_load_serving_stack():
+    assert import_package()["modules"] == []
+
+
+def test_import_is_fast():
+    ratios = []
+    for _ in range(3):
+        result = import_package()
+        ratios.append(result["elapsed"] / result["serving_stack"])
+
+    assert min(ratios) < 0.5
@@ -0,0 +1,72 @@
+pytest_plugins = "pytester"
+
+
+def test_fake_server_fixture_is_reset_between_tests(testdir):
+    testdir.makepyfile("""
+        import requests
+
+        from py_fake_server import expect_that
+
+
+        def test_configure(fake_server):
+            fake_server.on_("get", "/users").response(status=200, body="users")
+            assert requests.get(fake_server.base_uri + "/users").text == "users"
+
+
+        def test_reset(fake_server):
+            assert requests.get(fake_server.base_uri + "/users").status_code == 500
+            expect_that(fake_server.was_requested("get", "/users").exactly_once())
+    """)
+
+    result = testdir.runpytest("-p", "py_fake_server.pytest_plugin")
+
+    result.assert_outcomes(passed=2)
+
+
+def test_fake_server_uses_free_port(testdir):
+    testdir.makepyfile("""
+        def test_port(fake_server):
+            assert not fake_server.base_uri.endswith(":0")
+    """)
+
+    result = testdir.runpytest("-p", "py_fake_server.pytest_plugin")
+
+    result.assert_outcomes(passed=1)
+
+
+def test_report_slowest_and_heaviest_routes(testdir):
+    testdir.makepyfile("""
+        import requests
+
+
+        def test_requests(fake_server):
+            fake_server.on_("get", "/slow").response(status=200, delay=0.05)
+            requests.get(fake_server.base_uri + "/slow")
+            requests.get(fake_server.base_uri + "/users")
+            requests.get(fake_server.base_uri + "/users")
+    """)
+
+    result = testdir.runpytest("-p", "py_fake_server.pytest_plugin")
+
+    result.stdout.fnmatch_lines([
+        "*fake server routes*",
+        "slowest routes:",
+        "0.0* max 0.0* mean [[]GET[]] http://localhost:*/slow",
+        "*",
+        "heaviest routes:",
+        "2 requests [[]GET[]] http://localhost:*/users",
+    ])
+
+
+def test_report_disabled(testdir):
+    testdir.makepyfile("""
+        import requests
+
+
+        def test_requests(fake_server):
+            requests.get(fake_server.base_uri + "/users")
+    """)
+
+    result = testdir.runpytest("-p", "py_fake_server.pytest_plugin", "--fake-server-report=0")
+
+    assert "fake server routes" not in result.stdout.str()
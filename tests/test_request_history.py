@@ -0,0 +1,74 @@
+import threading
+
+import pytest
+import requests
+
+from py_fake_server import FakeServer
+from py_fake_server.history import RequestHistory
+from py_fake_server.request import Request
+
+
+def make_request(body: bytes, headers: dict) -> Request:
+    return Request.from_record(number=0, load_body=lambda: body, content_type="text/plain", cookies={},
+                               headers=headers, query_params={"page": "1"}, files=None)
+
+
+def test_history_returns_requests_as_views():
+    history = RequestHistory()
+    history.append(make_request(b"first", {"HOST": "localhost"}), status=200)
+    history.append(make_request(b"", {"HOST": "localhost"}), status=204)
+    history.append(make_request(b"third", {"HOST": "example.com"}), status=500, rejected=True)
+
+    assert len(history) == 3
+    assert [request.body for request in history] == [b"first", b"", b"third"]
+    assert [request.number for request in history] == [1, 2, 3]
+    assert history[-1].headers == {"HOST": "example.com"}
+    assert history[0].query_params == {"page": "1"}
+    assert history[0].content_type == "text/plain"
+    assert [request.number for request in history[1:]] == [2, 3]
+    assert list(history.statuses) == [200, 204, 500]
+    assert list(history.rejected) == [0, 0, 1]
+
+
+def test_history_shares_header_names():
+    history = RequestHistory()
+    history.append(make_request(b"", {"HOST": "first", "ACCEPT": "*/*"}))
+    history.append(make_request(b"", {"HOST": "second", "ACCEPT": "*/*"}))
+
+    first_names = list(history[0].headers)
+    second_names = list(history[1].headers)
+    assert all(first is second for first, second in zip(first_names, second_names))
+
+
+def test_history_concurrent_appends_keep_columns_aligned():
+    history = RequestHistory()
+
+    def append(number: int):
+        for _ in range(200):
+            history.append(make_request(str(number).encode(), {"NUMBER": str(number)}), status=200 + number)
+
+    threads = [threading.Thread(target=append, args=(number,)) for number in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(history) == 1600
+    assert all(
+        request.body == request.headers["NUMBER"].encode() and status == 200 + int(request.headers["NUMBER"])
+        for request, status in zip(history, history.statuses)
+    )
+
+
+def test_history_index_out_of_range():
+    with pytest.raises(IndexError):
+        RequestHistory()[0]
+
+
+def test_statistic_records_served_status(server: FakeServer):
+    server.on_("get", "/status").response(status=201).once()
+
+    requests.get(server.base_uri + "/status")
+    requests.get(server.base_uri + "/status")
+
+    assert list(server.was_requested("get", "/status").requests.statuses) == [201, 500]
@@ -0,0 +1,119 @@
+import sqlite3
+
+import pytest
+import requests
+
+from py_fake_server import FakeServer
+from py_fake_server.request import Request
+from py_fake_server.sqlite_backend import SQLiteBackend
+
+
+@pytest.fixture(scope="module")
+def sqlite_server(servers, tmp_path_factory) -> FakeServer:
+    backend = SQLiteBackend(str(tmp_path_factory.mktemp("statistics") / "statistics.sqlite"),
+                            indexed_headers=["X-Request-Id"], batch_size=2)
+    yield servers.start(statistics_backend=backend)
+    backend.close()
+
+
+def test_sqlite_backend_records_requests(sqlite_server: FakeServer):
+    sqlite_server.on_("post", "/orders").response(status=201)
+
+    requests.post(sqlite_server.base_uri + "/orders?page=1", json={"type": "market"},
+                  headers={"X-Request-Id": "first"}, cookies={"token": "secret"})
+    requests.post(sqlite_server.base_uri + "/orders", data="Hello!", headers={"Content-Type": "text/plain"})
+    requests.post(sqlite_server.base_uri + "/orders", files={"file": b"content"})
+
+    assert sqlite_server.was_requested("post", "/orders"). \
+        exactly_3_times(). \
+        for_the_first_time(). \
+        with_json({"type": "market"}). \
+        with_headers({"X-Request-Id": "first"}). \
+        with_query_params({"page": "1"}). \
+        with_cookies({"token": "secret"}). \
+        for_the_second_time(). \
+        with_body("Hello!"). \
+        with_content_type("text/plain"). \
+        for_the_3_time(). \
+        with_files({"file": b"content"}). \
+        with_rate_at_most(100).check()
+
+
+def test_sqlite_backend_keeps_statuses_and_sequences(sqlite_server: FakeServer):
+    sqlite_server.on_("get", "/items").response(status=200).once()
+
+    requests.get(sqlite_server.base_uri + "/items")
+    requests.get(sqlite_server.base_uri + "/other")
+    requests.get(sqlite_server.base_uri + "/items")
+
+    history = sqlite_server.was_requested("get", "/items").requests
+    assert list(history.statuses) == [200, 500]
+    assert list(history.sequences) == [1, 3]
+    assert list(history.rejected) == [0, 0]
+    assert [request.number for request in history] == [1, 2]
+    assert sqlite_server.requested_in_order(("get", "/items"), ("get", "/other"), ("get", "/items"))
+
+
+def test_sqlite_backend_indexes_headers(sqlite_server: FakeServer):
+    for request_id in ["first", "second", "first"]:
+        requests.get(sqlite_server.base_uri + "/items", headers={"X-Request-Id": request_id})
+
+    history = sqlite_server.was_requested("get", "/items").requests
+    assert history.numbers_with_header("x-request-id", "first") == [1, 3]
+
+
+def test_sqlite_backend_is_cleared(sqlite_server: FakeServer):
+    requests.get(sqlite_server.base_uri + "/items")
+
+    sqlite_server.clear()
+
+    assert sqlite_server.was_not_requested("get", "/items").check()
+
+
+def test_sqlite_backend_does_not_support_snapshots(sqlite_server: FakeServer):
+    with pytest.raises(AttributeError) as error:
+        sqlite_server.snapshot()
+
+    assert str(error.value) == "SQLiteBackend does not support snapshots"
+
+
+def test_sqlite_backend_survives_failed_batches(tmp_path):
+    backend = SQLiteBackend(str(tmp_path / "statistics.sqlite"))
+    history = backend.history("get", "/items")
+    row = (1, 0, 1, 1, 0.0, 200, False, None, b"", "{}", "{}", "{}", None)
+
+    backend.put(row)
+    backend.flush()
+    backend.put(row)
+    backend.flush()
+    backend.put(row[:2] + (2,) + row[3:])
+
+    assert [type(error) for error in backend.write_errors] == [sqlite3.IntegrityError]
+    assert list(history.statuses) == [200, 200]
+    backend.close()
+
+
+def test_sqlite_backend_numbers_requests_appended_after_clear(tmp_path):
+    backend = SQLiteBackend(str(tmp_path / "statistics.sqlite"))
+    stale_history = backend.history("get", "/items")
+    backend.clear()
+    history = backend.history("get", "/items")
+
+    request = Request.from_record(number=1, load_body=lambda: b"", content_type=None,
+                                  cookies={}, headers={}, query_params={}, files=None)
+    history.append(request, sequence=1)
+    stale_history.append(request, sequence=2)
+
+    assert list(history.sequences) == [1]
+    assert backend.write_errors == []
+    backend.close()
+
+
+def test_sqlite_history_can_not_be_forked(tmp_path):
+    backend = SQLiteBackend(str(tmp_path / "statistics.sqlite"))
+
+    with pytest.raises(AttributeError) as error:
+        backend.history("get", "/items").fork(0)
+
+    assert str(error.value) == "SQLiteRequestHistory can not be restored from a snapshot"
+    backend.close()
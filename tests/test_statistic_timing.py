@@ -0,0 +1,75 @@
+from typing import List
+
+import pytest
+import requests
+
+from py_fake_server import FakeServer, expect_that
+from py_fake_server.request import Request
+from py_fake_server.statistic import Statistic
+
+
+def make_statistic(timestamps: List[float]) -> Statistic:
+    statistic = Statistic("get", "http://localhost:8081/auth")
+    for timestamp in timestamps:
+        request = Request.from_record(number=0, load_body=lambda: b"", content_type=None, cookies={},
+                                      headers={}, query_params={}, files=None)
+        statistic.record_request(request, status=200, timestamp=timestamp)
+    return statistic
+
+
+def test_rate_at_most():
+    statistic = make_statistic([0.0, 0.1, 0.2, 1.5, 1.6])
+
+    assert statistic.with_rate_at_most(3).check()
+    assert statistic.with_rate_at_most(4, window=2).check()
+
+
+def test_rate_at_most_raise_assertion():
+    statistic = make_statistic([0.0, 1.0, 1.1, 1.2, 1.3])
+
+    with pytest.raises(AssertionError) as error:
+        statistic.with_rate_at_most(3).check()
+
+    assert str(error.value) == "Expect that server was requested with [GET] http://localhost:8081/auth.\n" \
+                               "With rate at most 3 requests per second.\n" \
+                               "But there were 4 requests in 1.0 seconds."
+
+
+def test_interval_at_least():
+    statistic = make_statistic([0.0, 0.5, 0.3])
+
+    assert statistic.with_interval_at_least(0.2).check()
+    with pytest.raises(AssertionError) as error:
+        statistic.with_interval_at_least(0.25).check()
+
+    assert str(error.value) == "Expect that server was requested with [GET] http://localhost:8081/auth.\n" \
+                               "With interval between requests at least 0.25 seconds.\n" \
+                               "But the shortest interval was 0.200000 seconds."
+
+
+def test_completed_within():
+    statistic = make_statistic([10.0, 11.0, 12.5])
+
+    assert statistic.completed_within(2.5).check()
+    with pytest.raises(AssertionError) as error:
+        statistic.completed_within(2).check()
+
+    assert str(error.value) == "Expect that server was requested with [GET] http://localhost:8081/auth.\n" \
+                               "With all requests within 2 seconds.\n" \
+                               "But requests took 2.500000 seconds."
+
+
+def test_timing_of_single_request():
+    statistic = make_statistic([1.0])
+
+    assert statistic.with_rate_at_most(1).with_interval_at_least(10).completed_within(0).check()
+
+
+def test_timing_of_real_requests(server: FakeServer):
+    for _ in range(3):
+        requests.get(server.base_uri + "/auth")
+
+    expect_that(server.was_requested("get", "/auth").
+                exactly_3_times().
+                with_rate_at_most(1000).
+                completed_within(5))